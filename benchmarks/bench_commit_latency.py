@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 커밋 지연 시간 벤치마크
+# 파일 위치: benchmarks/bench_commit_latency.py
+# 실행: python benchmarks/bench_commit_latency.py [반복 횟수]
+
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DB_PRAGMA_PROFILES
+from database.connection_pool import ConnectionPool
+
+
+def measure_commit_latency(profile, iterations):
+    """
+    프로파일별 INSERT 1건 + 커밋 지연 시간 측정
+
+    Args:
+        profile (str): config.DB_PRAGMA_PROFILES 키
+        iterations (int): 반복 횟수
+
+    Returns:
+        tuple: (평균 ms, 최대 ms)
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = sqlite3.connect(os.path.join(tmp_dir, 'bench.db'))
+        ConnectionPool.apply_pragmas(conn, DB_PRAGMA_PROFILES[profile])
+        conn.execute("CREATE TABLE words (word_id INTEGER PRIMARY KEY, english TEXT, korean TEXT)")
+        conn.commit()
+
+        latencies = []
+        for i in range(iterations):
+            started = time.perf_counter()
+            conn.execute("INSERT INTO words (english, korean) VALUES (?, ?)", (f'word{i}', '단어'))
+            conn.commit()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        conn.close()
+
+    return sum(latencies) / len(latencies), max(latencies)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print(f"커밋 지연 시간 ({iterations}회)")
+    for profile in DB_PRAGMA_PROFILES:
+        average, worst = measure_commit_latency(profile, iterations)
+        print(f"  {profile:<12} 평균 {average:.3f} ms, 최대 {worst:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
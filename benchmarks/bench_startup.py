@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 시작 시간 벤치마크 (실행 ~ 첫 화면)
+# 파일 위치: benchmarks/bench_startup.py
+# 실행: python benchmarks/bench_startup.py [반복 횟수]
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once():
+    """
+    main.py --measure-startup 1회 실행 (첫 화면을 그리면 종료, 예산 초과 시 종료 코드 1)
+
+    Returns:
+        tuple: (프로세스 전체 시간 ms, 예산 이내 여부, 시작 시간 로그 줄)
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    started = time.perf_counter()
+    process = subprocess.run([sys.executable, 'main.py', '--measure-startup'], cwd=ROOT_DIR,
+                             env=env, capture_output=True, text=True, encoding='utf-8')
+    elapsed = (time.perf_counter() - started) * 1000
+    log_line = next((line for line in process.stdout.splitlines() if '시작 시간' in line), '')
+    return elapsed, process.returncode == 0, log_line.split(' - ')[-1]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = [run_once() for _ in range(repeat)]
+
+    for index, (elapsed, within_budget, log_line) in enumerate(results, 1):
+        print(f"#{index}: 프로세스 {elapsed:7.0f}ms  {'OK  ' if within_budget else 'OVER'}  {log_line}")
+    print(f"중앙값: {statistics.median(elapsed for elapsed, _, _ in results):.0f}ms, "
+          f"예산 초과 {sum(1 for _, ok, _ in results if not ok)}/{repeat}회")
+    sys.exit(0 if all(ok for _, ok, _ in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 단어 레코드 메모리 벤치마크 (dict vs Word)
+# 파일 위치: benchmarks/bench_word_records.py
+# 실행: python benchmarks/bench_word_records.py [단어 수]
+
+import os
+import sys
+import sqlite3
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.word_record import Word
+
+
+def create_database(count):
+    """메모리 DB에 words 테이블과 테스트 데이터 생성"""
+    conn = sqlite3.connect(':memory:')
+    with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'database', 'schema.sql'), 'r', encoding='utf-8') as f:
+        conn.executescript(f.read())
+    conn.executemany(
+        "INSERT INTO words (english, korean, memo) VALUES (?, ?, ?)",
+        [(f'word{i}', f'단어 뜻 {i}', None if i % 3 else f'메모 {i}') for i in range(count)]
+    )
+    conn.commit()
+    return conn
+
+
+def load_as_dicts(conn):
+    """기존 방식: sqlite3.Row -> dict"""
+    conn.row_factory = sqlite3.Row
+    return [dict(row) for row in conn.execute("SELECT * FROM words")]
+
+
+def load_as_records(conn):
+    """Word 레코드 방식"""
+    conn.row_factory = None
+    cursor = conn.execute("SELECT * FROM words")
+    columns = tuple(column[0] for column in cursor.description)
+    return Word.from_rows(columns, cursor.fetchall())
+
+
+def measure(loader, conn):
+    """
+    로더 실행 시간과 결과가 차지하는 메모리 측정
+    (tracemalloc이 속도를 떨어뜨리므로 시간은 따로 측정)
+
+    Returns:
+        tuple: (초, 결과 메모리 MB)
+    """
+    started = time.perf_counter()
+    rows = loader(conn)
+    elapsed = time.perf_counter() - started
+    del rows
+
+    tracemalloc.start()
+    rows = loader(conn)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return elapsed, current / (1024 * 1024)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    conn = create_database(count)
+
+    print(f"단어 {count}개 로드")
+    for name, loader in (('dict', load_as_dicts), ('Word', load_as_records)):
+        elapsed, memory = measure(loader, conn)
+        print(f"  {name:<6} {elapsed:.3f} 초, {memory:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,23 @@ DB_DIR = os.path.join(BASE_DIR, 'resources')
 DB_NAME = 'vocabulary.db'
 DB_PATH = os.path.join(DB_DIR, DB_NAME)
 
+# DB 연결 성능 프로파일 (connect() 시 PRAGMA로 적용)
+DB_PRAGMA_PROFILES = {
+    # SQLite 기본값 (rollback journal, synchronous=FULL)
+    'default': {},
+    # WAL + synchronous=NORMAL: 커밋마다 fsync하지 않고 읽기가 쓰기에 막히지 않음
+    'performance': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000,        # 음수는 KiB 단위 (약 64MB)
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,        # ms
+    },
+}
+DB_PRAGMA_PROFILE = 'performance'
+DB_CACHED_STATEMENTS = 256  # 연결별 prepared statement 캐시 크기 (sqlite3 기본값 128)
+
 # 애플리케이션 정보
 APP_NAME = 'Smart Vocab Builder'
 APP_VERSION = '1.0.0'
@@ -35,4 +52,32 @@ LOG_BACKUP_COUNT = 5
 
 # 학습 기본 설정
 DEFAULT_DAILY_WORD_GOAL = 50
-DEFAULT_FLASHCARD_COUNT = 20
\ No newline at end of file
+DEFAULT_FLASHCARD_COUNT = 20
+
+# 학습 결과 기록 버퍼 (write-behind)
+STATS_FLUSH_INTERVAL_SECONDS = 5  # 첫 미반영 기록 후 자동 반영까지 대기 시간
+STATS_FLUSH_THRESHOLD = 100  # 누적 기록 수가 이 값에 도달하면 즉시 반영
+
+# 단어 목록 설정
+WORD_PAGE_SIZE = 200  # 단어 목록 1페이지(키셋 페이지네이션) 크기
+
+# 단어 조회 캐시 (메모리 예산: 캐시할 최대 행 수)
+WORD_CACHE_MAX_WORDS = 5000  # word_id 단위 LRU
+WORD_CACHE_MAX_LIST_ROWS = 200000  # 전체 목록 캐시(활성 단어, 즐겨찾기) 행 수 합계
+
+# 검색 설정 (입력 중 검색)
+SEARCH_DEBOUNCE_MS = 200  # 마지막 입력 후 검색 시작까지 대기 시간
+SEARCH_RESULT_LIMIT = 2000  # 검색 결과 최대 수 (이보다 적으면 다음 입력 시 결과를 재사용)
+SEARCH_BATCH_SIZE = 100  # 화면에 한 번에 추가할 결과 수
+
+# 임포트 설정
+IMPORT_CHUNK_SIZE = 500  # 일괄 삽입 시 트랜잭션 1회당 행 수
+
+# SQL 설정
+SQL_IN_CHUNK_SIZE = 500  # IN (...) 절 하나에 넣을 최대 파라미터 수
+
+# 시작 시간 예산 (실행부터 메인 윈도우 첫 그리기까지, python main.py --measure-startup)
+STARTUP_BUDGET_MS = 1500
+
+# 백그라운드 작업 설정
+TASK_MAX_THREADS = 4  # 작업 스레드 수 (스레드마다 DB 연결 1개, 쓰기는 직렬화됨)
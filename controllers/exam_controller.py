@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 시험 Controller
+# 파일 위치: controllers/exam_controller.py
+
+import logging
+import random
+from models.exam_model import ExamModel
+from models.word_model import WordModel
+
+logger = logging.getLogger(__name__)
+
+EXAM_TYPES = ('short_answer', 'multiple_choice', 'mixed')
+QUESTION_MODES = ('en_to_ko', 'ko_to_en', 'mixed')
+ORDER_TYPES = ('random', 'personalized')
+
+
+class ExamController:
+    """
+    시험 비즈니스 로직
+
+    문제 단어 선택 -> 선택지 생성 -> 저장을 메모리에서 한 번에 처리하고,
+    답안은 시험이 끝날 때까지 메모리에 모았다가 finish_exam에서 한 번에 채점/저장한다.
+    """
+
+    def __init__(self):
+        self.word_model = WordModel()
+        self.exam_model = ExamModel()
+        self._answers = {}  # exam_id -> {question_id: 사용자 답안}
+        self._rng = random.Random()
+
+    def _select_words(self, num_questions, order):
+        """출제 단어 선택 (개인화: 오답률 가중 추출)"""
+        if order == 'personalized':
+            return self.word_model.get_weighted_words(num_questions)
+        words = self.word_model.get_all_active_words()
+        return self._rng.sample(words, min(num_questions, len(words)))
+
+    def create_exam(self, exam_type, question_mode, num_questions, order='random',
+                    time_limit_minutes=None):
+        """
+        시험 생성
+
+        Args:
+            exam_type (str): 'short_answer' | 'multiple_choice' | 'mixed'
+            question_mode (str): 'en_to_ko' | 'ko_to_en' | 'mixed'
+            num_questions (int): 문제 수
+            order (str): 'random' | 'personalized'
+            time_limit_minutes (int, optional): 제한 시간
+
+        Returns:
+            dict: {'exam_id', 'questions': [{'question_id', 'question_number', 'word_id',
+                   'question_type', 'question_mode', 'question_text', 'correct_answer', 'choices'}]}
+        """
+        if exam_type not in EXAM_TYPES:
+            raise ValueError(f"지원하지 않는 시험 유형: {exam_type}")
+        if question_mode not in QUESTION_MODES:
+            raise ValueError(f"지원하지 않는 출제 방향: {question_mode}")
+        if order not in ORDER_TYPES:
+            raise ValueError(f"지원하지 않는 출제 순서: {order}")
+
+        words = self._select_words(num_questions, order)
+        if not words:
+            raise ValueError("출제할 단어가 없습니다")
+
+        # 1. 문제별 유형/방향 결정
+        questions = []
+        for word in words:
+            mode = question_mode if question_mode != 'mixed' else self._rng.choice(QUESTION_MODES[:2])
+            question_type = exam_type if exam_type != 'mixed' else self._rng.choice(EXAM_TYPES[:2])
+            questions.append({
+                'word_id': word['word_id'],
+                'question_type': question_type,
+                'question_mode': mode,
+                'question_text': word['english'] if mode == 'en_to_ko' else word['korean'],
+                'correct_answer': word['korean'] if mode == 'en_to_ko' else word['english'],
+                'choices': None,
+                '_word': word,
+            })
+
+        # 2. 객관식 선택지를 출제 방향별로 한 번에 생성
+        for mode in QUESTION_MODES[:2]:
+            targets = [question for question in questions
+                       if question['question_type'] == 'multiple_choice'
+                       and question['question_mode'] == mode]
+            if targets:
+                choices = self.word_model.generate_choices([q['_word'] for q in targets], mode)
+                for question, question_choices in zip(targets, choices):
+                    question['choices'] = question_choices
+
+        # 3. 시험 + 전체 문제 저장 (한 트랜잭션)
+        exam_id, question_ids = self.exam_model.create_exam(
+            exam_type, question_mode, order, questions, time_limit_minutes)
+        for number, (question, question_id) in enumerate(zip(questions, question_ids), 1):
+            del question['_word']
+            question['question_id'] = question_id
+            question['question_number'] = number
+
+        self._answers[exam_id] = {}
+        return {'exam_id': exam_id, 'questions': questions}
+
+    def submit_exam_answer(self, exam_id, question_id, user_answer):
+        """시험 답안 제출 (finish_exam 때 한 번에 저장)"""
+        self._answers.setdefault(exam_id, {})[question_id] = user_answer
+
+    def finish_exam(self, exam_id, time_taken_seconds=None):
+        """
+        시험 종료 및 채점 (점수, 오답 노트, 단어 통계를 한 트랜잭션으로 반영)
+
+        Returns:
+            dict: 채점 결과 (ExamModel.finish_exam 참고, 이미 종료된 시험이면 저장된 결과)
+        """
+        result = self.exam_model.finish_exam(exam_id, self._answers.get(exam_id, {}),
+                                             time_taken_seconds)
+        self._answers.pop(exam_id, None)
+        return result
+
+    def get_exam_result(self, exam_id):
+        """시험 결과 조회"""
+        return self.exam_model.get_exam_detail(exam_id)
+
+    def get_exam_history(self, limit=10):
+        """최근 시험 이력"""
+        return self.exam_model.get_exam_history(limit)
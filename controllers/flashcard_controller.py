@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 플래시카드 학습 Controller
+# 파일 위치: controllers/flashcard_controller.py
+
+import logging
+import time
+from config import DEFAULT_FLASHCARD_COUNT
+from models.learning_buffer import LearningResultBuffer
+from models.learning_session_model import LearningSessionModel
+from models.schedule_model import ScheduleModel
+
+logger = logging.getLogger(__name__)
+
+
+class FlashcardController:
+    """
+    플래시카드 학습 비즈니스 로직
+
+    start_session()으로 학습 세션(learning_sessions)을 열고, 카드마다의 정답/오답은
+    LearningResultBuffer에 기록만 하고 즉시 반환한다(DB 접근 없음). 학습 이력,
+    단어 통계/복습 스케줄/일별 통계는 버퍼가 모아서 한 번에 반영한다.
+    세션을 마치면 남은 기록을 바로 반영하고 세션 결과를 저장한다.
+    """
+
+    def __init__(self):
+        self.schedule = ScheduleModel()
+        self.sessions = LearningSessionModel()
+        self.buffer = LearningResultBuffer.get_instance()
+        self.session_id = None
+        self._started = None
+        self._counts = [0, 0]  # 정답 수, 오답 수
+        self._word_ids = set()
+
+    def start_session(self, study_mode='en_to_ko', order_type='personalized'):
+        """
+        학습 세션 시작 (진행 중인 세션이 있으면 먼저 종료)
+
+        Args:
+            study_mode (str): 'en_to_ko' | 'ko_to_en'
+            order_type (str): 'sequential' | 'random' | 'personalized' (복습 예정 우선 큐)
+
+        Returns:
+            int: session_id
+        """
+        if self.session_id is not None:
+            self.end_session()
+        self.session_id = self.sessions.start_session('flashcard', study_mode, order_type)
+        self._started = time.monotonic()
+        self._counts = [0, 0]
+        self._word_ids = set()
+        return self.session_id
+
+    def get_cards(self, count=DEFAULT_FLASHCARD_COUNT):
+        """
+        학습할 카드 (복습 예정 단어 우선, 부족하면 신규 단어)
+
+        Args:
+            count (int): 카드 수
+
+        Returns:
+            list: Word 리스트
+        """
+        return self.schedule.get_study_queue(count)
+
+    def answer(self, word_id, is_correct):
+        """
+        카드 1장 결과 기록 (화면 스레드에서 호출, DB 오류를 던지지 않음)
+
+        Args:
+            word_id (int): 단어 ID
+            is_correct (bool): 정답 여부
+
+        Raises:
+            ValueError: 진행 중인 세션이 없는 경우
+        """
+        if self.session_id is None:
+            raise ValueError("진행 중인 학습 세션 없음 (start_session 먼저 호출)")
+        self.buffer.record(word_id, is_correct, self.session_id)
+        self._counts[0 if is_correct else 1] += 1
+        self._word_ids.add(word_id)
+
+    def end_session(self):
+        """
+        세션 종료: 남은 기록 반영 후 세션 결과 저장
+
+        Returns:
+            int: 반영된 기록 수
+        """
+        try:
+            flushed = self.buffer.flush()
+        except Exception as e:
+            logger.error(f"플래시카드 세션 종료 반영 실패 (버퍼에 남아 재시도): {e}")
+            flushed = 0
+
+        if self.session_id is not None:
+            session_id, self.session_id = self.session_id, None
+            try:
+                self.sessions.finish_session(session_id, len(self._word_ids), *self._counts,
+                                             int(time.monotonic() - self._started))
+            except Exception as e:
+                logger.error(f"학습 세션 결과 저장 실패 (session_id={session_id}): {e}")
+        return flushed
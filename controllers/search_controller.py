@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 입력 중 검색 Controller (이전 결과 재사용)
+# 파일 위치: controllers/search_controller.py
+
+import logging
+import re
+import threading
+from config import SEARCH_RESULT_LIMIT
+from models.word_model import WordModel
+from utils.hangul import is_chosung_only
+
+logger = logging.getLogger(__name__)
+
+_MEANING_SEPARATOR = re.compile(r'[,;/·]')
+
+
+def search_rank(word, keyword):
+    """
+    검색 결과 정렬 키 (작을수록 위)
+
+    1) 영어 또는 뜻 하나와 완전히 일치  2) 접두어 일치  3) 부분 문자열 일치  4) 초성/자모 일치
+    같은 등급은 짧은 단어, 알파벳 순.
+
+    Args:
+        word: 단어 레코드
+        keyword (str): 검색 키워드
+
+    Returns:
+        tuple: 정렬 키
+    """
+    needle = keyword.strip().lower()
+    english = word['english'].lower()
+    korean = word['korean'].lower()
+    meanings = [meaning.strip() for meaning in _MEANING_SEPARATOR.split(korean)]
+
+    if english == needle or needle in meanings:
+        tier = 0
+    elif english.startswith(needle) or any(meaning.startswith(needle) for meaning in meanings):
+        tier = 1
+    elif needle in english or needle in korean:
+        tier = 2
+    else:
+        tier = 3
+    return tier, len(english), english
+
+
+class SearchController:
+    """
+    입력 중 검색 (작업 스레드에서 호출)
+
+    직전 검색 결과가 잘리지 않았고(SEARCH_RESULT_LIMIT 미만) 새 키워드가 직전 키워드를
+    이어 쓴 것이면 결과가 직전 결과의 부분집합이므로 SQLite를 다시 조회하지 않고
+    WordModel.matches_keyword로 메모리에서 거른다.
+    단어가 추가/수정/삭제되면(WordModel.cache.generation 변경) 재사용하지 않는다.
+    """
+
+    def __init__(self, limit=SEARCH_RESULT_LIMIT):
+        self.model = WordModel()
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._last = None  # (keyword, search_type, generation, results)
+
+    def search(self, keyword, search_type='all'):
+        """
+        관련도 순 검색 결과
+
+        Args:
+            keyword (str): 검색 키워드
+            search_type (str): 'english', 'korean', 'all'
+
+        Returns:
+            list: 단어 레코드 리스트 (최대 limit개, search_rank 순)
+        """
+        keyword = (keyword or '').strip()
+        if not keyword:
+            return []
+
+        try:
+            generation = WordModel.cache.generation
+            previous = self._reusable_results(keyword, search_type, generation)
+            if previous is not None:
+                results = [word for word in previous
+                           if WordModel.matches_keyword(word, keyword, search_type)]
+                complete = True
+            else:
+                results = self.model.search_words(keyword, search_type, limit=self.limit + 1,
+                                                  ranked=True)
+                complete = len(results) <= self.limit
+                if not complete:
+                    results = self._with_prefix_matches(keyword, search_type, results)
+
+            results.sort(key=lambda word: search_rank(word, keyword))
+            with self._lock:
+                self._last = (keyword, search_type, generation, results) if complete else None
+            return results[:self.limit]
+        except Exception as e:
+            logger.error(f"입력 중 검색 실패 (키워드={keyword}): {e}")
+            raise
+
+    def _with_prefix_matches(self, keyword, search_type, results):
+        """
+        잘린 결과 보완: 완전/접두어 일치 단어를 먼저 넣고 나머지를 부분 문자열 결과로 채움
+
+        부분 문자열 결과는 limit에서 잘리므로 관련도가 높은 단어가 빠질 수 있다.
+        접두어 결과는 인덱스 범위 검색이라 잘린 경우에만 한 번 더 조회한다.
+        """
+        head = self.model.search_words_prefix(keyword, search_type, limit=self.limit)
+        found = {word['word_id'] for word in head}
+        return head + [word for word in results if word['word_id'] not in found]
+
+    def _reusable_results(self, keyword, search_type, generation):
+        """직전 결과를 거르는 것으로 충분하면 그 결과, 아니면 None"""
+        with self._lock:
+            last = self._last
+        if last is None:
+            return None
+        last_keyword, last_type, last_generation, results = last
+        if (last_type != search_type or last_generation != generation
+                or not keyword.startswith(last_keyword)
+                or is_chosung_only(keyword) != is_chosung_only(last_keyword)):
+            return None
+        return results
+
+    def reset(self):
+        """재사용할 직전 결과 버리기"""
+        with self._lock:
+            self._last = None
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 통계 Controller (NumPy 벡터 연산)
+# 파일 위치: controllers/statistics_controller.py
+
+import logging
+from datetime import date, timedelta
+from models.statistics_model import StatisticsModel
+from models.word_model import WordModel
+from utils.datetime_helper import get_date_range
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TREND_DAYS = 30  # 대시보드 추이 그래프 기간
+DEFAULT_MOVING_WINDOW = 7  # 이동 평균 기간 (일)
+DEFAULT_TOP_N = 10  # 오답률 상위 단어 수
+
+
+# ---------- 벡터 연산 (입력/출력 모두 NumPy 배열) ----------
+
+def ratio(numerator, denominator):
+    """원소별 비율 (분모가 0이면 0)"""
+    import numpy as np
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator),
+                     where=denominator > 0)
+
+
+def moving_average(values, window):
+    """
+    누적합으로 계산한 이동 평균 (앞쪽은 있는 만큼만 평균)
+
+    Args:
+        values (numpy.ndarray): 일별 값
+        window (int): 기간
+
+    Returns:
+        numpy.ndarray: 같은 길이의 이동 평균
+    """
+    import numpy as np
+    values = np.asarray(values, dtype=np.float64)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    index = np.arange(1, len(values) + 1)
+    start = np.maximum(index - window, 0)
+    return (cumulative[index] - cumulative[start]) / (index - start)
+
+
+def streaks(active):
+    """
+    연속 구간 길이 (누적 최대값으로 마지막 비활성 위치를 전파)
+
+    Args:
+        active (numpy.ndarray): 날짜별 학습 여부 (bool)
+
+    Returns:
+        tuple: (마지막 날 기준 현재 연속 일수, 최장 연속 일수)
+    """
+    import numpy as np
+    active = np.asarray(active, dtype=bool)
+    if not len(active):
+        return 0, 0
+    index = np.arange(len(active))
+    last_inactive = np.maximum.accumulate(np.where(active, -1, index))
+    run = index - last_inactive
+    return int(run[-1]), int(run.max())
+
+
+# ---------- Controller ----------
+
+class StatisticsController:
+    """
+    통계 대시보드 계산
+
+    이력 테이블 집계는 증분 집계 테이블(daily_stats, retention_stats)이 맡고, Python으로는
+    날짜/단어/간격 단위 배열만 가져와 NumPy 벡터 연산으로 지표를 만든다.
+    결과 배열은 그대로 matplotlib 차트(views.statistics.charts)에 전달한다.
+    """
+
+    def __init__(self):
+        self.model = StatisticsModel()
+        self.word_model = WordModel()
+
+    def get_daily_trend(self, days=DEFAULT_TREND_DAYS, window=DEFAULT_MOVING_WINDOW, today=None):
+        """
+        최근 days일 일별 학습량/정답률 추이
+
+        Returns:
+            dict: {'dates': 날짜 문자열 리스트, 'answers', 'accuracy', 'moving_average',
+                   'exam_count' (배열), 'current_streak', 'longest_streak'}
+        """
+        import numpy as np
+        today = today or date.today()
+        dates = get_date_range((today - timedelta(days=days - 1)).isoformat(), today.isoformat())
+        stats = self.model.get_daily_arrays(dates[0], dates[-1])
+
+        # 기록 있는 날만 온 행을 날짜 축에 맞춰 배치
+        position = np.searchsorted(np.asarray(dates), stats['stat_date'])
+        correct = np.zeros(len(dates))
+        wrong = np.zeros(len(dates))
+        exams = np.zeros(len(dates))
+        correct[position] = stats['correct_count']
+        wrong[position] = stats['wrong_count']
+        exams[position] = stats['exam_count']
+
+        answers = correct + wrong
+        current_streak, longest_streak = streaks((answers + exams) > 0)
+        return {
+            'dates': dates,
+            'answers': answers,
+            'accuracy': ratio(correct, answers),
+            'moving_average': moving_average(answers, window),
+            'exam_count': exams,
+            'current_streak': current_streak,
+            'longest_streak': longest_streak,
+        }
+
+    def get_top_error_words(self, n=DEFAULT_TOP_N):
+        """
+        오답률 상위 n개 단어 (words.error_rate 인덱스 범위 조회)
+
+        Args:
+            n (int): 개수
+
+        Returns:
+            dict: {'word_id', 'english', 'error_rate', 'attempts'} 배열 (오답률 내림차순)
+        """
+        import numpy as np
+        words = self.word_model.get_top_error_words(n)
+        return {
+            'word_id': np.array([word.word_id for word in words], dtype=np.int64),
+            'english': np.array([word.english for word in words], dtype=str),
+            'error_rate': np.array([word.error_rate for word in words], dtype=np.float64),
+            'attempts': np.array([word.correct_count + word.wrong_count for word in words],
+                                 dtype=np.int64),
+        }
+
+    def get_accuracy_distribution(self, bins=10):
+        """
+        단어별 정답률 분포 (한 번 이상 학습한 단어)
+
+        Returns:
+            tuple: (구간별 단어 수 배열, 구간 경계 배열)
+        """
+        import numpy as np
+        words = self.model.get_word_stat_arrays()
+        attempts = words['correct_count'] + words['wrong_count']
+        accuracy = ratio(words['correct_count'], attempts)[attempts > 0]
+        return np.histogram(accuracy, bins=bins, range=(0.0, 1.0))
+
+    def get_retention_curve(self):
+        """
+        복습 간격별 정답률 (망각 곡선)
+
+        Returns:
+            dict: {'gap_days', 'retention', 'samples'} 배열
+        """
+        buckets = self.model.get_retention_arrays()
+        return {
+            'gap_days': buckets['gap_days'],
+            'retention': ratio(buckets['correct_count'], buckets['total_count']),
+            'samples': buckets['total_count'],
+        }
+
+    def get_dashboard(self, days=DEFAULT_TREND_DAYS, top_n=DEFAULT_TOP_N):
+        """통계 탭 전체 지표"""
+        try:
+            return {
+                'trend': self.get_daily_trend(days),
+                'top_error_words': self.get_top_error_words(top_n),
+                'retention': self.get_retention_curve(),
+            }
+        except Exception as e:
+            logger.error(f"통계 대시보드 계산 실패: {e}")
+            raise
@@ -2,6 +2,7 @@
 # 파일 위치: controllers/word_controller.py
 
 import logging
+from config import IMPORT_CHUNK_SIZE, WORD_PAGE_SIZE
 from models.word_model import WordModel
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,13 @@ class WordController:
     def get_all_words(self):
         """전체 단어 목록"""
         return self.model.get_all_active_words()
+
+    def get_word_page(self, after=None, limit=WORD_PAGE_SIZE, sort_column='english',
+                      descending=False, keyword=None, favorites_only=False):
+        """단어 목록 한 페이지 (after: 직전 페이지 마지막 단어의 WordModel.page_cursor)"""
+        return self.model.get_word_page(sort_column=sort_column, descending=descending,
+                                        keyword=keyword, favorites_only=favorites_only,
+                                        after=after, limit=limit)
     
     def search_words(self, keyword, search_type='all'):
         """단어 검색"""
@@ -27,6 +35,19 @@ class WordController:
             raise ValueError("영어와 한국어는 필수입니다")
         return self.model.add_word(english, korean, memo)
     
+    def import_words(self, words, chunk_size=IMPORT_CHUNK_SIZE, progress_callback=None):
+        """단어 일괄 추가 (progress_callback: WordModel.bulk_add_words 참고)"""
+        return self.model.bulk_add_words(words, chunk_size=chunk_size,
+                                         progress_callback=progress_callback)
+
+    def import_words_from_csv(self, file_path, progress_callback=None):
+        """CSV 파일에서 단어 일괄 임포트"""
+        from utils.csv_handler import CSVHandler  # 임포트할 때만 필요 (시작 시 로드 생략)
+        success, result = CSVHandler.parse_csv(file_path)
+        if not success:
+            raise ValueError(result)
+        return self.import_words(result, progress_callback=progress_callback)
+    
     def update_word(self, word_id, **kwargs):
         """단어 수정"""
         return self.model.update_word(word_id, **kwargs)
@@ -35,6 +56,11 @@ class WordController:
         """단어 삭제"""
         return self.model.delete(word_id, soft=True)
     
+    def delete_words(self, word_ids):
+        """단어 여러 개 삭제 (한 번에 커밋)"""
+        with self.model.db.transaction():
+            return sum(self.model.delete(word_id, soft=True) for word_id in word_ids)
+    
     def toggle_favorite(self, word_id):
         """즐겨찾기 토글"""
         return self.model.toggle_favorite(word_id)
\ No newline at end of file
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 스레드별 SQLite 연결 풀
+# 파일 위치: database/connection_pool.py
+
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    스레드마다 전용 SQLite 연결을 제공하는 연결 풀
+
+    - 읽기: 각 스레드가 자기 연결로 동시에 조회 (WAL 모드에서 쓰기와 병행 가능)
+    - 쓰기: 프로세스 내 쓰기 잠금(RLock)으로 한 번에 하나의 스레드만 수행
+    """
+
+    def __init__(self, db_path, pragmas=None, cached_statements=128):
+        self.db_path = db_path
+        self.pragmas = pragmas or {}
+        self.cached_statements = cached_statements  # 연결별 prepared statement 캐시 크기
+        self._local = threading.local()
+        self._connections = {}  # thread ident -> connection
+        self._registry_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+
+    def _create_connection(self):
+        """새 연결 생성 및 PRAGMA 적용"""
+        # 종료 시 다른 스레드에서 close()할 수 있도록 check_same_thread 해제
+        # (연결 자체는 생성한 스레드에서만 사용)
+        connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     cached_statements=self.cached_statements)
+        connection.row_factory = sqlite3.Row  # 딕셔너리처럼 접근 가능
+        self.apply_pragmas(connection, self.pragmas)
+        return connection
+
+    @staticmethod
+    def apply_pragmas(connection, pragmas):
+        """
+        연결에 PRAGMA 설정 적용
+
+        Args:
+            connection (sqlite3.Connection): 대상 연결
+            pragmas (dict): PRAGMA 이름과 값 (config.DB_PRAGMA_PROFILES 참고)
+        """
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+
+    def get_connection(self):
+        """
+        현재 스레드 전용 연결 반환 (없으면 생성)
+
+        Returns:
+            sqlite3.Connection: 현재 스레드의 연결
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._create_connection()
+            self._local.connection = connection
+            with self._registry_lock:
+                self._prune_dead_threads()
+                self._connections[threading.get_ident()] = connection
+            logger.debug(f"스레드 연결 생성 (thread={threading.current_thread().name})")
+        return connection
+
+    def _prune_dead_threads(self):
+        """종료된 스레드의 연결 정리 (_registry_lock 보유 상태에서 호출)"""
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in [ident for ident in self._connections if ident not in alive]:
+            self._connections.pop(ident).close()
+
+    @contextmanager
+    def reader(self):
+        """
+        읽기용 연결 획득 (with 블록 동안 사용)
+
+        Yields:
+            sqlite3.Connection: 현재 스레드의 연결
+        """
+        yield self.get_connection()
+
+    @contextmanager
+    def writer(self):
+        """
+        쓰기용 연결 획득 (with 블록 동안 쓰기 잠금 보유, 재진입 가능)
+
+        Yields:
+            sqlite3.Connection: 현재 스레드의 연결
+        """
+        with self._write_lock:
+            yield self.get_connection()
+
+    def release(self):
+        """현재 스레드의 연결 반납 (작업 스레드 종료 전 호출)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            self._local.connection = None
+            with self._registry_lock:
+                self._connections.pop(threading.get_ident(), None)
+            connection.close()
+
+    def close_all(self):
+        """모든 스레드의 연결 종료"""
+        with self._registry_lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+        # 다른 스레드의 threading.local은 접근할 수 없으므로 세대 교체로 무효화
+        self._local = threading.local()
+
+    @property
+    def size(self):
+        """현재 열린 연결 수"""
+        with self._registry_lock:
+            return len(self._connections)
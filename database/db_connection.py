@@ -1,10 +1,13 @@
 # 2025-10-27 - Smart Vocab Builder - DB 연결 관리 (Singleton)
 # 파일 위치: database/db_connection.py
 
-import sqlite3
 import os
 import logging
-from config import DB_PATH, DB_DIR
+import threading
+from contextlib import contextmanager
+from config import (DB_PATH, DB_DIR, DB_PRAGMA_PROFILES, DB_PRAGMA_PROFILE,
+                    DB_CACHED_STATEMENTS)
+from database.connection_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +15,14 @@ logger = logging.getLogger(__name__)
 class DBConnection:
     """
     SQLite 데이터베이스 연결을 관리하는 Singleton 클래스
+
+    실제 연결은 ConnectionPool이 스레드별로 관리하며,
+    조회는 각 스레드 연결에서 동시에, 쓰기는 쓰기 잠금으로 직렬화하여 실행한다.
     """
     _instance = None
-    _connection = None
+    _pool = None
+    _tx_state = threading.local()  # 스레드별 트랜잭션 중첩 깊이
+    _rollback_listeners = []  # 트랜잭션 롤백 시 호출할 함수 (캐시 무효화 등)
 
     def __new__(cls):
         if cls._instance is None:
@@ -28,85 +36,209 @@ class DBConnection:
             cls._instance = cls()
         return cls._instance
 
+    def _get_pool(self):
+        """연결 풀 반환 (최초 호출 시 생성)"""
+        if self._pool is None:
+            # DB 디렉토리가 없으면 생성
+            os.makedirs(DB_DIR, exist_ok=True)
+            self._pool = ConnectionPool(DB_PATH, DB_PRAGMA_PROFILES[DB_PRAGMA_PROFILE],
+                                        cached_statements=DB_CACHED_STATEMENTS)
+            logger.info(f"데이터베이스 연결 풀 생성: {DB_PATH} (프로파일={DB_PRAGMA_PROFILE})")
+        return self._pool
+
     def connect(self):
-        """데이터베이스 연결"""
-        if self._connection is None:
+        """현재 스레드의 데이터베이스 연결"""
+        try:
+            return self._get_pool().get_connection()
+        except Exception as e:
+            logger.error(f"데이터베이스 연결 실패: {e}")
+            raise
+
+    @contextmanager
+    def reader(self):
+        """읽기용 연결 획득 (with db.reader() as conn)"""
+        with self._get_pool().reader() as conn:
+            yield conn
+
+    @contextmanager
+    def writer(self):
+        """쓰기용 연결 획득 (with db.writer() as conn, 블록 동안 쓰기 직렬화)"""
+        with self._get_pool().writer() as conn:
+            yield conn
+
+    def in_transaction(self):
+        """현재 스레드가 transaction() 블록 안에 있는지 여부"""
+        return getattr(self._tx_state, 'depth', 0) > 0
+
+    def on_rollback(self, callback):
+        """
+        transaction() 블록이 롤백될 때 호출할 함수 등록
+
+        Args:
+            callback (callable): 인자 없는 함수
+        """
+        if callback not in self._rollback_listeners:
+            self._rollback_listeners.append(callback)
+
+    @contextmanager
+    def transaction(self):
+        """
+        트랜잭션 블록 (with db.transaction():)
+
+        블록 안의 execute_update/execute_insert/execute_many는 개별 커밋하지 않고
+        블록이 정상 종료될 때 한 번에 커밋, 예외 발생 시 전체 롤백한다.
+        중첩된 블록은 SAVEPOINT로 처리되어 안쪽 블록만 롤백할 수 있다.
+
+        Yields:
+            sqlite3.Connection: 현재 스레드의 연결
+        """
+        with self.writer() as conn:
+            depth = getattr(self._tx_state, 'depth', 0)
+            savepoint = f"sp_{depth}"
+
+            if depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+            else:
+                conn.execute(f"SAVEPOINT {savepoint}")
+            self._tx_state.depth = depth + 1
+
             try:
-                # DB 디렉토리가 없으면 생성
-                os.makedirs(DB_DIR, exist_ok=True)
-                
-                self._connection = sqlite3.connect(DB_PATH)
-                self._connection.row_factory = sqlite3.Row  # 딕셔너리처럼 접근 가능
-                logger.info(f"데이터베이스 연결 성공: {DB_PATH}")
-            except Exception as e:
-                logger.error(f"데이터베이스 연결 실패: {e}")
+                yield conn
+            except BaseException:
+                self._tx_state.depth = depth
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                for callback in self._rollback_listeners:
+                    callback()
                 raise
-        return self._connection
+
+            self._tx_state.depth = depth
+            if depth == 0:
+                conn.commit()
+            else:
+                conn.execute(f"RELEASE {savepoint}")
+
+    def release(self):
+        """현재 스레드의 연결 반납 (백그라운드 작업 종료 시 호출)"""
+        if self._pool:
+            self._pool.release()
 
     def close(self):
         """데이터베이스 연결 종료"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        if self._pool:
+            self._pool.close_all()
+            self._pool = None
             logger.info("데이터베이스 연결 종료")
 
-    def execute_query(self, query, params=None):
+    def execute_query(self, query, params=None, record_type=None):
         """
         SELECT 쿼리 실행
         
         Args:
             query (str): SQL 쿼리
             params (tuple, optional): 쿼리 파라미터
+            record_type (type, optional): from_rows(columns, rows)를 제공하는 레코드 클래스.
+                지정하면 sqlite3.Row 대신 해당 레코드 리스트 반환
             
         Returns:
             list: 조회 결과 리스트
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            results = cursor.fetchall()
-            return results
+            with self.reader() as conn:
+                cursor = conn.cursor()
+                if record_type is not None:
+                    cursor.row_factory = None  # 튜플로 받아 레코드로 직접 변환
+
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                results = cursor.fetchall()
+                if record_type is not None:
+                    columns = tuple(column[0] for column in cursor.description)
+                    return record_type.from_rows(columns, results)
+                return results
         except Exception as e:
             logger.error(f"쿼리 실행 실패: {query}, 오류: {e}")
             raise
 
+    def _execute_write(self, query, params=None):
+        """쓰기 쿼리 실행 후 커서 반환 (트랜잭션 밖이면 즉시 커밋)"""
+        with self.writer() as conn:
+            try:
+                cursor = conn.cursor()
+
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                # transaction() 블록 안에서는 블록 종료 시 일괄 커밋
+                if not self.in_transaction():
+                    conn.commit()
+                return cursor
+            except Exception as e:
+                if not self.in_transaction():
+                    conn.rollback()
+                logger.error(f"업데이트 실행 실패: {query}, 오류: {e}")
+                raise
+
     def execute_update(self, query, params=None):
         """
-        INSERT/UPDATE/DELETE 쿼리 실행
+        UPDATE/DELETE 쿼리 실행
         
         Args:
             query (str): SQL 쿼리
             params (tuple, optional): 쿼리 파라미터
             
         Returns:
-            int: 영향받은 행 수 또는 생성된 ID
+            int: 영향받은 행 수
         """
-        try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            conn.commit()
-            
-            # INSERT인 경우 생성된 ID 반환
-            if query.strip().upper().startswith('INSERT'):
-                return cursor.lastrowid
-            else:
-                return cursor.rowcount
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"업데이트 실행 실패: {query}, 오류: {e}")
-            raise
+        return self._execute_write(query, params).rowcount
+
+    def execute_insert(self, query, params=None):
+        """
+        INSERT 쿼리 실행
+
+        Args:
+            query (str): SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터
+
+        Returns:
+            int: 생성된 ID
+        """
+        return self._execute_write(query, params).lastrowid
+
+    def execute_many(self, query, params_list):
+        """
+        동일한 쿼리를 여러 파라미터로 실행 (단일 트랜잭션, 1회 커밋)
+
+        Args:
+            query (str): SQL 쿼리
+            params_list (list): 쿼리 파라미터 튜플 리스트
+
+        Returns:
+            tuple: (영향받은 행 수, 마지막으로 생성된 ID)
+        """
+        with self.writer() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(query, params_list)
+
+                # executemany는 lastrowid를 채우지 않으므로 같은 연결에서 직접 조회
+                last_row_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                if not self.in_transaction():
+                    conn.commit()
+                return cursor.rowcount, last_row_id
+            except Exception as e:
+                if not self.in_transaction():
+                    conn.rollback()
+                logger.error(f"일괄 실행 실패: {query}, 오류: {e}")
+                raise
 
     def execute_script(self, script_path):
         """
@@ -118,12 +250,12 @@ class DBConnection:
         try:
             with open(script_path, 'r', encoding='utf-8') as f:
                 script = f.read()
-            
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.executescript(script)
-            conn.commit()
+
+            with self.writer() as conn:
+                cursor = conn.cursor()
+                cursor.executescript(script)
+                conn.commit()
             logger.info(f"스크립트 실행 완료: {script_path}")
         except Exception as e:
             logger.error(f"스크립트 실행 실패: {script_path}, 오류: {e}")
-            raise
\ No newline at end of file
+            raise
@@ -0,0 +1,6 @@
+-- 2026-10-18 - Smart Vocab Builder - 마이그레이션 2: 영어 접두어 검색 인덱스
+-- 파일 위치: database/migration_002_english_prefix.sql
+-- 입력 중 검색 결과가 잘릴 때 완전/접두어 일치 단어를 먼저 찾는 범위 검색용
+-- (WordModel.search_words_prefix, 대소문자 무시).
+
+CREATE INDEX IF NOT EXISTS idx_words_active_english_lower ON words(lower(english)) WHERE is_deleted = 0;
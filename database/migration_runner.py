@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 스키마 마이그레이션 (PRAGMA user_version)
+# 파일 위치: database/migration_runner.py
+
+import os
+import sqlite3
+import logging
+from database.db_connection import DBConnection
+
+logger = logging.getLogger(__name__)
+
+SQL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def split_sql_statements(script):
+    """
+    SQL 스크립트를 문장 단위로 분리 (트리거 BEGIN ... END, 주석/문자열 안의 ';' 고려)
+
+    Args:
+        script (str): SQL 스크립트
+
+    Returns:
+        list: SQL 문장 리스트
+    """
+    statements = []
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            if statement and statement != ';':
+                statements.append(statement)
+            buffer = ''
+    leftover = ''.join(line for line in buffer.splitlines(keepends=True)
+                       if not line.strip().startswith('--')).strip()
+    if leftover:
+        raise ValueError(f"완결되지 않은 SQL 문장: {leftover[:80]}")
+    return statements
+
+
+def _execute_sql_file(conn, file_name):
+    """database/ 아래 SQL 파일을 현재 트랜잭션 안에서 문장별로 실행"""
+    with open(os.path.join(SQL_DIR, file_name), 'r', encoding='utf-8') as f:
+        statements = split_sql_statements(f.read())
+    for statement in statements:
+        conn.execute(statement)
+
+
+def _baseline(conn):
+    """
+    1: 기준 스키마와 초기 데이터
+
+    마이그레이션 도입 전 DB(user_version 0)도 이 단계를 거친다. schema.sql/init_data.sql은
+    IF NOT EXISTS / INSERT OR IGNORE라 기존 테이블과 데이터는 그대로 두고 빠진 것만 채운다.
+    """
+    from models.word_model import WordModel
+    word_model = WordModel()
+    # 이전 DB 보정: schema.sql의 인덱스가 참조하는 words.error_rate 생성 컬럼을 먼저 추가
+    word_model.ensure_error_rate_column()
+    _execute_sql_file(conn, 'schema.sql')
+    _execute_sql_file(conn, 'init_data.sql')
+    word_model.sync_korean_index()
+
+
+# (버전, 설명, 단계) - 단계는 database/ 아래 SQL 파일 이름 또는 conn을 받는 함수.
+# 적용된 항목은 수정하지 말고 다음 번호로 추가한다.
+MIGRATIONS = [
+    (1, '기준 스키마와 초기 데이터', _baseline),
+    (2, '영어 접두어 검색 인덱스', 'migration_002_english_prefix.sql'),
+]
+
+
+class MigrationRunner:
+    """
+    PRAGMA user_version 기반 스키마 마이그레이션
+
+    DB에 기록된 버전보다 높은 번호의 마이그레이션만 번호순으로 적용하며,
+    각 마이그레이션은 버전 갱신과 함께 한 트랜잭션으로 실행된다(실패 시 그 버전 전체 롤백).
+    스키마가 최신이면 user_version 조회 1회로 끝난다.
+    """
+
+    def __init__(self, migrations=None):
+        self.db = DBConnection.get_instance()
+        self.migrations = sorted(migrations or MIGRATIONS, key=lambda migration: migration[0])
+
+    @property
+    def latest_version(self):
+        """적용 가능한 최신 버전"""
+        return self.migrations[-1][0] if self.migrations else 0
+
+    def current_version(self):
+        """DB에 기록된 스키마 버전"""
+        return self.db.execute_query("PRAGMA user_version")[0][0]
+
+    def pending(self):
+        """
+        적용할 마이그레이션
+
+        Returns:
+            list: (버전, 설명, 단계) 리스트 (번호순)
+        """
+        current = self.current_version()
+        return [migration for migration in self.migrations if migration[0] > current]
+
+    def migrate(self):
+        """
+        적용되지 않은 마이그레이션 실행
+
+        Returns:
+            list: 적용한 버전 리스트 (최신이면 빈 리스트)
+        """
+        current = self.current_version()
+        if current > self.latest_version:
+            logger.warning(f"DB 스키마 버전({current})이 프로그램({self.latest_version})보다 높음")
+            return []
+
+        applied = []
+        for version, description, step in self.migrations:
+            if version <= current:
+                continue
+            try:
+                with self.db.transaction() as conn:
+                    if callable(step):
+                        step(conn)
+                    else:
+                        _execute_sql_file(conn, step)
+                    conn.execute(f"PRAGMA user_version = {int(version)}")
+            except Exception as e:
+                logger.error(f"마이그레이션 {version} 실패 ({description}): {e}")
+                raise
+            logger.info(f"마이그레이션 {version} 적용: {description}")
+            applied.append(version)
+        return applied
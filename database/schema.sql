@@ -1,5 +1,7 @@
 -- 2025-11-03 - Smart Vocab Builder - 데이터베이스 스키마 (전체)
 -- 파일 위치: database/schema.sql
+-- 마이그레이션 1(기준 스키마)로 한 번만 실행됨 (database/migration_runner.py).
+-- 이미 배포된 DB에 반영할 변경은 이 파일이 아니라 MIGRATIONS에 다음 번호로 추가한다.
 
 -- 1. 단어 테이블
 CREATE TABLE IF NOT EXISTS words (
@@ -13,7 +15,12 @@ CREATE TABLE IF NOT EXISTS words (
     last_learned_at TEXT,
     created_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime')),
     updated_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime')),
-    is_deleted INTEGER DEFAULT 0
+    is_deleted INTEGER DEFAULT 0,
+    -- 오답률 (통계 카운터가 바뀌면 자동 계산, idx_words_error_rate에 값이 저장됨)
+    error_rate REAL GENERATED ALWAYS AS (
+        CASE WHEN correct_count + wrong_count > 0
+             THEN wrong_count * 1.0 / (correct_count + wrong_count) ELSE 0 END
+    ) VIRTUAL
 );
 
 -- 2. 학습 세션 테이블
@@ -100,9 +107,97 @@ CREATE TABLE IF NOT EXISTS user_settings (
 CREATE INDEX IF NOT EXISTS idx_words_english ON words(english);
 CREATE INDEX IF NOT EXISTS idx_words_favorite ON words(is_favorite);
 CREATE INDEX IF NOT EXISTS idx_words_deleted ON words(is_deleted);
+CREATE INDEX IF NOT EXISTS idx_words_active_english ON words(is_deleted, english);
+CREATE INDEX IF NOT EXISTS idx_words_active_favorite ON words(is_deleted, is_favorite, english);
+CREATE INDEX IF NOT EXISTS idx_words_error_rate ON words(error_rate DESC, word_id) WHERE is_deleted = 0;
+-- 단어 목록 정렬 컬럼별 키셋 페이지 인덱스 (english는 idx_words_active_english)
+CREATE INDEX IF NOT EXISTS idx_words_active_korean ON words(is_deleted, korean, word_id);
+CREATE INDEX IF NOT EXISTS idx_words_active_correct ON words(is_deleted, correct_count, word_id);
+CREATE INDEX IF NOT EXISTS idx_words_active_wrong ON words(is_deleted, wrong_count, word_id);
+CREATE INDEX IF NOT EXISTS idx_words_active_created ON words(is_deleted, created_at, word_id);
 CREATE INDEX IF NOT EXISTS idx_learning_history_session ON learning_history(session_id);
 CREATE INDEX IF NOT EXISTS idx_learning_history_word ON learning_history(word_id);
 CREATE INDEX IF NOT EXISTS idx_exam_questions_exam ON exam_questions(exam_id);
 CREATE INDEX IF NOT EXISTS idx_exam_questions_word ON exam_questions(word_id);
 CREATE INDEX IF NOT EXISTS idx_wrong_note_word ON wrong_note(word_id);
-CREATE INDEX IF NOT EXISTS idx_wrong_note_resolved ON wrong_note(is_resolved);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_wrong_note_resolved ON wrong_note(is_resolved);
+
+-- 9. 단어 전문 검색 인덱스 (FTS5 trigram, 삭제되지 않은 단어만 색인)
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+    english,
+    korean,
+    tokenize = 'trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_insert AFTER INSERT ON words
+WHEN new.is_deleted = 0
+BEGIN
+    INSERT INTO words_fts (rowid, english, korean) VALUES (new.word_id, new.english, new.korean);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_update AFTER UPDATE OF english, korean, is_deleted ON words
+BEGIN
+    DELETE FROM words_fts WHERE rowid = old.word_id;
+    INSERT INTO words_fts (rowid, english, korean)
+    SELECT new.word_id, new.english, new.korean WHERE new.is_deleted = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_delete AFTER DELETE ON words
+BEGIN
+    DELETE FROM words_fts WHERE rowid = old.word_id;
+END;
+
+-- 기존 단어 중 색인되지 않은 항목 채우기
+INSERT INTO words_fts (rowid, english, korean)
+SELECT word_id, english, korean FROM words
+WHERE is_deleted = 0 AND word_id NOT IN (SELECT rowid FROM words_fts);
+
+-- 10. 한국어 초성/자모 검색 인덱스 (WordModel에서 삽입/수정 시 갱신)
+CREATE TABLE IF NOT EXISTS word_korean_index (
+    word_id INTEGER PRIMARY KEY,
+    chosung TEXT NOT NULL,
+    jamo TEXT NOT NULL,
+    FOREIGN KEY (word_id) REFERENCES words(word_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_word_korean_chosung ON word_korean_index(chosung);
+CREATE INDEX IF NOT EXISTS idx_word_korean_jamo ON word_korean_index(jamo);
+
+CREATE TRIGGER IF NOT EXISTS trg_word_korean_index_delete AFTER DELETE ON words
+BEGIN
+    DELETE FROM word_korean_index WHERE word_id = old.word_id;
+END;
+
+-- 11. 간격 반복(SM-2) 복습 스케줄 (학습 결과 반영 시 갱신)
+CREATE TABLE IF NOT EXISTS word_schedule (
+    word_id INTEGER PRIMARY KEY,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    interval_days REAL NOT NULL DEFAULT 0,
+    ease REAL NOT NULL DEFAULT 2.5,
+    due_at TEXT NOT NULL,
+    last_reviewed_at TEXT,
+    FOREIGN KEY (word_id) REFERENCES words(word_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_word_schedule_due ON word_schedule(due_at);
+
+CREATE TRIGGER IF NOT EXISTS trg_word_schedule_delete AFTER DELETE ON words
+BEGIN
+    DELETE FROM word_schedule WHERE word_id = old.word_id;
+END;
+
+-- 12. 일별 통계 집계 (학습/시험 결과 기록 시 증분 갱신, StatisticsModel.rebuild_daily_stats로 재계산)
+CREATE TABLE IF NOT EXISTS daily_stats (
+    stat_date TEXT PRIMARY KEY,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    exam_count INTEGER NOT NULL DEFAULT 0,
+    exam_score_sum REAL NOT NULL DEFAULT 0
+);
+
+-- 13. 복습 간격별 정답률 집계 (망각 곡선, 복습 스케줄 갱신 시 증분 갱신)
+CREATE TABLE IF NOT EXISTS retention_stats (
+    gap_days INTEGER PRIMARY KEY,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    total_count INTEGER NOT NULL DEFAULT 0
+);
@@ -2,12 +2,9 @@
 # 2025-11-03 - Smart Vocab Builder - 메인 진입점
 # 파일 위치: main.py
 
+from utils.startup_timer import startup_timer  # 시작 시각 기록을 위해 가장 먼저 import
 import sys
-import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QFont
 from utils.logger import setup_logger
-from database.db_connection import DBConnection
 
 # Windows 환경 UTF-8 설정
 if sys.platform == 'win32':
@@ -17,32 +14,54 @@ if sys.platform == 'win32':
     sys.stderr.reconfigure(encoding='utf-8') if hasattr(sys.stderr, 'reconfigure') else None
 
 def initialize_database():
-    """DB 초기화"""
-    db = DBConnection.get_instance()
+    """DB 초기화 (적용되지 않은 스키마 마이그레이션만 실행, 최신이면 버전 확인만)"""
+    from database.migration_runner import MigrationRunner
+    applied = MigrationRunner().migrate()
+    if applied:
+        print(f"[OK] DB 스키마 마이그레이션 적용: {', '.join(map(str, applied))}")
 
-    # 스키마 실행
-    schema_path = os.path.join('database', 'schema.sql')
-    if os.path.exists(schema_path):
-        db.execute_script(schema_path)
-        print("[OK] DB 스키마 생성 완료!")
+def rebuild_statistics():
+    """일별 통계 집계를 원본 이력에서 재계산 (python main.py --rebuild-stats)"""
+    from models.statistics_model import StatisticsModel
+    days = StatisticsModel().rebuild_daily_stats()
+    print(f"[OK] 일별 통계 재계산 완료: {days}일")
 
-    # 초기 데이터 실행
-    init_data_path = os.path.join('database', 'init_data.sql')
-    if os.path.exists(init_data_path):
-        db.execute_script(init_data_path)
-        print("[OK] 초기 데이터 설정 완료!")
+def on_first_paint(app, exit_after):
+    """
+    첫 화면 그리기 완료: 시작 시간 기록 (python main.py --measure-startup은 측정 후 종료)
+
+    Args:
+        app (QApplication): 애플리케이션
+        exit_after (bool): 측정 후 종료 여부 (예산 초과 시 종료 코드 1)
+    """
+    startup_timer.mark('first_paint')
+    within_budget = startup_timer.finish()
+    if exit_after:
+        app.exit(0 if within_budget else 1)
 
 def main():
     setup_logger()
     initialize_database()
+    startup_timer.mark('database')
+
+    if '--rebuild-stats' in sys.argv:
+        rebuild_statistics()
+        return
 
+    # PyQt는 GUI를 띄울 때만 import (--rebuild-stats 등 명령행 작업은 생략)
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QFont
     app = QApplication(sys.argv)
 
     # 한글 폰트 설정
     app.setFont(QFont("맑은 고딕", 10))
+    startup_timer.mark('qt')
 
     from views.main_window import MainWindow
     window = MainWindow()
+    startup_timer.mark('main_window')
+    window.first_painted.connect(
+        lambda: on_first_paint(app, '--measure-startup' in sys.argv))
     window.show()
     sys.exit(app.exec_())
 
@@ -15,10 +15,69 @@ class BaseModel:
     TABLE_NAME = None  # 자식 클래스에서 반드시 정의
     PRIMARY_KEY = None  # 자식 클래스에서 반드시 정의
 
+    # 생성한 SQL 문자열 캐시는 모델 클래스마다 따로 둔다 (_sql 참고)
+    _sql_cache = None
+    _sql_cache_stats = None
+
     def __init__(self):
         self.db = DBConnection.get_instance()
 
-    def find_all(self, where_clause=None, params=None, order_by=None):
+    @classmethod
+    def _sql(cls, operation, columns=()):
+        """
+        CRUD SQL 문자열 생성 (모델 클래스별 캐시)
+
+        Args:
+            operation (str): 'find_by_pk', 'insert', 'update', 'soft_delete', 'delete'
+            columns (tuple): INSERT/UPDATE 대상 컬럼
+
+        Returns:
+            str: SQL 쿼리
+        """
+        if cls.__dict__.get('_sql_cache') is None:
+            cls._sql_cache = {}
+            cls._sql_cache_stats = {'hits': 0, 'misses': 0}
+
+        key = (operation, columns)
+        query = cls._sql_cache.get(key)
+        if query is not None:
+            cls._sql_cache_stats['hits'] += 1
+            return query
+
+        cls._sql_cache_stats['misses'] += 1
+        table, pk = cls.TABLE_NAME, cls.PRIMARY_KEY
+        if operation == 'find_by_pk':
+            query = f"SELECT * FROM {table} WHERE {pk} = ?"
+        elif operation == 'insert':
+            placeholders = ', '.join(['?' for _ in columns])
+            query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        elif operation == 'update':
+            set_clause = ', '.join([f"{column} = ?" for column in columns])
+            query = f"UPDATE {table} SET {set_clause} WHERE {pk} = ?"
+        elif operation == 'soft_delete':
+            query = f"UPDATE {table} SET is_deleted = 1 WHERE {pk} = ?"
+        elif operation == 'delete':
+            query = f"DELETE FROM {table} WHERE {pk} = ?"
+        else:
+            raise ValueError(f"알 수 없는 SQL 연산: {operation}")
+
+        cls._sql_cache[key] = query
+        return query
+
+    @classmethod
+    def sql_cache_info(cls):
+        """
+        SQL 캐시 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'size'}
+        """
+        if cls.__dict__.get('_sql_cache') is None:
+            return {'hits': 0, 'misses': 0, 'size': 0}
+        return dict(cls._sql_cache_stats, size=len(cls._sql_cache))
+
+    def find_all(self, where_clause=None, params=None, order_by=None, limit=None,
+                 columns=None, after=None, record_type=None):
         """
         전체 레코드 조회
         
@@ -26,41 +85,97 @@ class BaseModel:
             where_clause (str, optional): WHERE 조건
             params (tuple, optional): 조건 파라미터
             order_by (str, optional): 정렬 조건
+            limit (int, optional): 최대 조회 건수
+            columns (list, optional): 조회할 컬럼 (None이면 전체)
+            after (optional): 키셋 페이지네이션 커서. 직전 페이지 마지막 행의
+                order_by 컬럼 값 (컬럼이 여러 개면 튜플)
+            record_type (type, optional): 행을 dict 대신 이 레코드 타입으로 반환
+                (예: models.word_record.Word)
             
         Returns:
             list: 조회 결과
         """
         try:
-            query = f"SELECT * FROM {self.TABLE_NAME}"
-            
-            if where_clause:
-                query += f" WHERE {where_clause}"
+            column_clause = ', '.join(columns) if columns else '*'
+            query = f"SELECT {column_clause} FROM {self.TABLE_NAME}"
+            params = tuple(params or ())
+            conditions = [f"({where_clause})"] if where_clause else []
+
+            if after is not None:
+                if not order_by:
+                    raise ValueError("after 커서는 order_by와 함께 사용해야 합니다")
+                keyset_clause, after = self._build_keyset_clause(order_by, after)
+                conditions.append(keyset_clause)
+                params += after
+
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
             
             if order_by:
                 query += f" ORDER BY {order_by}"
+
+            if limit:
+                query += " LIMIT ?"
+                params += (limit,)
             
+            if record_type is not None:
+                return self.db.execute_query(query, params, record_type=record_type)
+
             results = self.db.execute_query(query, params)
             return [dict(row) for row in results]
         except Exception as e:
             logger.error(f"전체 조회 실패 ({self.TABLE_NAME}): {e}")
             raise
 
-    def find_by_pk(self, pk_value):
+    @staticmethod
+    def _build_keyset_clause(order_by, after):
+        """
+        ORDER BY 컬럼으로 키셋 조건 생성 (예: "(english, word_id) > (?, ?)")
+
+        Args:
+            order_by (str): 정렬 조건 (모든 컬럼이 같은 방향이어야 함)
+            after: 커서 값 (단일 값 또는 튜플)
+
+        Returns:
+            tuple: (조건절 str, 커서 파라미터 tuple)
+        """
+        order_columns = []
+        directions = set()
+        for term in order_by.split(','):
+            parts = term.split()
+            order_columns.append(parts[0])
+            directions.add(parts[1].upper() if len(parts) > 1 else 'ASC')
+
+        if len(directions) != 1:
+            raise ValueError(f"키셋 페이지네이션은 정렬 방향이 같아야 합니다: {order_by}")
+
+        if not isinstance(after, (tuple, list)):
+            after = (after,)
+        if len(after) != len(order_columns):
+            raise ValueError(f"커서 값 개수가 정렬 컬럼 수와 다릅니다: {order_by}")
+
+        operator = '<' if directions.pop() == 'DESC' else '>'
+        placeholders = ', '.join(['?' for _ in order_columns])
+        clause = f"({', '.join(order_columns)}) {operator} ({placeholders})"
+        return clause, tuple(after)
+
+    def find_by_pk(self, pk_value, record_type=None):
         """
         Primary Key로 단일 레코드 조회
         
         Args:
             pk_value: Primary Key 값
+            record_type (type, optional): dict 대신 반환할 레코드 타입
             
         Returns:
             dict: 조회 결과 또는 None
         """
         try:
-            query = f"SELECT * FROM {self.TABLE_NAME} WHERE {self.PRIMARY_KEY} = ?"
-            results = self.db.execute_query(query, (pk_value,))
+            results = self.db.execute_query(self._sql('find_by_pk'), (pk_value,),
+                                            record_type=record_type)
             
             if results:
-                return dict(results[0])
+                return results[0] if record_type is not None else dict(results[0])
             return None
         except Exception as e:
             logger.error(f"PK 조회 실패 ({self.TABLE_NAME}, PK={pk_value}): {e}")
@@ -77,17 +192,39 @@ class BaseModel:
             int: 생성된 ID
         """
         try:
-            columns = ', '.join(data.keys())
-            placeholders = ', '.join(['?' for _ in data])
-            query = f"INSERT INTO {self.TABLE_NAME} ({columns}) VALUES ({placeholders})"
-            
-            result = self.db.execute_update(query, tuple(data.values()))
+            query = self._sql('insert', tuple(data))
+            result = self.db.execute_insert(query, tuple(data.values()))
             logger.info(f"레코드 삽입 성공 ({self.TABLE_NAME}, ID={result})")
             return result
         except Exception as e:
             logger.error(f"레코드 삽입 실패 ({self.TABLE_NAME}): {e}")
             raise
 
+    def insert_many(self, columns, rows):
+        """
+        레코드 일괄 삽입 (executemany, 단일 트랜잭션)
+
+        Args:
+            columns (list): 삽입할 컬럼명 리스트
+            rows (list): 컬럼 순서에 맞춘 값 튜플 리스트
+
+        Returns:
+            list: 생성된 ID 리스트 (삽입 순서)
+        """
+        if not rows:
+            return []
+
+        try:
+            query = self._sql('insert', tuple(columns))
+            count, last_id = self.db.execute_many(query, rows)
+            # 한 트랜잭션 안의 연속 INSERT는 ID가 연속으로 할당됨
+            ids = list(range(last_id - count + 1, last_id + 1))
+            logger.info(f"레코드 일괄 삽입 성공 ({self.TABLE_NAME}, {count}건)")
+            return ids
+        except Exception as e:
+            logger.error(f"레코드 일괄 삽입 실패 ({self.TABLE_NAME}): {e}")
+            raise
+
     def update(self, pk_value, data):
         """
         레코드 수정
@@ -100,9 +237,7 @@ class BaseModel:
             int: 영향받은 행 수
         """
         try:
-            set_clause = ', '.join([f"{key} = ?" for key in data.keys()])
-            query = f"UPDATE {self.TABLE_NAME} SET {set_clause} WHERE {self.PRIMARY_KEY} = ?"
-            
+            query = self._sql('update', tuple(data))
             params = list(data.values()) + [pk_value]
             result = self.db.execute_update(query, tuple(params))
             logger.info(f"레코드 수정 성공 ({self.TABLE_NAME}, PK={pk_value})")
@@ -123,13 +258,8 @@ class BaseModel:
             int: 영향받은 행 수
         """
         try:
-            if soft:
-                # 논리적 삭제
-                query = f"UPDATE {self.TABLE_NAME} SET is_deleted = 1 WHERE {self.PRIMARY_KEY} = ?"
-            else:
-                # 물리적 삭제
-                query = f"DELETE FROM {self.TABLE_NAME} WHERE {self.PRIMARY_KEY} = ?"
-            
+            # 논리적 삭제(is_deleted = 1) 또는 물리적 삭제
+            query = self._sql('soft_delete' if soft else 'delete')
             result = self.db.execute_update(query, (pk_value,))
             logger.info(f"레코드 삭제 성공 ({self.TABLE_NAME}, PK={pk_value}, soft={soft})")
             return result
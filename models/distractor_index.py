@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 객관식 오답 선택지 인덱스
+# 파일 위치: models/distractor_index.py
+
+import random
+import re
+import threading
+
+CHOICE_COUNT = 4  # exam_questions의 choice_1 ~ choice_4
+
+_MEANING_SEPARATOR = re.compile(r'[,;/·]')
+
+
+def _first_meaning(korean):
+    """여러 뜻 중 첫 번째 뜻 ('사과, 사과나무' -> '사과')"""
+    return _MEANING_SEPARATOR.split(korean, 1)[0].strip() or korean.strip()
+
+
+def _group_keys(english, korean):
+    """
+    단어가 속하는 그룹 키 (앞쪽일수록 비슷한 후보)
+
+    - 한국어 보기: 첫 뜻의 끝 글자(품사 단서: ~하다, ~한, ~적인)와 길이
+    - 영어 보기: 앞 글자와 길이
+    """
+    meaning = _first_meaning(korean)
+    ending = meaning[-1:]
+    word = english.lower()
+    return (
+        ('ko', ending, len(meaning)),
+        ('ko', ending),
+        ('ko_len', len(meaning)),
+        ('en', word[:2], len(word) // 2),
+        ('en', word[:1]),
+        ('en_len', len(word) // 2),
+    )
+
+
+class DistractorIndex:
+    """
+    활성 단어 전체를 그룹별로 묶어 둔 메모리 인덱스
+
+    한 번 구성(O(n))한 뒤 단어 추가/수정/삭제를 그룹 단위로 O(1)에 반영하고,
+    시험 전체의 선택지를 DB 조회 없이 한 번에 만든다.
+    구성 전에 들어온 변경은 무시한다.
+    """
+
+    def __init__(self, rng=None):
+        self._rng = rng or random.Random()
+        self._lock = threading.RLock()
+        self.reset()
+
+    @property
+    def is_built(self):
+        """구성 여부"""
+        return self._entries is not None
+
+    def reset(self):
+        """구성 해제 (다음 사용 때 다시 구성)"""
+        with self._lock:
+            self._entries = None  # word_id -> (english, korean)
+            self._groups = {}  # 그룹 키 -> [word_id, ...]
+            self._slots = {}  # (그룹 키, word_id) -> 그룹 리스트 내 위치
+            self._all = ('all',)
+
+    def build(self, rows):
+        """
+        (word_id, english, korean) 행으로 구성
+
+        Args:
+            rows (iterable): 활성 단어
+        """
+        with self._lock:
+            self.reset()
+            self._entries = {}
+            for word_id, english, korean in rows:
+                self._add(word_id, english, korean)
+
+    def _add(self, word_id, english, korean):
+        """그룹에 단어 추가 (_lock 보유 상태에서 호출)"""
+        self._entries[word_id] = (english, korean)
+        for key in (self._all,) + _group_keys(english, korean):
+            members = self._groups.setdefault(key, [])
+            self._slots[(key, word_id)] = len(members)
+            members.append(word_id)
+
+    def _remove(self, word_id):
+        """그룹에서 단어 제거 - 마지막 원소와 자리 바꿔 O(1) (_lock 보유 상태에서 호출)"""
+        english, korean = self._entries.pop(word_id)
+        for key in (self._all,) + _group_keys(english, korean):
+            members = self._groups[key]
+            slot = self._slots.pop((key, word_id))
+            last = members.pop()
+            if last != word_id:
+                members[slot] = last
+                self._slots[(key, last)] = slot
+            if not members:
+                del self._groups[key]
+
+    def put_word(self, word_id, english, korean):
+        """단어 추가 또는 수정 반영"""
+        with self._lock:
+            if self._entries is None:
+                return
+            if word_id in self._entries:
+                self._remove(word_id)
+            self._add(word_id, english, korean)
+
+    def remove_word(self, word_id):
+        """단어 삭제 반영"""
+        with self._lock:
+            if self._entries is not None and word_id in self._entries:
+                self._remove(word_id)
+
+    def _pick(self, word_id, answer, field, keys, count):
+        """
+        그룹 순서대로 무작위 후보를 뽑아 정답/중복이 아닌 보기 count개 선택
+        (_lock 보유 상태에서 호출)
+        """
+        picked = []
+        seen = {answer}
+        for key in keys + (self._all,):
+            members = self._groups.get(key)
+            if not members:
+                continue
+            # 그룹이 작으면 전부, 크면 일부만 시도 (질문당 비용 상한)
+            if len(members) <= count * 4:
+                candidates = self._rng.sample(members, len(members))
+            else:
+                candidates = (members[self._rng.randrange(len(members))] for _ in range(count * 4))
+            for candidate in candidates:
+                text = self._entries[candidate][field]
+                if candidate != word_id and text not in seen:
+                    seen.add(text)
+                    picked.append(text)
+                    if len(picked) == count:
+                        return picked
+        return picked
+
+    def generate_choices(self, words, question_mode='en_to_ko', choice_count=CHOICE_COUNT):
+        """
+        문제 단어 목록의 객관식 선택지를 한 번에 생성
+
+        Args:
+            words (list): word_id, english, korean을 가진 단어 레코드 리스트
+            question_mode (str): 'en_to_ko'(보기가 한국어) 또는 'ko_to_en'(보기가 영어)
+            choice_count (int): 정답 포함 보기 수
+
+        Returns:
+            list: 문제별 보기 리스트 (정답 포함, 섞인 순서, 단어 수가 적으면 더 짧음)
+        """
+        if question_mode not in ('en_to_ko', 'ko_to_en'):
+            raise ValueError(f"지원하지 않는 출제 방향: {question_mode}")
+        if self._entries is None:
+            raise RuntimeError("선택지 인덱스가 구성되지 않았습니다")
+
+        field = 1 if question_mode == 'en_to_ko' else 0
+        result = []
+        with self._lock:
+            for word in words:
+                english, korean = word['english'], word['korean']
+                answer = korean if field == 1 else english
+                keys = _group_keys(english, korean)
+                keys = keys[:3] if field == 1 else keys[3:]
+                choices = self._pick(word['word_id'], answer, field, keys, choice_count - 1)
+                choices.append(answer)
+                self._rng.shuffle(choices)
+                result.append(choices)
+        return result
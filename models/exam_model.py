@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 시험 Model
+# 파일 위치: models/exam_model.py
+
+import logging
+import re
+from config import SQL_IN_CHUNK_SIZE
+from models.base_model import BaseModel
+from models.statistics_model import StatisticsModel
+from models.word_model import WordModel
+from utils.datetime_helper import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+QUESTION_COLUMNS = ('exam_id', 'word_id', 'question_number', 'question_text', 'correct_answer',
+                    'choice_1', 'choice_2', 'choice_3', 'choice_4')
+
+_ANSWER_SEPARATOR = re.compile(r'[,;/·]')
+
+
+def _normalize_answer(text):
+    """채점용 답안 정규화 (앞뒤/중복 공백 제거, 소문자)"""
+    return ' '.join(text.split()).lower()
+
+
+def grade_answer(correct_answer, user_answer):
+    """
+    답안 채점 (뜻이 여러 개면 그중 하나만 맞아도 정답)
+
+    Args:
+        correct_answer (str): 정답 ('사과, 사과나무' 형식 허용)
+        user_answer (str): 사용자 답안 (미응답은 None)
+
+    Returns:
+        bool: 정답 여부
+    """
+    if not user_answer or not user_answer.strip():
+        return False
+    accepted = {_normalize_answer(correct_answer)}
+    accepted.update(_normalize_answer(part) for part in _ANSWER_SEPARATOR.split(correct_answer)
+                    if part.strip())
+    return _normalize_answer(user_answer) in accepted
+
+
+class ExamQuestionModel(BaseModel):
+    """
+    시험 문제(exam_questions) 테이블 전용 Model
+    """
+    TABLE_NAME = 'exam_questions'
+    PRIMARY_KEY = 'question_id'
+
+
+class ExamModel(BaseModel):
+    """
+    시험(exam_history) 데이터 접근 클래스
+
+    시험 생성(이력 + 전체 문제)과 종료(채점 + 오답 노트 + 단어 통계)를
+    각각 한 트랜잭션, 테이블별 executemany 한 번으로 처리한다.
+    """
+    TABLE_NAME = 'exam_history'
+    PRIMARY_KEY = 'exam_id'
+
+    def __init__(self):
+        super().__init__()
+        self.questions = ExamQuestionModel()
+        self.word_model = WordModel()
+        self.statistics = StatisticsModel()
+
+    def create_exam(self, exam_type, question_mode, order_type, questions, time_limit_minutes=None):
+        """
+        시험 이력과 전체 문제를 한 트랜잭션으로 저장
+
+        Args:
+            exam_type (str): 'short_answer' | 'multiple_choice' | 'mixed'
+            question_mode (str): 'en_to_ko' | 'ko_to_en' | 'mixed'
+            order_type (str): 'random' | 'personalized'
+            questions (list): 문제 dict 리스트
+                {'word_id', 'question_text', 'correct_answer', 'choices'(객관식만, 최대 4개)}
+            time_limit_minutes (int, optional): 제한 시간
+
+        Returns:
+            tuple: (exam_id, question_id 리스트 - 문제 순서)
+        """
+        try:
+            with self.db.transaction():
+                exam_id = self.insert({
+                    'exam_type': exam_type,
+                    'question_mode': question_mode,
+                    'order_type': order_type,
+                    'total_questions': len(questions),
+                    'score': 0,
+                    'correct_count': 0,
+                    'wrong_count': 0,
+                    'time_limit_minutes': time_limit_minutes,
+                })
+                rows = []
+                for number, question in enumerate(questions, 1):
+                    choices = list(question.get('choices') or [])[:4]
+                    choices += [None] * (4 - len(choices))
+                    rows.append((exam_id, question['word_id'], number, question['question_text'],
+                                 question['correct_answer'], *choices))
+                question_ids = self.questions.insert_many(QUESTION_COLUMNS, rows)
+            logger.info(f"시험 생성 완료 (exam_id={exam_id}, {len(question_ids)}문제)")
+            return exam_id, question_ids
+        except Exception as e:
+            logger.error(f"시험 생성 실패: {e}")
+            raise
+
+    def get_exam_questions(self, exam_id):
+        """
+        시험 문제 조회 (문제 번호 순)
+
+        Args:
+            exam_id (int): 시험 ID
+
+        Returns:
+            list: 문제 리스트
+        """
+        return self.questions.find_all(where_clause="exam_id = ?", params=(exam_id,),
+                                       order_by="question_number")
+
+    def finish_exam(self, exam_id, answers, time_taken_seconds=None):
+        """
+        시험 종료: 채점, 오답 노트, 단어 학습 통계, 일별 통계를 한 트랜잭션으로 반영
+
+        트랜잭션 첫 문장에서 ended_at이 비어 있는 시험만 종료 처리하므로 같은 시험을
+        두 번 종료해도(중복 클릭, 재시도) 통계는 한 번만 반영되고 저장된 결과를 돌려준다.
+
+        Args:
+            exam_id (int): 시험 ID
+            answers (dict): question_id -> 사용자 답안 (미응답 문제는 오답)
+            time_taken_seconds (int, optional): 소요 시간
+
+        Returns:
+            dict: {'exam_id', 'total', 'correct_count', 'wrong_count', 'score', 'wrong_word_ids'}
+        """
+        try:
+            ended_at = get_current_datetime()
+            with self.db.transaction():
+                claimed = self.db.execute_update(
+                    f"UPDATE {self.TABLE_NAME} SET ended_at = ?, time_taken_seconds = ? "
+                    f"WHERE exam_id = ? AND ended_at IS NULL",
+                    (ended_at, time_taken_seconds, exam_id)
+                )
+                if not claimed:
+                    result = self._finished_result(exam_id)
+                else:
+                    result = self._grade_exam(exam_id, answers, ended_at)
+
+            if claimed:
+                logger.info(f"시험 종료 (exam_id={exam_id}, 점수={result['score']})")
+            else:
+                logger.warning(f"이미 종료된 시험 (exam_id={exam_id}), 저장된 결과 반환")
+            return result
+        except Exception as e:
+            logger.error(f"시험 종료 실패 (exam_id={exam_id}): {e}")
+            raise
+
+    def _grade_exam(self, exam_id, answers, ended_at):
+        """
+        채점 및 결과 반영 (finish_exam 트랜잭션 안에서 호출)
+
+        단어 통계/복습 스케줄은 종료 시각을 답안 시각으로 기록해 재계산과 맞춘다.
+        """
+        questions = self.get_exam_questions(exam_id)
+        if not questions:
+            raise ValueError(f"시험 문제가 없음: exam_id={exam_id}")
+
+        graded = []
+        results = []
+        for question in questions:
+            user_answer = answers.get(question['question_id'])
+            is_correct = grade_answer(question['correct_answer'], user_answer)
+            graded.append((user_answer, int(is_correct), question['question_id']))
+            results.append((question['word_id'], is_correct))
+
+        self.db.execute_many(
+            "UPDATE exam_questions SET user_answer = ?, is_correct = ? WHERE question_id = ?",
+            graded
+        )
+
+        total = len(results)
+        correct_count = sum(1 for _, is_correct in results if is_correct)
+        score = round(correct_count * 100 / total, 1)
+        self.update(exam_id, {
+            'score': score,
+            'correct_count': correct_count,
+            'wrong_count': total - correct_count,
+        })
+
+        wrong_word_ids = list(dict.fromkeys(word_id for word_id, is_correct in results
+                                            if not is_correct))
+        self._add_wrong_notes(exam_id, wrong_word_ids)
+        self.word_model.update_statistics_batch(results, ended_at)
+        self.statistics.record_exam(score)
+
+        return {
+            'exam_id': exam_id,
+            'total': total,
+            'correct_count': correct_count,
+            'wrong_count': total - correct_count,
+            'score': score,
+            'wrong_word_ids': wrong_word_ids,
+        }
+
+    def _finished_result(self, exam_id):
+        """
+        이미 종료된 시험의 저장된 채점 결과
+
+        Raises:
+            ValueError: 시험이 없는 경우
+        """
+        exam = self.find_by_pk(exam_id)
+        if exam is None:
+            raise ValueError(f"시험을 찾을 수 없음: exam_id={exam_id}")
+
+        rows = self.db.execute_query(
+            "SELECT word_id FROM exam_questions WHERE exam_id = ? AND is_correct = 0 "
+            "ORDER BY question_number",
+            (exam_id,)
+        )
+        return {
+            'exam_id': exam_id,
+            'total': exam['correct_count'] + exam['wrong_count'],
+            'correct_count': exam['correct_count'],
+            'wrong_count': exam['wrong_count'],
+            'score': exam['score'],
+            'wrong_word_ids': list(dict.fromkeys(row['word_id'] for row in rows)),
+        }
+
+    def _add_wrong_notes(self, exam_id, word_ids):
+        """
+        오답 노트 일괄 반영 (미해결 노트가 있으면 횟수 증가, 없으면 추가)
+
+        Args:
+            exam_id (int): 시험 ID
+            word_ids (list): 틀린 단어 ID 리스트 (중복 없음)
+        """
+        if not word_ids:
+            return
+
+        existing = set()
+        for start in range(0, len(word_ids), SQL_IN_CHUNK_SIZE):
+            chunk = word_ids[start:start + SQL_IN_CHUNK_SIZE]
+            placeholders = ', '.join(['?' for _ in chunk])
+            rows = self.db.execute_query(
+                f"SELECT DISTINCT word_id FROM wrong_note "
+                f"WHERE is_resolved = 0 AND word_id IN ({placeholders})",
+                tuple(chunk)
+            )
+            existing.update(row['word_id'] for row in rows)
+
+        if existing:
+            self.db.execute_many(
+                "UPDATE wrong_note SET wrong_count = wrong_count + 1, exam_id = ? "
+                "WHERE word_id = ? AND is_resolved = 0",
+                [(exam_id, word_id) for word_id in existing]
+            )
+        new_ids = [word_id for word_id in word_ids if word_id not in existing]
+        if new_ids:
+            self.db.execute_many(
+                "INSERT INTO wrong_note (word_id, exam_id) VALUES (?, ?)",
+                [(word_id, exam_id) for word_id in new_ids]
+            )
+
+    def get_exam_history(self, limit=10):
+        """
+        최근 시험 이력 조회
+
+        Args:
+            limit (int): 최대 개수
+
+        Returns:
+            list: 시험 이력 리스트 (최신순)
+        """
+        return self.find_all(order_by="exam_id DESC", limit=limit)
+
+    def get_exam_detail(self, exam_id):
+        """
+        시험 상세 조회 (이력 + 문제별 결과)
+
+        Args:
+            exam_id (int): 시험 ID
+
+        Returns:
+            dict: {'exam': 시험 이력, 'questions': 문제 리스트} 또는 None
+        """
+        exam = self.find_by_pk(exam_id)
+        if exam is None:
+            return None
+        return {'exam': exam, 'questions': self.get_exam_questions(exam_id)}
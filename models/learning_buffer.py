@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 학습 결과 기록 버퍼 (write-behind)
+# 파일 위치: models/learning_buffer.py
+
+import atexit
+import logging
+import threading
+from config import STATS_FLUSH_INTERVAL_SECONDS, STATS_FLUSH_THRESHOLD
+from database.db_connection import DBConnection
+from models.word_model import WordModel
+from utils.datetime_helper import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+
+class LearningResultBuffer:
+    """
+    플래시카드 답안을 메모리에 모았다가 한 번에 반영하는 Singleton 버퍼
+
+    record()는 답안 1건(세션, 단어, 정답 여부, 답한 시각)을 메모리에 추가하고 즉시 반환하며,
+    다음 시점에 flush()로 학습 이력과 단어/일별 통계를 한 트랜잭션으로 DB에 반영한다.
+    - 첫 미반영 기록 후 STATS_FLUSH_INTERVAL_SECONDS가 지났을 때 (타이머)
+    - 누적 기록 수가 STATS_FLUSH_THRESHOLD에 도달했을 때 (타이머를 즉시 실행으로 교체)
+    - 세션 종료 / 프로그램 종료 시 (flush() 또는 close() 호출, atexit 등록)
+    자동 반영은 모두 타이머 스레드에서 실행되므로 record()를 부른 화면 스레드는 커밋을 기다리지 않는다.
+    """
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, flush_interval=STATS_FLUSH_INTERVAL_SECONDS,
+                 flush_threshold=STATS_FLUSH_THRESHOLD):
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.model = WordModel()
+        self._pending = []  # (session_id, word_id, is_correct, learned_at) - 답안 순서
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer = None
+        self._flush_requested = False  # 임계값 도달로 즉시 반영 타이머가 걸린 상태
+        self._retrying = False  # 반영 실패 후 재시도 대기 중 (임계값으로 앞당기지 않음)
+        atexit.register(self.close)
+
+    @classmethod
+    def get_instance(cls):
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def record(self, word_id, is_correct, session_id):
+        """
+        학습 결과 1건 기록 (DB 접근 없음, 반영은 타이머 스레드에 맡김)
+
+        Args:
+            word_id (int): 단어 ID
+            is_correct (bool): 정답 여부
+            session_id (int): 학습 세션 ID
+        """
+        with self._lock:
+            self._pending.append((session_id, word_id, bool(is_correct), get_current_datetime()))
+            if (len(self._pending) >= self.flush_threshold
+                    and not self._flush_requested and not self._retrying):
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._flush_requested = True
+                self._schedule_flush(0)
+            elif self._timer is None:
+                self._schedule_flush()
+
+    def _schedule_flush(self, delay=None):
+        """반영 타이머 시작 (_lock 보유 상태에서 호출)"""
+        self._timer = threading.Timer(self.flush_interval if delay is None else delay,
+                                      self._flush_from_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_from_timer(self):
+        """타이머 스레드에서 반영 후 스레드 전용 연결 반납"""
+        try:
+            self._flush_safely()
+        finally:
+            DBConnection.get_instance().release()
+
+    def _flush_safely(self):
+        """
+        자동 반영 (임계값/타이머)
+
+        타이머 스레드에는 예외를 받을 호출자가 없으므로 로그만 남긴다.
+        실패한 기록은 flush()가 버퍼로 되돌리고 재시도 타이머를 건다.
+        """
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"학습 결과 자동 반영 실패, 다음에 재시도: {e}")
+
+    @property
+    def pending_count(self):
+        """아직 반영되지 않은 기록 수"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """
+        누적된 기록을 한 트랜잭션으로 DB에 반영
+
+        반영에 실패하면 기록을 버퍼로 되돌려 다음 flush에서 다시 시도한다.
+
+        Returns:
+            int: 반영된 기록 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._flush_requested = False
+                pending, self._pending = self._pending, []
+
+            if not pending:
+                return 0
+
+            try:
+                self.model.apply_learning_history(pending)
+                with self._lock:
+                    self._retrying = False
+                logger.info(f"학습 결과 반영: 기록 {len(pending)}건")
+                return len(pending)
+            except Exception as e:
+                logger.error(f"학습 결과 반영 실패, 버퍼로 복원: {e}")
+                self._restore(pending)
+                raise
+
+    def _restore(self, pending):
+        """반영 실패한 기록을 버퍼 앞에 되돌리기 (그사이 추가된 기록보다 먼저)"""
+        with self._lock:
+            self._pending[:0] = pending
+            self._retrying = True
+            if self._timer is None:
+                self._schedule_flush()
+
+    def close(self):
+        """타이머 중지 후 남은 기록 반영 (세션/프로그램 종료 시)"""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"종료 시 학습 결과 반영 실패: {e}")
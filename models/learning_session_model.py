@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 학습 세션/이력 Model
+# 파일 위치: models/learning_session_model.py
+
+import logging
+from models.base_model import BaseModel
+from utils.datetime_helper import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+HISTORY_COLUMNS = ('session_id', 'word_id', 'is_correct', 'learned_at')
+
+
+class LearningHistoryModel(BaseModel):
+    """
+    학습 이력(learning_history) 테이블 전용 Model
+
+    답안 1건당 1행. 일별 통계/망각 곡선 재계산(StatisticsModel.rebuild_daily_stats)의 원본이다.
+    """
+    TABLE_NAME = 'learning_history'
+    PRIMARY_KEY = 'history_id'
+
+    def add_answers(self, history):
+        """
+        답안 이력 일괄 추가 (호출한 쪽의 트랜잭션 안에서 실행)
+
+        Args:
+            history (list): (session_id, word_id, is_correct, learned_at) 튜플 리스트
+
+        Returns:
+            list: 생성된 history_id 리스트
+        """
+        return self.insert_many(HISTORY_COLUMNS, [
+            (session_id, word_id, int(bool(is_correct)), learned_at)
+            for session_id, word_id, is_correct, learned_at in history
+        ])
+
+
+class LearningSessionModel(BaseModel):
+    """
+    학습 세션(learning_sessions) 데이터 접근 클래스
+    """
+    TABLE_NAME = 'learning_sessions'
+    PRIMARY_KEY = 'session_id'
+
+    def start_session(self, session_type, study_mode, order_type):
+        """
+        세션 시작
+
+        Args:
+            session_type (str): 'flashcard' | 'review'
+            study_mode (str): 'en_to_ko' | 'ko_to_en'
+            order_type (str): 'sequential' | 'random' | 'personalized'
+
+        Returns:
+            int: session_id
+        """
+        return self.insert({
+            'session_type': session_type,
+            'study_mode': study_mode,
+            'order_type': order_type,
+            'started_at': get_current_datetime(),
+        })
+
+    def finish_session(self, session_id, total_words, correct_count, wrong_count, duration_seconds):
+        """
+        세션 종료 및 결과 요약 저장
+
+        Args:
+            session_id (int): 세션 ID
+            total_words (int): 학습한 단어 수
+            correct_count (int): 정답 수
+            wrong_count (int): 오답 수
+            duration_seconds (int): 소요 시간
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        return self.update(session_id, {
+            'total_words': total_words,
+            'correct_count': correct_count,
+            'wrong_count': wrong_count,
+            'ended_at': get_current_datetime(),
+            'duration_seconds': duration_seconds,
+        })
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 간격 반복(SM-2) 스케줄 Model
+# 파일 위치: models/schedule_model.py
+
+import logging
+from datetime import datetime, timedelta
+from config import SQL_IN_CHUNK_SIZE
+from models.base_model import BaseModel
+from models.statistics_model import StatisticsModel
+from models.word_record import Word
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EASE = 2.5  # SM-2 초기 난이도 계수
+MIN_EASE = 1.3  # SM-2 최소 난이도 계수
+QUALITY_CORRECT = 4  # 정답 응답 품질 (0~5)
+QUALITY_WRONG = 1  # 오답 응답 품질 (0~5)
+
+
+def calculate_sm2(repetitions, interval_days, ease, is_correct):
+    """
+    SM-2 알고리즘으로 다음 복습 간격 계산
+
+    Args:
+        repetitions (int): 연속 정답 횟수
+        interval_days (float): 현재 복습 간격 (일)
+        ease (float): 난이도 계수
+        is_correct (bool): 이번 응답 정답 여부
+
+    Returns:
+        tuple: (repetitions, interval_days, ease)
+    """
+    quality = QUALITY_CORRECT if is_correct else QUALITY_WRONG
+
+    if quality < 3:
+        repetitions = 0
+        interval_days = 1
+    else:
+        if repetitions == 0:
+            interval_days = 1
+        elif repetitions == 1:
+            interval_days = 6
+        else:
+            interval_days = round(interval_days * ease)
+        repetitions += 1
+
+    ease = max(MIN_EASE, ease + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)))
+    return repetitions, interval_days, ease
+
+
+class ScheduleModel(BaseModel):
+    """
+    단어별 복습 스케줄(word_schedule) 전용 Model
+
+    due_at 인덱스로 "복습할 때가 된 단어 N개"를 정렬 없이 범위 조회한다.
+    한 번도 학습하지 않은 단어는 스케줄 행이 없으며 get_new_words()로 조회한다.
+    """
+    TABLE_NAME = 'word_schedule'
+    PRIMARY_KEY = 'word_id'
+
+    def __init__(self):
+        super().__init__()
+        self.statistics = StatisticsModel()
+
+    def record_reviews(self, answers):
+        """
+        학습 결과를 스케줄에 반영 (WordModel의 통계 업데이트 경로에서 호출)
+
+        답안을 시각 순서대로 한 건씩 SM-2에 적용하고, 같은 단어의 직전 답안(이전 기록 또는
+        같은 묶음의 앞선 답안)이 있으면 두 답안 시각의 간격으로 복습 간격별 정답률
+        집계(retention_stats)에 반영한다. 반영 시각이 아니라 답안 시각을 쓰므로
+        StatisticsModel.rebuild_daily_stats()의 재계산과 같은 값이 된다.
+
+        Args:
+            answers (iterable): (word_id, is_correct, reviewed_at) 튜플 (reviewed_at은 ISO 문자열)
+
+        Returns:
+            int: 갱신한 단어 수
+        """
+        answers = sorted(answers, key=lambda answer: answer[2])
+        if not answers:
+            return 0
+
+        try:
+            word_ids = list(dict.fromkeys(word_id for word_id, _, _ in answers))
+            state = {}
+            for start in range(0, len(word_ids), SQL_IN_CHUNK_SIZE):
+                chunk = word_ids[start:start + SQL_IN_CHUNK_SIZE]
+                placeholders = ', '.join(['?' for _ in chunk])
+                query = (f"SELECT word_id, repetitions, interval_days, ease, last_reviewed_at "
+                         f"FROM {self.TABLE_NAME} WHERE word_id IN ({placeholders})")
+                for row in self.db.execute_query(query, tuple(chunk)):
+                    state[row['word_id']] = (row['repetitions'], row['interval_days'], row['ease'],
+                                             row['last_reviewed_at'])
+
+            due = {}
+            retention = {}
+            for word_id, is_correct, reviewed_at in answers:
+                repetitions, interval_days, ease, last_reviewed_at = state.get(
+                    word_id, (0, 0, DEFAULT_EASE, None))
+                reviewed = datetime.fromisoformat(reviewed_at)
+                if last_reviewed_at:
+                    gap = max(0, (reviewed - datetime.fromisoformat(last_reviewed_at)).days)
+                    bucket = retention.setdefault(gap, [0, 0])
+                    bucket[0] += int(bool(is_correct))
+                    bucket[1] += 1
+                repetitions, interval_days, ease = calculate_sm2(
+                    repetitions, interval_days, ease, is_correct)
+                state[word_id] = (repetitions, interval_days, ease, reviewed_at)
+                due[word_id] = reviewed + timedelta(days=interval_days)
+
+            rows = [(word_id, *state[word_id][:3], due_at.isoformat(timespec='seconds'),
+                     state[word_id][3])
+                    for word_id, due_at in due.items()]
+            self.db.execute_many(
+                f"INSERT OR REPLACE INTO {self.TABLE_NAME} "
+                f"(word_id, repetitions, interval_days, ease, due_at, last_reviewed_at) "
+                f"VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.statistics.record_retention(retention)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"복습 스케줄 갱신 실패: {e}")
+            raise
+
+    def get_due_words(self, limit, now=None):
+        """
+        복습 예정 시각이 지난 단어 조회 (due_at 오름차순, 인덱스 범위 조회)
+
+        Args:
+            limit (int): 최대 단어 수
+            now (datetime, optional): 기준 시각 (기본: 현재)
+
+        Returns:
+            list: Word 리스트
+        """
+        try:
+            now = (now or datetime.now()).isoformat(timespec='seconds')
+            # CROSS JOIN: due_at 인덱스를 바깥 루프로 고정해 정렬 없이 LIMIT에서 멈추게 함
+            query = (f"SELECT w.* FROM {self.TABLE_NAME} s "
+                     f"CROSS JOIN words w ON w.word_id = s.word_id "
+                     f"WHERE s.due_at <= ? AND w.is_deleted = 0 "
+                     f"ORDER BY s.due_at LIMIT ?")
+            return self.db.execute_query(query, (now, limit), record_type=Word)
+        except Exception as e:
+            logger.error(f"복습 예정 단어 조회 실패: {e}")
+            raise
+
+    def get_new_words(self, limit):
+        """
+        아직 한 번도 학습하지 않은 단어 조회 (등록 순)
+
+        Args:
+            limit (int): 최대 단어 수
+
+        Returns:
+            list: Word 리스트
+        """
+        try:
+            query = (f"SELECT w.* FROM words w "
+                     f"WHERE w.is_deleted = 0 AND NOT EXISTS "
+                     f"(SELECT 1 FROM {self.TABLE_NAME} s WHERE s.word_id = w.word_id) "
+                     f"ORDER BY w.word_id LIMIT ?")
+            return self.db.execute_query(query, (limit,), record_type=Word)
+        except Exception as e:
+            logger.error(f"신규 단어 조회 실패: {e}")
+            raise
+
+    def get_study_queue(self, limit, now=None):
+        """
+        학습 대기열: 복습 예정 단어를 먼저, 부족하면 신규 단어로 채움
+
+        Args:
+            limit (int): 최대 단어 수
+            now (datetime, optional): 기준 시각 (기본: 현재)
+
+        Returns:
+            list: Word 리스트
+        """
+        words = self.get_due_words(limit, now)
+        if len(words) < limit:
+            words += self.get_new_words(limit - len(words))
+        return words
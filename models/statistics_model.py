@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 일별 통계 집계 Model
+# 파일 위치: models/statistics_model.py
+
+import logging
+from datetime import date, timedelta
+from models.base_model import BaseModel
+from utils.datetime_helper import get_current_date
+
+logger = logging.getLogger(__name__)
+
+RETENTION_MAX_GAP_DAYS = 60  # 망각 곡선 집계 시 이보다 긴 복습 간격은 한 구간으로 묶음
+
+
+class ColumnArrays:
+    """
+    execute_query(record_type=ColumnArrays)용 결과 타입: 컬럼명 -> NumPy 배열 dict
+
+    numpy는 통계 화면에서만 필요하므로 처음 변환할 때 가져온다.
+    """
+
+    @classmethod
+    def from_rows(cls, columns, rows):
+        """
+        SELECT 결과(튜플 행)를 컬럼별 배열로 변환
+
+        Args:
+            columns (tuple): 조회한 컬럼명
+            rows (list): 값 튜플 리스트
+
+        Returns:
+            dict: 컬럼명 -> numpy.ndarray
+        """
+        import numpy as np
+        if not rows:
+            return {column: np.empty(0) for column in columns}
+        return {column: np.asarray(values) for column, values in zip(columns, zip(*rows))}
+
+
+class StatisticsModel(BaseModel):
+    """
+    일별 통계 집계(daily_stats) 데이터 접근 클래스
+
+    학습/시험 결과가 기록될 때마다 해당 날짜 행을 증분 갱신하므로
+    주간/월간/연속 학습일 조회는 이력 전체가 아니라 날짜 행 몇 개만 읽는다.
+    복습 간격별 정답률(retention_stats)도 같은 방식으로 누적한다.
+    rebuild_daily_stats()는 두 집계를 원본 이력(learning_history, exam_history)에서 다시 계산한다.
+    """
+    TABLE_NAME = 'daily_stats'
+    PRIMARY_KEY = 'stat_date'
+
+    def record_answers(self, correct_count, wrong_count, stat_date=None):
+        """
+        답안 수 증분 반영
+
+        Args:
+            correct_count (int): 정답 수
+            wrong_count (int): 오답 수
+            stat_date (str, optional): YYYY-MM-DD (기본: 오늘)
+        """
+        if not correct_count and not wrong_count:
+            return
+        self.record_answers_by_date({stat_date or get_current_date(): (correct_count, wrong_count)})
+
+    def record_answers_by_date(self, counts):
+        """
+        날짜별 답안 수 증분 반영
+
+        Args:
+            counts (dict): YYYY-MM-DD -> (정답 수, 오답 수)
+        """
+        try:
+            self.db.execute_many(
+                f"INSERT INTO {self.TABLE_NAME} (stat_date, correct_count, wrong_count) "
+                f"VALUES (?, ?, ?) "
+                f"ON CONFLICT(stat_date) DO UPDATE SET "
+                f"correct_count = correct_count + excluded.correct_count, "
+                f"wrong_count = wrong_count + excluded.wrong_count",
+                [(stat_date, correct, wrong) for stat_date, (correct, wrong) in counts.items()]
+            )
+        except Exception as e:
+            logger.error(f"일별 학습 통계 반영 실패: {e}")
+            raise
+
+    def record_exam(self, score, stat_date=None):
+        """
+        시험 1회 증분 반영
+
+        Args:
+            score (float): 점수
+            stat_date (str, optional): YYYY-MM-DD (기본: 오늘)
+        """
+        try:
+            self.db.execute_update(
+                f"INSERT INTO {self.TABLE_NAME} (stat_date, exam_count, exam_score_sum) "
+                f"VALUES (?, 1, ?) "
+                f"ON CONFLICT(stat_date) DO UPDATE SET "
+                f"exam_count = exam_count + 1, "
+                f"exam_score_sum = exam_score_sum + excluded.exam_score_sum",
+                (stat_date or get_current_date(), score)
+            )
+        except Exception as e:
+            logger.error(f"일별 시험 통계 반영 실패: {e}")
+            raise
+
+    def record_retention(self, buckets):
+        """
+        복습 간격별 정답/응답 수 증분 반영 (망각 곡선 집계)
+
+        Args:
+            buckets (dict): 간격(일) -> (정답 수, 응답 수)
+        """
+        if not buckets:
+            return
+        try:
+            self.db.execute_many(
+                "INSERT INTO retention_stats (gap_days, correct_count, total_count) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT(gap_days) DO UPDATE SET "
+                "correct_count = correct_count + excluded.correct_count, "
+                "total_count = total_count + excluded.total_count",
+                [(min(gap, RETENTION_MAX_GAP_DAYS), correct, total)
+                 for gap, (correct, total) in buckets.items()]
+            )
+        except Exception as e:
+            logger.error(f"망각 곡선 통계 반영 실패: {e}")
+            raise
+
+    def get_daily_stats(self, start_date, end_date):
+        """
+        기간 내 일별 통계 (기록 없는 날은 빠짐)
+
+        Args:
+            start_date (str): 시작일 YYYY-MM-DD (포함)
+            end_date (str): 종료일 YYYY-MM-DD (포함)
+
+        Returns:
+            list: 일별 통계 리스트 (날짜순)
+        """
+        return self.find_all(where_clause="stat_date BETWEEN ? AND ?",
+                             params=(start_date, end_date), order_by="stat_date")
+
+    def get_period_summary(self, start_date, end_date):
+        """
+        기간 합계
+
+        Returns:
+            dict: {'correct_count', 'wrong_count', 'accuracy', 'exam_count', 'exam_average', 'study_days'}
+        """
+        rows = self.db.execute_query(
+            f"SELECT COALESCE(SUM(correct_count), 0) AS correct_count, "
+            f"COALESCE(SUM(wrong_count), 0) AS wrong_count, "
+            f"COALESCE(SUM(exam_count), 0) AS exam_count, "
+            f"COALESCE(SUM(exam_score_sum), 0) AS exam_score_sum, "
+            f"COUNT(*) AS study_days "
+            f"FROM {self.TABLE_NAME} WHERE stat_date BETWEEN ? AND ?",
+            (start_date, end_date)
+        )
+        row = rows[0]
+        answered = row['correct_count'] + row['wrong_count']
+        return {
+            'correct_count': row['correct_count'],
+            'wrong_count': row['wrong_count'],
+            'accuracy': row['correct_count'] / answered if answered else 0.0,
+            'exam_count': row['exam_count'],
+            'exam_average': row['exam_score_sum'] / row['exam_count'] if row['exam_count'] else 0.0,
+            'study_days': row['study_days'],
+        }
+
+    def get_week_stats(self, today=None):
+        """최근 7일(오늘 포함) 일별 통계"""
+        today = today or date.today()
+        return self.get_daily_stats((today - timedelta(days=6)).isoformat(), today.isoformat())
+
+    def get_month_stats(self, year, month):
+        """해당 월 일별 통계"""
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return self.get_daily_stats(start.isoformat(), end.isoformat())
+
+    def get_streak(self, today=None):
+        """
+        연속 학습일 수 (오늘 또는 어제까지 이어진 날 수)
+
+        Args:
+            today (date, optional): 기준일 (기본: 오늘)
+
+        Returns:
+            int: 연속 학습일 수
+        """
+        today = today or date.today()
+        latest = self.db.execute_query(
+            f"SELECT MAX(stat_date) AS stat_date FROM {self.TABLE_NAME} WHERE stat_date <= ?",
+            (today.isoformat(),)
+        )[0]['stat_date']
+        if latest is None or date.fromisoformat(latest) < today - timedelta(days=1):
+            return 0
+
+        # 마지막 연속 구간의 시작일: 전날 기록이 없는 가장 최근 날짜 (PK 역순으로 구간 길이만큼만 읽음)
+        start = self.db.execute_query(
+            f"SELECT d.stat_date FROM {self.TABLE_NAME} d "
+            f"WHERE d.stat_date <= ? AND NOT EXISTS ("
+            f"SELECT 1 FROM {self.TABLE_NAME} p WHERE p.stat_date = date(d.stat_date, '-1 day')) "
+            f"ORDER BY d.stat_date DESC LIMIT 1",
+            (latest,)
+        )[0]['stat_date']
+        return (date.fromisoformat(latest) - date.fromisoformat(start)).days + 1
+
+    def get_daily_arrays(self, start_date, end_date):
+        """
+        기간 내 일별 통계를 컬럼별 배열로 조회
+
+        Returns:
+            dict: stat_date, correct_count, wrong_count, exam_count, exam_score_sum 배열
+        """
+        return self.db.execute_query(
+            f"SELECT stat_date, correct_count, wrong_count, exam_count, exam_score_sum "
+            f"FROM {self.TABLE_NAME} WHERE stat_date BETWEEN ? AND ? ORDER BY stat_date",
+            (start_date, end_date), record_type=ColumnArrays
+        )
+
+    def get_word_stat_arrays(self):
+        """
+        활성 단어 전체의 학습 통계를 컬럼별 배열로 조회
+
+        Returns:
+            dict: word_id, english, correct_count, wrong_count 배열
+        """
+        return self.db.execute_query(
+            "SELECT word_id, english, correct_count, wrong_count FROM words WHERE is_deleted = 0",
+            record_type=ColumnArrays
+        )
+
+    def get_retention_arrays(self):
+        """
+        복습 간격(일)별 정답 수/응답 수 (망각 곡선용, 최대 RETENTION_MAX_GAP_DAYS + 1행)
+
+        Returns:
+            dict: gap_days, correct_count, total_count 배열
+        """
+        return self.db.execute_query(
+            "SELECT gap_days, correct_count, total_count FROM retention_stats ORDER BY gap_days",
+            record_type=ColumnArrays
+        )
+
+    def rebuild_daily_stats(self):
+        """
+        원본 이력에서 일별 통계와 망각 곡선 집계 전체 재계산
+
+        학습 이력(learning_history)과 종료된 시험의 문제/결과(exam_questions, exam_history)를
+        날짜별로, 두 답안 이력을 합쳐 복습 간격별로 다시 집계한다.
+
+        Returns:
+            int: 재계산된 날짜 수
+        """
+        try:
+            with self.db.transaction():
+                self.db.execute_update(f"DELETE FROM {self.TABLE_NAME}")
+                self.db.execute_update(
+                    f"INSERT INTO {self.TABLE_NAME} "
+                    f"(stat_date, correct_count, wrong_count, exam_count, exam_score_sum) "
+                    f"SELECT stat_date, SUM(correct_count), SUM(wrong_count), "
+                    f"SUM(exam_count), SUM(exam_score_sum) FROM ("
+                    f"  SELECT substr(learned_at, 1, 10) AS stat_date, "
+                    f"  SUM(is_correct = 1) AS correct_count, SUM(is_correct = 0) AS wrong_count, "
+                    f"  0 AS exam_count, 0 AS exam_score_sum "
+                    f"  FROM learning_history GROUP BY 1 "
+                    f"  UNION ALL "
+                    f"  SELECT substr(h.ended_at, 1, 10), SUM(q.is_correct = 1), "
+                    f"  SUM(COALESCE(q.is_correct, 0) = 0), 0, 0 "
+                    f"  FROM exam_questions q JOIN exam_history h ON h.exam_id = q.exam_id "
+                    f"  WHERE h.ended_at IS NOT NULL GROUP BY 1 "
+                    f"  UNION ALL "
+                    f"  SELECT substr(ended_at, 1, 10), 0, 0, COUNT(*), SUM(score) "
+                    f"  FROM exam_history WHERE ended_at IS NOT NULL GROUP BY 1"
+                    f") GROUP BY stat_date"
+                )
+                # 같은 단어의 직전 학습(플래시카드 또는 시험)과의 간격별 집계
+                self.db.execute_update("DELETE FROM retention_stats")
+                self.db.execute_update(
+                    "INSERT INTO retention_stats (gap_days, correct_count, total_count) "
+                    "SELECT MIN(gap, ?), SUM(is_correct), COUNT(*) FROM ("
+                    "  SELECT is_correct, CAST(julianday(learned_at) - julianday("
+                    "    LAG(learned_at) OVER (PARTITION BY word_id ORDER BY learned_at)) AS INTEGER) AS gap "
+                    "  FROM ("
+                    "    SELECT word_id, is_correct, learned_at FROM learning_history "
+                    "    UNION ALL "
+                    "    SELECT q.word_id, COALESCE(q.is_correct, 0), h.ended_at "
+                    "    FROM exam_questions q JOIN exam_history h ON h.exam_id = q.exam_id "
+                    "    WHERE h.ended_at IS NOT NULL"
+                    "  )"
+                    ") WHERE gap IS NOT NULL GROUP BY 1",
+                    (RETENTION_MAX_GAP_DAYS,)
+                )
+                count = self.db.execute_query(f"SELECT COUNT(*) AS n FROM {self.TABLE_NAME}")[0]['n']
+            logger.info(f"일별 통계 재계산 완료: {count}일")
+            return count
+        except Exception as e:
+            logger.error(f"일별 통계 재계산 실패: {e}")
+            raise
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 단어 조회 캐시 (LRU + identity map)
+# 파일 위치: models/word_cache.py
+
+import re
+import threading
+from collections import OrderedDict
+from config import WORD_CACHE_MAX_WORDS, WORD_CACHE_MAX_LIST_ROWS
+
+
+class WordCache:
+    """
+    WordModel 앞단의 읽기 캐시
+
+    - 단어 캐시: word_id -> 단어 레코드 (LRU, 최대 max_words개)
+    - 목록 캐시: (종류, 정렬) -> 단어 레코드 리스트 (전체 행 수 최대 max_list_rows)
+
+    레코드는 dict 또는 models.word_record.Word처럼 word['컬럼'] 접근을 지원하는 객체.
+    같은 단어는 단어 캐시와 목록 캐시에서 같은 객체를 공유하므로(identity map)
+    patch()로 한 번 고치면 모든 캐시에 반영된다. 반환된 레코드는 수정하지 않아야 한다.
+    """
+
+    def __init__(self, max_words=WORD_CACHE_MAX_WORDS, max_list_rows=WORD_CACHE_MAX_LIST_ROWS):
+        self.max_words = max_words
+        self.max_list_rows = max_list_rows
+        self._words = OrderedDict()
+        self._lists = OrderedDict()
+        self._list_index = {}  # 목록 캐시에 들어있는 word_id -> 레코드
+        self._list_refs = {}  # word_id -> 그 단어를 담은 목록 수 (0이 되면 _list_index에서 제거)
+        self._list_rows = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+        self.generation = 0  # 단어 추가/수정/삭제(목록 무효화)마다 증가 (외부 파생 결과의 유효성 확인용)
+
+    # ---------- 조회 ----------
+
+    def get_word(self, word_id):
+        """
+        단어 조회 (없으면 None)
+
+        Args:
+            word_id (int): 단어 ID
+
+        Returns:
+            캐시된 단어 레코드 또는 None
+        """
+        with self._lock:
+            word = self._words.get(word_id)
+            if word is not None:
+                self._words.move_to_end(word_id)
+            else:
+                word = self._list_index.get(word_id)
+                if word is not None:
+                    self._put_word(word)
+
+            if word is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return word
+
+    def put_word(self, word):
+        """
+        단어 저장 (이미 캐시된 객체가 있으면 그 객체를 반환)
+
+        Args:
+            word: word_id를 포함한 단어 레코드
+
+        Returns:
+            캐시에 저장된 레코드
+        """
+        with self._lock:
+            word = self._list_index.get(word['word_id'], word)
+            self._put_word(word)
+            return word
+
+    def _put_word(self, word):
+        """LRU 저장 및 초과분 제거 (_lock 보유 상태에서 호출)"""
+        self._words[word['word_id']] = word
+        self._words.move_to_end(word['word_id'])
+        while len(self._words) > self.max_words:
+            self._words.popitem(last=False)
+
+    def get_list(self, key):
+        """
+        목록 조회
+
+        Args:
+            key (tuple): 목록 키 (예: ('active', 'english'))
+
+        Returns:
+            list: 캐시된 목록의 복사본 또는 None
+        """
+        with self._lock:
+            words = self._lists.get(key)
+            if words is None:
+                self._misses += 1
+                return None
+            self._lists.move_to_end(key)
+            self._hits += 1
+            return list(words)
+
+    def put_list(self, key, words):
+        """
+        목록 저장 (예산을 넘는 목록은 저장하지 않음)
+
+        Args:
+            key (tuple): 목록 키
+            words (list): 단어 레코드 리스트
+
+        Returns:
+            list: 캐시 객체로 치환된 목록
+        """
+        with self._lock:
+            if len(words) > self.max_list_rows:
+                return words
+
+            if key in self._lists:
+                self._drop_list(key)
+
+            shared = []
+            for word in words:
+                word_id = word['word_id']
+                cached = self._list_index.get(word_id) or self._words.get(word_id) or word
+                self._list_index[word_id] = cached
+                self._list_refs[word_id] = self._list_refs.get(word_id, 0) + 1
+                shared.append(cached)
+
+            self._lists[key] = shared
+            self._list_rows += len(shared)
+
+            while self._list_rows > self.max_list_rows:
+                self._drop_list(next(iter(self._lists)))
+            return list(shared)
+
+    def _drop_list(self, key):
+        """
+        목록 하나 제거 (_lock 보유 상태에서 호출)
+
+        그 목록의 행만 훑어 다른 목록이 더 이상 참조하지 않는 단어를 인덱스에서 뺀다.
+        """
+        words = self._lists.pop(key)
+        self._list_rows -= len(words)
+        for word in words:
+            word_id = word['word_id']
+            remaining = self._list_refs[word_id] - 1
+            if remaining:
+                self._list_refs[word_id] = remaining
+            else:
+                del self._list_refs[word_id]
+                del self._list_index[word_id]
+
+    def _reset_lists(self):
+        """목록 전체 제거 (_lock 보유 상태에서 호출, 행 수와 무관하게 O(1))"""
+        self._lists = OrderedDict()
+        self._list_index = {}
+        self._list_refs = {}
+        self._list_rows = 0
+
+    # ---------- 무효화 / 갱신 ----------
+
+    def patch(self, word_id, updater, columns=()):
+        """
+        캐시된 단어를 제자리에서 갱신 (모든 목록에 함께 반영)
+
+        값이 바뀐 컬럼으로 정렬된 목록은 순서가 틀어지므로 제거한다.
+
+        Args:
+            word_id (int): 단어 ID
+            updater (callable): 단어 레코드를 받아 수정하는 함수
+            columns (iterable): updater가 바꾸는 컬럼
+        """
+        with self._lock:
+            word = self._words.get(word_id) or self._list_index.get(word_id)
+            if word is None:
+                return
+            updater(word)
+            if columns:
+                columns = set(columns)
+                for key in [key for key in self._lists if columns & _sort_columns(key)]:
+                    self._drop_list(key)
+
+    def invalidate(self, word_id):
+        """단어 하나와 모든 목록 무효화 (정렬/포함 여부가 바뀔 수 있는 변경)"""
+        with self._lock:
+            self._words.pop(word_id, None)
+            self.invalidate_lists()
+
+    def invalidate_lists(self, kind=None):
+        """
+        목록 캐시 무효화
+
+        Args:
+            kind (str, optional): 목록 종류 (None이면 전체)
+        """
+        with self._lock:
+            if kind is None:
+                self._reset_lists()
+            else:
+                for key in [key for key in self._lists if key[0] == kind]:
+                    self._drop_list(key)
+            self.generation += 1
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._words.clear()
+            self._reset_lists()
+            self.generation += 1
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'words', 'lists', 'list_rows'}
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / total if total else 0.0,
+                'words': len(self._words),
+                'lists': len(self._lists),
+                'list_rows': self._list_rows,
+            }
+
+
+def _sort_columns(key):
+    """목록 키 (종류, ORDER BY 절)에서 정렬에 쓰인 컬럼 이름 집합"""
+    return set(re.findall(r'\w+', key[1])) if len(key) > 1 else set()
@@ -2,10 +2,27 @@
 # 파일 위치: models/word_model.py
 
 import logging
+import sqlite3
+import time
+from itertools import islice
+from config import IMPORT_CHUNK_SIZE, SQL_IN_CHUNK_SIZE, WORD_PAGE_SIZE
+from database.db_connection import DBConnection
 from models.base_model import BaseModel
+from models.distractor_index import DistractorIndex
+from models.learning_session_model import LearningHistoryModel
+from models.schedule_model import ScheduleModel
+from models.statistics_model import StatisticsModel
+from models.word_cache import WordCache
+from models.word_record import Word
+from models.word_sampler import WordSampler
+from utils.datetime_helper import get_current_datetime
+from utils.hangul import (contains_hangul, decompose_jamo, get_chosung,
+                          is_chosung_only, prefix_upper_bound)
 
 logger = logging.getLogger(__name__)
 
+FTS_MIN_KEYWORD_LENGTH = 3  # trigram 토크나이저가 인덱스를 사용할 수 있는 최소 길이
+
 
 class WordModel(BaseModel):
     """
@@ -14,23 +31,162 @@ class WordModel(BaseModel):
     TABLE_NAME = 'words'
     PRIMARY_KEY = 'word_id'
 
-    def get_all_active_words(self, order_by='english'):
+    # 목록 화면용 컬럼 (memo 등 긴 텍스트 제외)
+    LIST_COLUMNS = ('word_id', 'english', 'korean', 'is_favorite',
+                    'correct_count', 'wrong_count', 'last_learned_at', 'error_rate')
+
+    # 목록 화면에서 정렬할 수 있는 컬럼 (NULL이 없고 (is_deleted, 컬럼, word_id) 인덱스가 있는 컬럼)
+    # 오답률 순위는 get_top_error_words()가 담당
+    SORTABLE_COLUMNS = ('english', 'korean', 'correct_count', 'wrong_count', 'created_at')
+
+    # 모든 WordModel 인스턴스가 공유하는 조회 캐시 (쓰기 메서드에서 갱신/무효화)
+    cache = WordCache()
+    # 오답률 가중 추출용 샘플러 (처음 추출할 때 구성, 이후 쓰기 메서드에서 증분 갱신)
+    sampler = WordSampler()
+    # 객관식 오답 선택지 인덱스 (처음 사용할 때 구성, 이후 쓰기 메서드에서 증분 갱신)
+    distractors = DistractorIndex()
+
+    def __init__(self):
+        super().__init__()
+        self.schedule = ScheduleModel()
+        self.daily_stats = StatisticsModel()
+        self.history = LearningHistoryModel()
+
+    def find_by_pk(self, pk_value):
+        """
+        word_id로 단어 조회 (캐시 우선)
+
+        Args:
+            pk_value: word_id
+
+        Returns:
+            Word: 조회 결과 또는 None (캐시와 공유되므로 수정하지 말 것)
+        """
+        word = self.cache.get_word(pk_value)
+        if word is None:
+            word = super().find_by_pk(pk_value, record_type=Word)
+            if word is not None:
+                word = self.cache.put_word(word)
+        return word
+
+    def delete(self, pk_value, soft=True):
+        """단어 삭제 (BaseModel.delete + 캐시 무효화)"""
+        result = super().delete(pk_value, soft=soft)
+        self.cache.invalidate(pk_value)
+        self.sampler.remove_word(pk_value)
+        self.distractors.remove_word(pk_value)
+        return result
+
+    @classmethod
+    def cache_info(cls):
+        """조회 캐시 통계 (hits, misses, hit_rate 등)"""
+        return cls.cache.stats()
+
+    def get_all_active_words(self, order_by='english', columns=None, limit=None, after=None):
         """
         삭제되지 않은 모든 단어 조회
         
         Args:
             order_by (str): 정렬 기준 컬럼
+            columns (list, optional): 조회할 컬럼 (예: LIST_COLUMNS)
+            limit (int, optional): 페이지 크기
+            after (optional): 직전 페이지 마지막 행의 정렬 컬럼 값
             
         Returns:
             list: 단어 목록
         """
         try:
             where_clause = "is_deleted = 0"
-            return self.find_all(where_clause=where_clause, order_by=order_by)
+            if columns or limit or after is not None:
+                # 페이지/컬럼 지정 조회는 캐시하지 않음
+                return self.find_all(where_clause=where_clause, order_by=order_by,
+                                     limit=limit, columns=columns, after=after, record_type=Word)
+
+            key = ('active', order_by)
+            words = self.cache.get_list(key)
+            if words is None:
+                words = self.cache.put_list(
+                    key, self.find_all(where_clause=where_clause, order_by=order_by,
+                                       record_type=Word))
+            return words
         except Exception as e:
             logger.error(f"활성 단어 조회 실패: {e}")
             raise
 
+    def get_word_page(self, sort_column='english', descending=False, keyword=None,
+                      favorites_only=False, after=None, limit=WORD_PAGE_SIZE):
+        """
+        단어 목록 한 페이지 (정렬/필터를 SQL에서 처리하는 키셋 페이지네이션)
+
+        Args:
+            sort_column (str): 정렬 컬럼 (SORTABLE_COLUMNS 중 하나)
+            descending (bool): 내림차순 여부
+            keyword (str, optional): 영어/한국어 부분 문자열 또는 초성 필터
+            favorites_only (bool): 즐겨찾기만
+            after (optional): 직전 페이지 마지막 행의 커서 (page_cursor() 결과)
+            limit (int): 페이지 크기
+
+        Returns:
+            list: Word 리스트 (LIST_COLUMNS와 정렬 컬럼만 채워짐)
+        """
+        if sort_column not in self.SORTABLE_COLUMNS:
+            raise ValueError(f"정렬할 수 없는 컬럼: {sort_column}")
+
+        try:
+            direction = 'DESC' if descending else 'ASC'
+            # english는 UNIQUE라 단독으로 커서가 되고, 나머지는 word_id로 순서를 확정
+            if sort_column == 'english':
+                order_by = f"english {direction}"
+            else:
+                order_by = f"{sort_column} {direction}, word_id {direction}"
+
+            conditions = ["is_deleted = 0"]
+            params = []
+            if favorites_only:
+                conditions.append("is_favorite = 1")
+            keyword = (keyword or '').strip()
+            if keyword:
+                clause, keyword_params = self._keyword_filter(keyword)
+                conditions.append(clause)
+                params.extend(keyword_params)
+
+            # 커서를 만들 수 있도록 정렬 컬럼은 항상 조회
+            columns = self.LIST_COLUMNS
+            if sort_column not in columns:
+                columns += (sort_column,)
+
+            return self.find_all(where_clause=" AND ".join(conditions), params=tuple(params),
+                                 order_by=order_by, limit=limit, columns=columns,
+                                 after=after, record_type=Word)
+        except Exception as e:
+            logger.error(f"단어 페이지 조회 실패: {e}")
+            raise
+
+    @staticmethod
+    def page_cursor(word, sort_column='english'):
+        """get_word_page(after=...)에 넘길 커서 (페이지 마지막 단어 기준)"""
+        if sort_column == 'english':
+            return word['english']
+        return (word[sort_column], word['word_id'])
+
+    def _keyword_filter(self, keyword):
+        """
+        목록 필터 조건 (search_words와 같은 인덱스 사용)
+
+        Returns:
+            tuple: (WHERE 조건 str, 파라미터 list)
+        """
+        if is_chosung_only(keyword):
+            prefix = keyword.replace(' ', '')
+            return ("word_id IN (SELECT word_id FROM word_korean_index "
+                    "WHERE chosung >= ? AND chosung < ?)", [prefix, prefix_upper_bound(prefix)])
+        if len(keyword) < FTS_MIN_KEYWORD_LENGTH:
+            pattern = _like_pattern(keyword)
+            return ("(english LIKE ? ESCAPE '\\' OR korean LIKE ? ESCAPE '\\')",
+                    [pattern, pattern])
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        return "word_id IN (SELECT rowid FROM words_fts WHERE words_fts MATCH ?)", [phrase]
+
     def get_favorites(self):
         """
         즐겨찾기 단어 조회
@@ -39,39 +195,183 @@ class WordModel(BaseModel):
             list: 즐겨찾기 단어 목록
         """
         try:
-            where_clause = "is_favorite = 1 AND is_deleted = 0"
-            return self.find_all(where_clause=where_clause, order_by='english')
+            key = ('favorites', 'english')
+            words = self.cache.get_list(key)
+            if words is None:
+                where_clause = "is_favorite = 1 AND is_deleted = 0"
+                words = self.cache.put_list(
+                    key, self.find_all(where_clause=where_clause, order_by='english',
+                                       record_type=Word))
+            return words
         except Exception as e:
             logger.error(f"즐겨찾기 조회 실패: {e}")
             raise
 
-    def search_words(self, keyword, search_type='all'):
+    def search_words(self, keyword, search_type='all', limit=None, ranked=False):
         """
         단어 검색
-        
+
+        3글자 이상 키워드는 FTS5 trigram 인덱스(words_fts)로 부분 문자열을 찾고,
+        trigram이 만들어지지 않는 짧은 키워드는 LIKE 검색으로 처리한다.
+        한국어 검색('korean', 'all')에서는 초성만 입력하면 초성 접두어로,
+        조합 중인 한글이 있으면 자모 접두어로도 찾는다 (word_korean_index).
+
         Args:
             keyword (str): 검색 키워드
             search_type (str): 'english', 'korean', 'all'
-            
+            limit (int, optional): 최대 결과 수
+            ranked (bool): True면 관련도(bm25) 순, False면 영어 알파벳 순
+
         Returns:
             list: 검색 결과
         """
         try:
-            if search_type == 'english':
-                where_clause = "english LIKE ? AND is_deleted = 0"
-            elif search_type == 'korean':
-                where_clause = "korean LIKE ? AND is_deleted = 0"
-            else:  # all
-                where_clause = "(english LIKE ? OR korean LIKE ?) AND is_deleted = 0"
-                params = (f'%{keyword}%', f'%{keyword}%')
-                return self.find_all(where_clause=where_clause, params=params, order_by='english')
-            
-            params = (f'%{keyword}%',)
-            return self.find_all(where_clause=where_clause, params=params, order_by='english')
+            keyword = (keyword or '').strip()
+
+            if search_type != 'english' and is_chosung_only(keyword):
+                return self._search_words_korean_prefix('chosung', keyword.replace(' ', ''), limit)
+
+            results = self._search_words_substring(keyword, search_type, limit, ranked)
+
+            if search_type != 'english' and contains_hangul(keyword):
+                # 입력 중인 음절('사고' → '사과')은 자모 접두어로 보충
+                found = {word['word_id'] for word in results}
+                extra = [word for word in
+                         self._search_words_korean_prefix('jamo', decompose_jamo(keyword), limit)
+                         if word['word_id'] not in found]
+                if extra:
+                    results += extra
+                    if not ranked:
+                        results.sort(key=lambda word: word['english'])
+                    if limit:
+                        results = results[:limit]
+
+            return results
         except Exception as e:
             logger.error(f"단어 검색 실패 (키워드={keyword}): {e}")
             raise
 
+    def search_words_prefix(self, keyword, search_type='all', limit=None):
+        """
+        완전/접두어 일치 단어 검색 (인덱스 범위 검색)
+
+        영어는 lower(english) 인덱스로 대소문자 무시 접두어를, 한글 키워드는
+        자모 인덱스로 뜻 앞부분 일치를 찾는다. search_words 결과가 잘릴 때
+        관련도가 높은 단어를 빠뜨리지 않도록 먼저 조회하는 용도다.
+
+        Args:
+            keyword (str): 검색 키워드
+            search_type (str): 'english', 'korean', 'all'
+            limit (int, optional): 종류별 최대 결과 수
+
+        Returns:
+            list: 검색 결과 (영어 접두어 일치 → 뜻 접두어 일치, 중복 없음)
+        """
+        try:
+            keyword = (keyword or '').strip()
+            if not keyword or (search_type != 'english' and is_chosung_only(keyword)):
+                return []
+
+            results = []
+            if search_type != 'korean':
+                needle = keyword.lower()
+                # 통계(ANALYZE) 없이는 플래너가 is_deleted 인덱스 + 정렬을 고르므로 인덱스를 지정
+                query = (f"SELECT * FROM {self.TABLE_NAME} INDEXED BY idx_words_active_english_lower "
+                         f"WHERE lower(english) >= ? AND lower(english) < ? AND is_deleted = 0 "
+                         f"ORDER BY lower(english)")
+                params = [needle, prefix_upper_bound(needle)]
+                if limit:
+                    query += " LIMIT ?"
+                    params.append(limit)
+                results = self.db.execute_query(query, tuple(params), record_type=Word)
+
+            if search_type != 'english' and contains_hangul(keyword):
+                found = {word['word_id'] for word in results}
+                results += [word for word in
+                            self._search_words_korean_prefix('jamo', decompose_jamo(keyword), limit)
+                            if word['word_id'] not in found]
+            return results
+        except Exception as e:
+            logger.error(f"접두어 검색 실패 (키워드={keyword}): {e}")
+            raise
+
+    @staticmethod
+    def matches_keyword(word, keyword, search_type='all'):
+        """
+        단어 하나가 search_words(keyword, search_type) 결과에 포함되는지 메모리에서 판정
+
+        이전 검색 결과를 더 긴 키워드로 다시 거를 때 사용하며, 조건은 search_words와 같다
+        (초성 접두어 / 대소문자 무시 부분 문자열 / 자모 접두어).
+
+        Args:
+            word: 단어 레코드 (english, korean 포함)
+            keyword (str): 검색 키워드
+            search_type (str): 'english', 'korean', 'all'
+
+        Returns:
+            bool: 포함 여부
+        """
+        keyword = keyword.strip()
+        if search_type != 'english' and is_chosung_only(keyword):
+            return get_chosung(word['korean']).startswith(keyword.replace(' ', ''))
+
+        needle = keyword.lower()
+        columns = (search_type,) if search_type in ('english', 'korean') else ('english', 'korean')
+        if any(needle in word[column].lower() for column in columns):
+            return True
+        return (search_type != 'english' and contains_hangul(keyword)
+                and decompose_jamo(word['korean']).startswith(decompose_jamo(keyword)))
+
+    def _search_words_substring(self, keyword, search_type, limit=None, ranked=False):
+        """부분 문자열 검색 (FTS5 trigram, 짧은 키워드는 LIKE)"""
+        if len(keyword) < FTS_MIN_KEYWORD_LENGTH:
+            return self._search_words_like(keyword, search_type, limit)
+
+        # 키워드를 FTS 구문(phrase)으로 감싸 특수문자를 그대로 검색
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        if search_type in ('english', 'korean'):
+            phrase = f"{search_type} : {phrase}"
+
+        query = (f"SELECT w.* FROM words_fts f "
+                 f"JOIN {self.TABLE_NAME} w ON w.word_id = f.rowid "
+                 f"WHERE words_fts MATCH ? AND w.is_deleted = 0 "
+                 f"ORDER BY {'f.rank' if ranked else 'w.english'}")
+        params = [phrase]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return self.db.execute_query(query, tuple(params), record_type=Word)
+
+    def _search_words_korean_prefix(self, column, prefix, limit=None):
+        """word_korean_index의 초성/자모 컬럼에서 접두어 범위 검색"""
+        query = (f"SELECT w.* FROM word_korean_index k "
+                 f"JOIN {self.TABLE_NAME} w ON w.word_id = k.word_id "
+                 f"WHERE k.{column} >= ? AND k.{column} < ? AND w.is_deleted = 0 "
+                 f"ORDER BY w.english")
+        params = [prefix, prefix_upper_bound(prefix)]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return self.db.execute_query(query, tuple(params), record_type=Word)
+
+    def _search_words_like(self, keyword, search_type, limit=None):
+        """짧은 키워드용 LIKE 검색 (%, _는 문자 그대로 검색)"""
+        pattern = _like_pattern(keyword)
+        if search_type == 'english':
+            where_clause = "english LIKE ? ESCAPE '\\' AND is_deleted = 0"
+            params = (pattern,)
+        elif search_type == 'korean':
+            where_clause = "korean LIKE ? ESCAPE '\\' AND is_deleted = 0"
+            params = (pattern,)
+        else:  # all
+            where_clause = "(english LIKE ? ESCAPE '\\' OR korean LIKE ? ESCAPE '\\') AND is_deleted = 0"
+            params = (pattern, pattern)
+
+        return self.find_all(where_clause=where_clause, params=params,
+                             order_by='english', limit=limit, record_type=Word)
+
     def add_word(self, english, korean, memo=None):
         """
         단어 추가
@@ -90,11 +390,121 @@ class WordModel(BaseModel):
                 'korean': korean.strip(),
                 'memo': memo.strip() if memo else None
             }
-            return self.insert(data)
+            with self.db.transaction():
+                word_id = self.insert(data)
+                self._index_korean([(word_id, data['korean'])])
+            self.cache.invalidate_lists()
+            self.sampler.add_word(word_id)
+            self.distractors.put_word(word_id, data['english'], data['korean'])
+            return word_id
         except Exception as e:
             logger.error(f"단어 추가 실패 (영어={english}): {e}")
             raise
 
+    def bulk_add_words(self, words, chunk_size=IMPORT_CHUNK_SIZE, progress_callback=None):
+        """
+        단어 일괄 추가 (청크마다 executemany + 1회 커밋)
+
+        Args:
+            words (iterable): {'english', 'korean', 'memo'} 딕셔너리 목록
+            chunk_size (int): 트랜잭션 1회당 삽입할 행 수
+            progress_callback (callable, optional): 청크 시작 전과 완료 후 (처리한 행 수, 전체 행 수)로 호출.
+                전체 행 수를 모르면 None. 예외를 던지면 그 청크부터 중단 (이미 커밋된 청크는 유지)
+
+        Returns:
+            tuple: (inserted_ids: list, errors: list)
+                errors 항목은 {'index', 'english', 'error'} 딕셔너리
+        """
+        inserted_ids = []
+        errors = []
+        seen = set()
+        started = time.perf_counter()
+        total = len(words) if hasattr(words, '__len__') else None
+        processed = 0
+
+        iterator = enumerate(words)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            if progress_callback:
+                progress_callback(processed, total)
+            processed += len(chunk)
+
+            # 1) 행 단위 검증 및 입력 내 중복 제거
+            candidates = []
+            for index, word in chunk:
+                english = (word.get('english') or '').strip()
+                korean = (word.get('korean') or '').strip()
+                memo = (word.get('memo') or '').strip() or None
+
+                if not english or not korean:
+                    errors.append({'index': index, 'english': english,
+                                   'error': "영어와 한국어는 필수입니다"})
+                    continue
+                if english in seen:
+                    errors.append({'index': index, 'english': english,
+                                   'error': "파일 내 중복된 단어입니다"})
+                    continue
+                seen.add(english)
+                candidates.append((index, (english, korean, memo)))
+
+            # 2) 이미 등록된 단어 제외 (SQL_IN_CHUNK_SIZE개씩 조회, 청크 크기와 무관하게 변수 한도 유지)
+            if candidates:
+                english_list = [row[0] for _, row in candidates]
+                existing = set()
+                for start in range(0, len(english_list), SQL_IN_CHUNK_SIZE):
+                    lookup = english_list[start:start + SQL_IN_CHUNK_SIZE]
+                    placeholders = ', '.join(['?' for _ in lookup])
+                    query = f"SELECT english FROM {self.TABLE_NAME} WHERE english IN ({placeholders})"
+                    existing.update(row['english']
+                                    for row in self.db.execute_query(query, tuple(lookup)))
+                if existing:
+                    for index, row in candidates:
+                        if row[0] in existing:
+                            errors.append({'index': index, 'english': row[0],
+                                           'error': "이미 등록된 단어입니다"})
+                    candidates = [c for c in candidates if c[1][0] not in existing]
+
+            if not candidates:
+                continue
+
+            # 3) 청크 일괄 삽입 (인덱스 포함 1회 커밋)
+            #    제약 위반 시 청크 트랜잭션 전체를 되돌리고 행 단위로 재시도하여 오류 행만 분리
+            #    (executemany를 SAVEPOINT로 감싸면 WAL 모드에서 삽입이 2배 이상 느려짐)
+            try:
+                with self.db.transaction():
+                    chunk_ids = self.insert_many(['english', 'korean', 'memo'],
+                                                 [row for _, row in candidates])
+                    added = [(word_id, english, korean)
+                             for word_id, (_, (english, korean, _)) in zip(chunk_ids, candidates)]
+                    self._index_korean([(word_id, korean) for word_id, _, korean in added])
+            except sqlite3.IntegrityError:
+                added = []
+                with self.db.transaction():
+                    for index, (english, korean, memo) in candidates:
+                        try:
+                            word_id = self.insert({'english': english, 'korean': korean, 'memo': memo})
+                            added.append((word_id, english, korean))
+                        except sqlite3.IntegrityError as e:
+                            errors.append({'index': index, 'english': english, 'error': str(e)})
+                    self._index_korean([(word_id, korean) for word_id, _, korean in added])
+            if added:
+                self.cache.invalidate_lists()
+            for word_id, english, korean in added:
+                inserted_ids.append(word_id)
+                self.sampler.add_word(word_id)
+                self.distractors.put_word(word_id, english, korean)
+
+        if progress_callback:
+            progress_callback(processed, total)
+        errors.sort(key=lambda error: error['index'])
+        elapsed = time.perf_counter() - started
+        rate = len(inserted_ids) / elapsed if elapsed > 0 else 0
+        logger.info(f"단어 일괄 추가 완료: {len(inserted_ids)}건 성공, {len(errors)}건 실패, "
+                    f"{elapsed:.2f}초 ({rate:.0f} rows/s)")
+        return inserted_ids, errors
+
     def update_word(self, word_id, **kwargs):
         """
         단어 수정
@@ -114,14 +524,107 @@ class WordModel(BaseModel):
                 logger.warning(f"수정할 데이터가 없음 (word_id={word_id})")
                 return 0
             
-            return self.update(word_id, data)
+            with self.db.transaction():
+                result = self.update(word_id, data)
+                if 'korean' in data:
+                    self._index_korean([(word_id, data['korean'])])
+            self.cache.invalidate(word_id)
+            if data.keys() & {'is_deleted', 'correct_count', 'wrong_count'}:
+                self.sampler.reset()
+            if 'is_deleted' in data:
+                self.distractors.reset()
+            elif data.keys() & {'english', 'korean'} and self.distractors.is_built:
+                word = self.find_by_pk(word_id)
+                if word is not None:
+                    self.distractors.put_word(word_id, word['english'], word['korean'])
+            return result
         except Exception as e:
             logger.error(f"단어 수정 실패 (word_id={word_id}): {e}")
             raise
 
+    def _index_korean(self, rows):
+        """
+        한국어 초성/자모 인덱스 갱신
+
+        Args:
+            rows (list): (word_id, korean) 튜플 리스트
+        """
+        if not rows:
+            return
+        self.db.execute_many(
+            "INSERT OR REPLACE INTO word_korean_index (word_id, chosung, jamo) VALUES (?, ?, ?)",
+            [(word_id, get_chosung(korean), decompose_jamo(korean)) for word_id, korean in rows]
+        )
+
+    def ensure_error_rate_column(self):
+        """
+        기존 DB의 words 테이블에 error_rate 생성 컬럼 추가 (schema.sql 실행 전에 호출)
+
+        STORED 생성 컬럼은 ALTER TABLE로 추가할 수 없으므로 VIRTUAL로 만들고,
+        값은 schema.sql의 부분 인덱스(idx_words_error_rate)에 저장된다.
+
+        Returns:
+            bool: 컬럼을 새로 추가했으면 True
+        """
+        try:
+            columns = [row['name'] for row in self.db.execute_query(
+                f"PRAGMA table_xinfo({self.TABLE_NAME})")]
+            if not columns or 'error_rate' in columns:
+                return False
+            self.db.execute_update(
+                f"ALTER TABLE {self.TABLE_NAME} ADD COLUMN error_rate REAL GENERATED ALWAYS AS ("
+                f"CASE WHEN correct_count + wrong_count > 0 "
+                f"THEN wrong_count * 1.0 / (correct_count + wrong_count) ELSE 0 END) VIRTUAL"
+            )
+            self.cache.clear()
+            logger.info("words.error_rate 컬럼 추가")
+            return True
+        except Exception as e:
+            logger.error(f"error_rate 컬럼 추가 실패: {e}")
+            raise
+
+    def get_top_error_words(self, limit=10):
+        """
+        오답률 높은 단어 Top N (idx_words_error_rate 범위 조회, 정렬 없음)
+
+        Args:
+            limit (int): 최대 단어 수
+
+        Returns:
+            list: Word 리스트 (오답률 내림차순, 한 번도 틀리지 않은 단어 제외)
+        """
+        try:
+            # 통계(ANALYZE) 없이는 플래너가 is_deleted 인덱스 + 정렬을 고르므로 인덱스를 지정
+            query = (f"SELECT * FROM {self.TABLE_NAME} INDEXED BY idx_words_error_rate "
+                     f"WHERE is_deleted = 0 AND error_rate > 0 "
+                     f"ORDER BY error_rate DESC, word_id LIMIT ?")
+            return self.db.execute_query(query, (limit,), record_type=Word)
+        except Exception as e:
+            logger.error(f"오답률 상위 단어 조회 실패: {e}")
+            raise
+
+    def sync_korean_index(self):
+        """
+        초성/자모 인덱스가 없는 단어를 찾아 인덱스 생성 (기존 DB 보정용)
+
+        Returns:
+            int: 새로 인덱싱한 단어 수
+        """
+        try:
+            query = (f"SELECT word_id, korean FROM {self.TABLE_NAME} "
+                     f"WHERE word_id NOT IN (SELECT word_id FROM word_korean_index)")
+            rows = [(row['word_id'], row['korean']) for row in self.db.execute_query(query)]
+            self._index_korean(rows)
+            if rows:
+                logger.info(f"초성/자모 인덱스 생성: {len(rows)}건")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"초성/자모 인덱스 동기화 실패: {e}")
+            raise
+
     def toggle_favorite(self, word_id):
         """
-        즐겨찾기 토글
+        즐겨찾기 토글 (조회 없이 단일 UPDATE로 반전)
         
         Args:
             word_id (int): 단어 ID
@@ -130,46 +633,242 @@ class WordModel(BaseModel):
             int: 영향받은 행 수
         """
         try:
-            word = self.find_by_pk(word_id)
-            if not word:
+            query = (f"UPDATE {self.TABLE_NAME} "
+                     f"SET is_favorite = CASE is_favorite WHEN 1 THEN 0 ELSE 1 END "
+                     f"WHERE word_id = ?")
+            result = self.db.execute_update(query, (word_id,))
+            if not result:
                 raise ValueError(f"단어를 찾을 수 없음: word_id={word_id}")
-            
-            new_favorite = 0 if word['is_favorite'] == 1 else 1
-            return self.update(word_id, {'is_favorite': new_favorite})
+
+            def flip(word):
+                word['is_favorite'] = 0 if word['is_favorite'] == 1 else 1
+            self.cache.patch(word_id, flip, ('is_favorite',))
+            self.cache.invalidate_lists('favorites')
+            return result
         except Exception as e:
             logger.error(f"즐겨찾기 토글 실패 (word_id={word_id}): {e}")
             raise
 
-    def update_statistics(self, word_id, is_correct):
+    def generate_choices(self, words, question_mode='en_to_ko'):
+        """
+        시험 문제 단어들의 객관식 선택지를 한 번에 생성 (문제별 DB 조회 없음)
+
+        Args:
+            words (list): 문제 단어 레코드 리스트
+            question_mode (str): 'en_to_ko' 또는 'ko_to_en'
+
+        Returns:
+            list: 문제별 보기 리스트 (정답 포함, 섞인 순서)
+        """
+        try:
+            if not self.distractors.is_built:
+                rows = self.db.execute_query(
+                    f"SELECT word_id, english, korean FROM {self.TABLE_NAME} "
+                    f"WHERE is_deleted = 0")
+                self.distractors.build(tuple(row) for row in rows)
+            return self.distractors.generate_choices(words, question_mode)
+        except Exception as e:
+            logger.error(f"객관식 선택지 생성 실패: {e}")
+            raise
+
+    def get_weighted_words(self, count):
+        """
+        오답률이 높은 단어일수록 자주 뽑히도록 서로 다른 단어 count개 추출
+
+        Args:
+            count (int): 추출할 단어 수
+
+        Returns:
+            list: Word 리스트 (추출 순서)
         """
-        단어 학습 통계 업데이트
+        try:
+            if not self.sampler.is_built:
+                rows = self.db.execute_query(
+                    f"SELECT word_id, correct_count, wrong_count FROM {self.TABLE_NAME} "
+                    f"WHERE is_deleted = 0")
+                self.sampler.build(tuple(row) for row in rows)
+
+            word_ids = self.sampler.sample(count)
+            words = {}
+            for start in range(0, len(word_ids), SQL_IN_CHUNK_SIZE):
+                chunk = word_ids[start:start + SQL_IN_CHUNK_SIZE]
+                placeholders = ', '.join(['?' for _ in chunk])
+                query = (f"SELECT * FROM {self.TABLE_NAME} "
+                         f"WHERE word_id IN ({placeholders}) AND is_deleted = 0")
+                for word in self.db.execute_query(query, tuple(chunk), record_type=Word):
+                    words[word.word_id] = word
+            return [words[word_id] for word_id in word_ids if word_id in words]
+        except Exception as e:
+            logger.error(f"가중 단어 추출 실패: {e}")
+            raise
+
+    def update_statistics(self, word_id, is_correct, session_id=None):
+        """
+        단어 학습 통계 업데이트 (카운터를 SQL 안에서 원자적으로 증가)
+
+        session_id가 있으면 학습 이력(learning_history)에도 1행 추가한다. 없으면 이력이
+        남지 않으므로 rebuild_daily_stats() 재계산에는 포함되지 않는다.
         
         Args:
             word_id (int): 단어 ID
             is_correct (bool): 정답 여부
+            session_id (int, optional): 학습 세션 ID
             
         Returns:
             int: 영향받은 행 수
         """
         try:
-            word = self.find_by_pk(word_id)
-            if not word:
-                raise ValueError(f"단어를 찾을 수 없음: word_id={word_id}")
-            
-            from datetime import datetime
-            
-            if is_correct:
-                data = {
-                    'correct_count': word['correct_count'] + 1,
-                    'last_learned_at': datetime.now().isoformat()
-                }
-            else:
-                data = {
-                    'wrong_count': word['wrong_count'] + 1,
-                    'last_learned_at': datetime.now().isoformat()
-                }
-            
-            return self.update(word_id, data)
+            counter = 'correct_count' if is_correct else 'wrong_count'
+            query = (f"UPDATE {self.TABLE_NAME} "
+                     f"SET {counter} = {counter} + 1, last_learned_at = ? "
+                     f"WHERE word_id = ?")
+            learned_at = get_current_datetime()
+            with self.db.transaction():
+                result = self.db.execute_update(query, (learned_at, word_id))
+                if not result:
+                    raise ValueError(f"단어를 찾을 수 없음: word_id={word_id}")
+                if session_id is not None:
+                    self.history.add_answers([(session_id, word_id, is_correct, learned_at)])
+                self.schedule.record_reviews([(word_id, is_correct, learned_at)])
+                self.daily_stats.record_answers(int(is_correct), int(not is_correct), learned_at[:10])
+            self.cache.patch(word_id, _stats_updater(int(is_correct), int(not is_correct), learned_at),
+                             STATS_COLUMNS)
+            self.sampler.apply_statistics(word_id, int(is_correct), int(not is_correct))
+            return result
         except Exception as e:
             logger.error(f"통계 업데이트 실패 (word_id={word_id}): {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def update_statistics_batch(self, results, learned_at=None):
+        """
+        한 세션의 학습 결과를 일괄 반영
+
+        단어별 정답/오답 횟수를 모은 뒤 (결과 종류, 증가량)마다
+        UPDATE ... WHERE word_id IN (...) 한 문장으로 처리하고 한 번에 커밋한다.
+        시험 답안용: 답안은 exam_questions에 남고 일별 통계 재계산도 그곳에서 하므로
+        learning_history에는 기록하지 않는다.
+
+        Args:
+            results (iterable): (word_id, is_correct) 튜플 목록
+            learned_at (str, optional): 답안 시각 (기본: 현재, 시험은 종료 시각)
+
+        Returns:
+            int: 영향받은 행 수 (문장별 합계)
+        """
+        try:
+            results = list(results)
+            deltas = {'correct_count': {}, 'wrong_count': {}}
+            for word_id, is_correct in results:
+                counts = deltas['correct_count' if is_correct else 'wrong_count']
+                counts[word_id] = counts.get(word_id, 0) + 1
+
+            # 증가량이 같은 단어끼리 묶기 (대부분 1)
+            groups = {}
+            for counter, counts in deltas.items():
+                for word_id, delta in counts.items():
+                    groups.setdefault((counter, delta), []).append(word_id)
+
+            if not groups:
+                return 0
+
+            learned_at = learned_at or get_current_datetime()
+            affected = 0
+            with self.db.transaction():
+                for (counter, delta), word_ids in groups.items():
+                    for start in range(0, len(word_ids), SQL_IN_CHUNK_SIZE):
+                        chunk = word_ids[start:start + SQL_IN_CHUNK_SIZE]
+                        placeholders = ', '.join(['?' for _ in chunk])
+                        query = (f"UPDATE {self.TABLE_NAME} "
+                                 f"SET {counter} = {counter} + ?, last_learned_at = ? "
+                                 f"WHERE word_id IN ({placeholders})")
+                        affected += self.db.execute_update(query, (delta, learned_at, *chunk))
+                correct, wrong = deltas['correct_count'], deltas['wrong_count']
+                self.schedule.record_reviews(
+                    [(word_id, is_correct, learned_at) for word_id, is_correct in results])
+                self.daily_stats.record_answers(sum(correct.values()), sum(wrong.values()),
+                                                learned_at[:10])
+
+            for counter, counts in deltas.items():
+                for word_id, delta in counts.items():
+                    correct, wrong = (delta, 0) if counter == 'correct_count' else (0, delta)
+                    self.cache.patch(word_id, _stats_updater(correct, wrong, learned_at), STATS_COLUMNS)
+                    self.sampler.apply_statistics(word_id, correct, wrong)
+
+            logger.info(f"학습 통계 일괄 반영: {affected}건")
+            return affected
+        except Exception as e:
+            logger.error(f"학습 통계 일괄 반영 실패: {e}")
+            raise
+
+    def apply_learning_history(self, history):
+        """
+        답안 기록 묶음을 한 트랜잭션으로 반영 (write-behind 버퍼용)
+
+        답안마다 learning_history 1행을 추가하고, 단어별 정답/오답 증가분과
+        복습 스케줄, 답안 날짜별 일별 통계를 같은 트랜잭션에서 갱신한다.
+
+        Args:
+            history (list): (session_id, word_id, is_correct, learned_at) 튜플 리스트 (답안 순서)
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        if not history:
+            return 0
+
+        deltas = {}  # word_id -> [correct 증가분, wrong 증가분, 마지막 learned_at]
+        daily = {}
+        for _, word_id, is_correct, learned_at in history:
+            entry = deltas.setdefault(word_id, [0, 0, learned_at])
+            counts = daily.setdefault(learned_at[:10], [0, 0])
+            index = 0 if is_correct else 1
+            entry[index] += 1
+            counts[index] += 1
+            entry[2] = max(entry[2], learned_at)
+
+        try:
+            query = (f"UPDATE {self.TABLE_NAME} "
+                     f"SET correct_count = correct_count + ?, wrong_count = wrong_count + ?, "
+                     f"last_learned_at = ? WHERE word_id = ?")
+            rows = [(correct, wrong, learned_at, word_id)
+                    for word_id, (correct, wrong, learned_at) in deltas.items()]
+            with self.db.transaction():
+                affected, _ = self.db.execute_many(query, rows)
+                self.history.add_answers(history)
+                self.schedule.record_reviews(
+                    [(word_id, is_correct, learned_at) for _, word_id, is_correct, learned_at in history])
+                self.daily_stats.record_answers_by_date(daily)
+            for word_id, (correct, wrong, learned_at) in deltas.items():
+                self.cache.patch(word_id, _stats_updater(correct, wrong, learned_at), STATS_COLUMNS)
+                self.sampler.apply_statistics(word_id, correct, wrong)
+            return affected
+        except Exception as e:
+            logger.error(f"학습 기록 반영 실패: {e}")
+            raise
+
+
+# 트랜잭션이 롤백되면 캐시에 먼저 반영된 변경이 남지 않도록 비움
+DBConnection.get_instance().on_rollback(WordModel.cache.clear)
+DBConnection.get_instance().on_rollback(WordModel.sampler.reset)
+DBConnection.get_instance().on_rollback(WordModel.distractors.reset)
+
+
+def _like_pattern(keyword):
+    """부분 문자열 LIKE 패턴 (ESCAPE '\\'와 함께 사용, 와일드카드 %, _를 문자 그대로)"""
+    escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+# _stats_updater가 바꾸는 컬럼 (이 컬럼으로 정렬된 캐시 목록은 patch 시 제거됨)
+STATS_COLUMNS = ('correct_count', 'wrong_count', 'last_learned_at', 'error_rate')
+
+
+def _stats_updater(correct, wrong, learned_at):
+    """캐시된 단어의 학습 통계를 증가시키는 patch 함수 생성"""
+    def update(word):
+        word['correct_count'] += correct
+        word['wrong_count'] += wrong
+        word['last_learned_at'] = learned_at
+        attempts = word['correct_count'] + word['wrong_count']
+        word['error_rate'] = word['wrong_count'] / attempts if attempts else 0.0
+    return update
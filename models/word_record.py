@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 단어 레코드 타입 (__slots__)
+# 파일 위치: models/word_record.py
+
+
+class Word:
+    """
+    words 테이블 한 행을 담는 경량 레코드
+
+    행마다 dict를 만드는 대신 __slots__ 객체를 사용해 메모리와 생성 비용을 줄인다.
+    기존 코드와의 호환을 위해 word['english'], word.get('memo'), dict(word) 같은
+    dict 방식 접근도 지원한다. 조회하지 않은 컬럼은 None이다.
+    """
+    FIELDS = ('word_id', 'english', 'korean', 'memo', 'is_favorite',
+              'correct_count', 'wrong_count', 'last_learned_at',
+              'created_at', 'updated_at', 'is_deleted', 'error_rate')
+    __slots__ = FIELDS
+
+    def __init__(self, word_id=None, english=None, korean=None, memo=None, is_favorite=None,
+                 correct_count=None, wrong_count=None, last_learned_at=None,
+                 created_at=None, updated_at=None, is_deleted=None, error_rate=None):
+        self.word_id = word_id
+        self.english = english
+        self.korean = korean
+        self.memo = memo
+        self.is_favorite = is_favorite
+        self.correct_count = correct_count
+        self.wrong_count = wrong_count
+        self.last_learned_at = last_learned_at
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.is_deleted = is_deleted
+        self.error_rate = error_rate
+
+    @classmethod
+    def from_rows(cls, columns, rows):
+        """
+        SELECT 결과(튜플 행)를 Word 리스트로 변환
+
+        Args:
+            columns (tuple): 조회한 컬럼명 (cursor.description 순서)
+            rows (list): 값 튜플 리스트
+
+        Returns:
+            list: Word 리스트
+        """
+        if columns == cls.FIELDS:
+            return [cls(*row) for row in rows]
+        return [cls(**dict(zip(columns, row))) for row in rows]
+
+    # ---------- dict 호환 ----------
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def get(self, key, default=None):
+        """dict.get과 동일"""
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def keys(self):
+        """컬럼명 목록"""
+        return self.FIELDS
+
+    def items(self):
+        """(컬럼명, 값) 목록"""
+        return [(field, getattr(self, field)) for field in self.FIELDS]
+
+    def to_dict(self):
+        """dict로 변환"""
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, Word):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Word(word_id={self.word_id!r}, english={self.english!r}, korean={self.korean!r})"
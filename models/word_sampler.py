@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 오답률 가중 단어 샘플러 (Fenwick tree)
+# 파일 위치: models/word_sampler.py
+
+import random
+import threading
+
+
+def error_weight(correct_count, wrong_count):
+    """
+    오답률 기반 출제 가중치 (라플라스 보정: 학습 전 단어는 0.5)
+
+    Args:
+        correct_count (int): 정답 횟수
+        wrong_count (int): 오답 횟수
+
+    Returns:
+        float: 0 초과 1 미만의 가중치
+    """
+    return (wrong_count + 1) / (correct_count + wrong_count + 2)
+
+
+class FenwickTree:
+    """
+    가중치 누적합 트리 (값 변경/구간합/누적합 탐색 모두 O(log n))
+    """
+
+    def __init__(self, weights=()):
+        self.size = len(weights)
+        self._tree = [0.0] * (self.size + 1)
+        for i, weight in enumerate(weights, 1):
+            self._tree[i] += weight
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self._tree[parent] += self._tree[i]
+
+    def add(self, index, delta):
+        """index(0부터) 위치의 값에 delta 더하기"""
+        i = index + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def total(self):
+        """전체 합"""
+        result = 0.0
+        i = self.size
+        while i > 0:
+            result += self._tree[i]
+            i -= i & -i
+        return result
+
+    def find(self, target):
+        """
+        누적합이 target을 처음 넘는 위치 탐색
+
+        Args:
+            target (float): 0 이상 total() 미만의 값
+
+        Returns:
+            int: 위치 (0부터)
+        """
+        position = 0
+        mask = 1 << self.size.bit_length()
+        while mask:
+            nxt = position + mask
+            if nxt <= self.size and self._tree[nxt] <= target:
+                target -= self._tree[nxt]
+                position = nxt
+            mask >>= 1
+        return min(position, self.size - 1)
+
+
+class WordSampler:
+    """
+    오답률에 비례해 단어를 비복원 추출하는 샘플러
+
+    처음 추출할 때 words 통계로 한 번 구성(O(n))한 뒤에는
+    학습 통계 변경/단어 추가/삭제를 O(log n)으로 반영하고,
+    N개 추출은 O(N log n)이다. 구성 전에 들어온 변경은 무시한다.
+    """
+
+    def __init__(self, rng=None):
+        self._rng = rng or random.Random()
+        self._lock = threading.RLock()
+        self.reset()
+
+    @property
+    def is_built(self):
+        """구성 여부"""
+        return self._tree is not None
+
+    def reset(self):
+        """구성 해제 (다음 추출 때 다시 구성)"""
+        with self._lock:
+            self._tree = None
+            self._positions = {}  # word_id -> 위치
+            self._word_ids = []  # 위치 -> word_id
+            self._counts = []  # 위치 -> [정답 수, 오답 수]
+            self._weights = []  # 위치 -> 현재 가중치 (삭제된 단어 자리는 0)
+            self._updates = 0
+
+    def build(self, rows):
+        """
+        (word_id, correct_count, wrong_count) 행으로 구성
+
+        Args:
+            rows (iterable): 활성 단어 통계
+        """
+        with self._lock:
+            self.reset()
+            for word_id, correct, wrong in rows:
+                self._positions[word_id] = len(self._word_ids)
+                self._word_ids.append(word_id)
+                self._counts.append([correct, wrong])
+                self._weights.append(error_weight(correct, wrong))
+            self._rebuild()
+
+    def _rebuild(self):
+        """가중치 배열로 트리 재구성 (여유 공간 포함, _lock 보유 상태에서 호출)"""
+        capacity = max(16, len(self._weights) * 2)
+        self._tree = FenwickTree(self._weights + [0.0] * (capacity - len(self._weights)))
+        self._updates = 0
+
+    def _set_weight(self, position, weight):
+        """위치의 가중치 변경 (_lock 보유 상태에서 호출)"""
+        self._tree.add(position, weight - self._weights[position])
+        self._weights[position] = weight
+        # 부동소수점 오차 누적 방지: 변경이 단어 수만큼 쌓이면 재구성
+        self._updates += 1
+        if self._updates > self._tree.size:
+            self._rebuild()
+
+    def apply_statistics(self, word_id, correct_delta, wrong_delta):
+        """
+        학습 통계 증가분 반영 (WordModel 통계 업데이트 경로에서 호출)
+
+        Args:
+            word_id (int): 단어 ID
+            correct_delta (int): 정답 증가분
+            wrong_delta (int): 오답 증가분
+        """
+        with self._lock:
+            position = self._positions.get(word_id) if self._tree else None
+            if position is None:
+                return
+            counts = self._counts[position]
+            counts[0] += correct_delta
+            counts[1] += wrong_delta
+            self._set_weight(position, error_weight(*counts))
+
+    def add_word(self, word_id, correct_count=0, wrong_count=0):
+        """새 단어 추가 (여유 공간이 없을 때만 재구성)"""
+        with self._lock:
+            if self._tree is None:
+                return
+            position = self._positions.get(word_id)
+            if position is not None:
+                self._counts[position] = [correct_count, wrong_count]
+                self._set_weight(position, error_weight(correct_count, wrong_count))
+                return
+            position = len(self._word_ids)
+            self._positions[word_id] = position
+            self._word_ids.append(word_id)
+            self._counts.append([correct_count, wrong_count])
+            self._weights.append(0.0)
+            if position >= self._tree.size:
+                self._rebuild()
+            self._set_weight(position, error_weight(correct_count, wrong_count))
+
+    def remove_word(self, word_id):
+        """
+        단어 제외 (위치는 가중치 0인 빈 자리로 남김)
+
+        word_id 매핑을 지우므로 이후 통계 변경이 가중치를 되살리지 않으며,
+        복원되면 add_word가 새 위치를 할당한다.
+        """
+        with self._lock:
+            position = self._positions.pop(word_id, None) if self._tree else None
+            if position is not None:
+                self._set_weight(position, 0.0)
+
+    def sample(self, count):
+        """
+        오답률 가중치에 비례해 서로 다른 단어 count개 추출
+
+        Args:
+            count (int): 추출할 단어 수
+
+        Returns:
+            list: word_id 리스트 (추출 순서, 단어 수가 부족하면 더 짧음)
+        """
+        with self._lock:
+            if self._tree is None:
+                raise RuntimeError("샘플러가 구성되지 않았습니다")
+
+            drawn = []
+            try:
+                for _ in range(count):
+                    total = self._tree.total()
+                    if total <= 1e-12:
+                        break
+                    position = self._tree.find(self._rng.random() * total)
+                    if position >= len(self._weights) or self._weights[position] <= 0:
+                        # 오차로 빈 위치에 걸린 경우 남은 단어 중 마지막 것으로 대체
+                        position = next((i for i in range(len(self._weights) - 1, -1, -1)
+                                         if self._weights[i] > 0), None)
+                        if position is None:
+                            break
+                    weight = self._weights[position]
+                    drawn.append((position, weight))
+                    self._tree.add(position, -weight)
+                    self._weights[position] = 0.0
+            finally:
+                for position, weight in drawn:
+                    self._tree.add(position, weight)
+                    self._weights[position] = weight
+            return [self._word_ids[position] for position, _ in drawn]
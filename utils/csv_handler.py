@@ -1,85 +1,148 @@
 # 2025-11-03 - Smart Vocab Builder - CSV 처리 유틸리티
 # 파일 위치: utils/csv_handler.py
 
+import codecs
 import csv
 import os
 import logging
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+ENCODING_SAMPLE_SIZE = 64 * 1024  # 인코딩 판별용 샘플 크기 (bytes)
+
 
 class CSVHandler:
     """CSV 파일 임포트/엑스포트 처리"""
 
     @staticmethod
-    def parse_csv(file_path, encoding='utf-8'):
+    def detect_encoding(file_path, sample_size=ENCODING_SAMPLE_SIZE):
         """
-        CSV 파일 파싱
+        파일 앞부분만 읽어 인코딩 판별 (UTF-8 우선, 실패 시 CP949)
 
         Args:
             file_path (str): CSV 파일 경로
-            encoding (str): 파일 인코딩 (기본: utf-8)
+            sample_size (int): 판별에 사용할 바이트 수
 
         Returns:
-            tuple: (success: bool, data: list or error_message: str)
+            str: 'utf-8-sig' 또는 'cp949'
         """
-        if not os.path.exists(file_path):
-            return False, "파일을 찾을 수 없습니다."
+        with open(file_path, 'rb') as f:
+            sample = f.read(sample_size)
 
         try:
-            words = []
-            with open(file_path, 'r', encoding=encoding, newline='') as f:
-                # BOM 제거
-                content = f.read()
-                if content.startswith('\ufeff'):
-                    content = content[1:]
-
-                # CSV 파싱
-                csv_reader = csv.DictReader(content.splitlines())
-
-                # 필수 컬럼 확인
-                if 'english' not in csv_reader.fieldnames or 'korean' not in csv_reader.fieldnames:
-                    return False, "CSV 파일에 'english', 'korean' 컬럼이 필요합니다."
-
-                for row_num, row in enumerate(csv_reader, start=2):
-                    english = row.get('english', '').strip()
-                    korean = row.get('korean', '').strip()
-                    memo = row.get('memo', '').strip()
-
-                    # 빈 행 건너뛰기
-                    if not english and not korean:
-                        continue
-
-                    # 필수 필드 검증
-                    if not english:
-                        return False, f"{row_num}번째 줄: 영어 단어가 비어있습니다."
-                    if not korean:
-                        return False, f"{row_num}번째 줄: 한국어 뜻이 비어있습니다."
-
-                    words.append({
-                        'english': english,
-                        'korean': korean,
-                        'memo': memo if memo else None
-                    })
+            # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8-sig'
+        except UnicodeDecodeError:
+            logger.info("UTF-8 아님, CP949로 읽기")
+            return 'cp949'
 
-            if not words:
-                return False, "유효한 단어 데이터가 없습니다."
+    @staticmethod
+    def iter_csv(file_path, encoding=None):
+        """
+        CSV 파일을 한 행씩 읽어 단어 딕셔너리를 생성 (제너레이터)
 
-            logger.info(f"CSV 파싱 성공: {len(words)}개 단어")
-            return True, words
+        Args:
+            file_path (str): CSV 파일 경로
+            encoding (str, optional): 파일 인코딩 (None이면 자동 판별)
 
+        Yields:
+            dict: {'english', 'korean', 'memo'}
+
+        Raises:
+            ValueError: 필수 컬럼 누락 또는 필수 필드가 빈 행
+        """
+        if encoding is None:
+            encoding = CSVHandler.detect_encoding(file_path)
+        elif encoding == 'utf-8':
+            encoding = 'utf-8-sig'  # BOM 제거
+
+        yielded = 0
+        try:
+            for word in CSVHandler._iter_rows(file_path, encoding):
+                yielded += 1
+                yield word
         except UnicodeDecodeError:
-            # UTF-8 실패시 CP949로 재시도
-            if encoding == 'utf-8':
-                logger.info("UTF-8 실패, CP949로 재시도")
-                return CSVHandler.parse_csv(file_path, encoding='cp949')
-            else:
-                return False, "파일 인코딩을 읽을 수 없습니다. (UTF-8 또는 CP949 형식이어야 합니다)"
+            # 지정/판별한 인코딩(앞부분 샘플로 UTF-8 판별 포함)으로 읽다가 실패한 경우:
+            # 처음부터 CP949로 다시 읽고 이미 넘긴 행은 건너뜀
+            if encoding == 'cp949':
+                raise
+            logger.info(f"{yielded + 2}번째 줄 이후 {encoding} 디코딩 실패, CP949로 다시 읽기")
+            yield from islice(CSVHandler._iter_rows(file_path, 'cp949'), yielded, None)
+
+    @staticmethod
+    def _iter_rows(file_path, encoding):
+        """지정한 인코딩으로 CSV를 읽어 검증된 단어 딕셔너리 생성 (iter_csv 참고)"""
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            csv_reader = csv.DictReader(f)
+
+            # 필수 컬럼 확인
+            fieldnames = csv_reader.fieldnames or []
+            if 'english' not in fieldnames or 'korean' not in fieldnames:
+                raise ValueError("CSV 파일에 'english', 'korean' 컬럼이 필요합니다.")
+
+            for row_num, row in enumerate(csv_reader, start=2):
+                english = (row.get('english') or '').strip()
+                korean = (row.get('korean') or '').strip()
+                memo = (row.get('memo') or '').strip()
+
+                # 빈 행 건너뛰기
+                if not english and not korean:
+                    continue
+
+                # 필수 필드 검증
+                if not english:
+                    raise ValueError(f"{row_num}번째 줄: 영어 단어가 비어있습니다.")
+                if not korean:
+                    raise ValueError(f"{row_num}번째 줄: 한국어 뜻이 비어있습니다.")
+
+                yield {
+                    'english': english,
+                    'korean': korean,
+                    'memo': memo if memo else None
+                }
+
+    @staticmethod
+    def _consume(file_path, consumer, encoding=None):
+        """iter_csv 결과를 consumer로 처리하고 (success, result) 형태로 변환"""
+        if not os.path.exists(file_path):
+            return False, "파일을 찾을 수 없습니다."
 
+        try:
+            return True, consumer(CSVHandler.iter_csv(file_path, encoding))
+        except ValueError as e:
+            # UnicodeDecodeError도 ValueError의 하위 클래스이므로 먼저 구분
+            if isinstance(e, UnicodeDecodeError):
+                return False, "파일 인코딩을 읽을 수 없습니다. (UTF-8 또는 CP949 형식이어야 합니다)"
+            return False, str(e)
         except Exception as e:
             logger.error(f"CSV 파싱 오류: {e}")
             return False, f"CSV 파일 읽기 오류: {str(e)}"
 
+    @staticmethod
+    def parse_csv(file_path, encoding=None):
+        """
+        CSV 파일 파싱
+
+        Args:
+            file_path (str): CSV 파일 경로
+            encoding (str, optional): 파일 인코딩 (None이면 자동 판별)
+
+        Returns:
+            tuple: (success: bool, data: list or error_message: str)
+        """
+        success, words = CSVHandler._consume(file_path, list, encoding)
+
+        if not success:
+            return False, words
+
+        if not words:
+            return False, "유효한 단어 데이터가 없습니다."
+
+        logger.info(f"CSV 파싱 성공: {len(words)}개 단어")
+        return True, words
+
     @staticmethod
     def export_to_csv(data, file_path, encoding='utf-8-sig'):
         """
@@ -133,13 +196,16 @@ class CSVHandler:
         Returns:
             tuple: (success: bool, preview_data: list or error_message: str)
         """
-        success, result = CSVHandler.parse_csv(file_path)
+        # 최대 행수만큼만 읽고 중단
+        success, preview = CSVHandler._consume(
+            file_path, lambda rows: list(islice(rows, max_rows)))
 
         if not success:
-            return False, result
+            return False, preview
+
+        if not preview:
+            return False, "유효한 단어 데이터가 없습니다."
 
-        # 최대 행수만큼만 반환
-        preview = result[:max_rows]
         return True, preview
 
     @staticmethod
@@ -153,10 +219,14 @@ class CSVHandler:
         Returns:
             tuple: (is_valid: bool, error_message: str or word_count: int)
         """
-        success, result = CSVHandler.parse_csv(file_path)
+        # 전체 목록을 만들지 않고 스트리밍으로 개수만 계산
+        success, result = CSVHandler._consume(file_path, lambda rows: sum(1 for _ in rows))
 
         if not success:
             return False, result
 
+        if not result:
+            return False, "유효한 단어 데이터가 없습니다."
+
         # 성공시 단어 개수 반환
-        return True, len(result)
+        return True, result
@@ -0,0 +1,131 @@
+# 2026-10-18 - Smart Vocab Builder - 한글 초성/자모 분해 유틸리티
+# 파일 위치: utils/hangul.py
+
+# 한글 음절 유니코드 범위 (가 ~ 힣)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNG_COUNT = 21
+JONG_COUNT = 28
+
+# 호환용 자모 (키보드 입력과 동일한 문자)
+CHOSUNG_LIST = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+JUNGSUNG_LIST = [
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ',
+    'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ'
+]
+JONGSUNG_LIST = [
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ',
+    'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ',
+    'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+
+# 겹모음/겹받침은 키 입력 순서대로 풀어서 저장 (입력 중인 글자와 접두어 비교 가능)
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ',
+    'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ',
+    'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ',
+    'ㅄ': 'ㅂㅅ'
+}
+
+CONSONANTS = set(CHOSUNG_LIST)
+
+
+def is_hangul_syllable(char):
+    """
+    완성형 한글 음절인지 확인
+
+    Args:
+        char (str): 문자 1개
+
+    Returns:
+        bool: 가~힣 범위면 True
+    """
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def is_chosung_only(text):
+    """
+    초성(자음)만으로 이루어진 문자열인지 확인 (공백 허용)
+
+    Args:
+        text (str): 검사할 문자열
+
+    Returns:
+        bool: 예) 'ㅅㄱ' → True, '사ㄱ' → False
+    """
+    stripped = text.replace(' ', '')
+    return bool(stripped) and all(char in CONSONANTS for char in stripped)
+
+
+def contains_hangul(text):
+    """
+    한글 음절 또는 자모가 포함되어 있는지 확인
+
+    Args:
+        text (str): 검사할 문자열
+
+    Returns:
+        bool: 포함되어 있으면 True
+    """
+    return any(is_hangul_syllable(char) or 'ㄱ' <= char <= 'ㅣ' for char in text)
+
+
+def get_chosung(text):
+    """
+    문자열의 초성 추출 (한글이 아닌 문자는 그대로 유지)
+
+    Args:
+        text (str): 원본 문자열
+
+    Returns:
+        str: 예) '사과' → 'ㅅㄱ'
+    """
+    result = []
+    for char in text:
+        if is_hangul_syllable(char):
+            offset = ord(char) - HANGUL_BASE
+            result.append(CHOSUNG_LIST[offset // (JUNG_COUNT * JONG_COUNT)])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def decompose_jamo(text):
+    """
+    문자열을 키 입력 순서의 자모열로 분해 (겹모음/겹받침도 분해)
+
+    Args:
+        text (str): 원본 문자열
+
+    Returns:
+        str: 예) '사과' → 'ㅅㅏㄱㅗㅏ', '삭' → 'ㅅㅏㄱ'
+    """
+    result = []
+    for char in text:
+        if is_hangul_syllable(char):
+            offset = ord(char) - HANGUL_BASE
+            cho = offset // (JUNG_COUNT * JONG_COUNT)
+            jung = (offset % (JUNG_COUNT * JONG_COUNT)) // JONG_COUNT
+            jong = offset % JONG_COUNT
+            for jamo in (CHOSUNG_LIST[cho], JUNGSUNG_LIST[jung], JONGSUNG_LIST[jong]):
+                result.append(COMPOUND_JAMO.get(jamo, jamo))
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(result)
+
+
+def prefix_upper_bound(prefix):
+    """
+    접두어 범위 검색용 상한값 (prefix <= value < upper)
+
+    Args:
+        prefix (str): 접두어 (빈 문자열 불가)
+
+    Returns:
+        str: 마지막 문자를 다음 코드포인트로 올린 문자열
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 시작 시간 측정
+# 파일 위치: utils/startup_timer.py
+
+import logging
+import time
+from config import STARTUP_BUDGET_MS
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    실행부터 첫 화면 그리기까지 단계별 경과 시간 기록
+
+    main.py가 가장 먼저 import하므로 모듈 로드 시점을 시작 시각으로 삼는다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.milestones = []  # (단계 이름, 시작 후 경과 ms)
+        self.finished = False
+
+    def mark(self, name):
+        """
+        단계 완료 기록
+
+        Args:
+            name (str): 단계 이름
+
+        Returns:
+            float: 시작 후 경과 시간 (ms)
+        """
+        elapsed = (time.perf_counter() - self.started) * 1000
+        self.milestones.append((name, elapsed))
+        return elapsed
+
+    def summary(self):
+        """
+        단계별 소요 시간 (이전 단계와의 차이)
+
+        Returns:
+            list: (단계 이름, 소요 ms) 리스트
+        """
+        result = []
+        previous = 0.0
+        for name, elapsed in self.milestones:
+            result.append((name, elapsed - previous))
+            previous = elapsed
+        return result
+
+    def finish(self, budget_ms=STARTUP_BUDGET_MS):
+        """
+        측정 종료 및 로그 기록 (예산 초과 시 경고)
+
+        Args:
+            budget_ms (float): 첫 화면까지 허용 시간
+
+        Returns:
+            bool: 예산 이내 여부
+        """
+        total = self.milestones[-1][1] if self.milestones else 0.0
+        if self.finished:
+            return total <= budget_ms
+        self.finished = True
+
+        steps = ', '.join(f"{name} {duration:.0f}ms" for name, duration in self.summary())
+        if total > budget_ms:
+            logger.warning(f"시작 시간 예산 초과: {total:.0f}ms > {budget_ms}ms ({steps})")
+            return False
+        logger.info(f"시작 시간: {total:.0f}ms ({steps})")
+        return True
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 백그라운드 작업 실행기 (QThreadPool)
+# 파일 위치: utils/task_runner.py
+
+import logging
+import threading
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from config import TASK_MAX_THREADS
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelled(Exception):
+    """작업 취소 (Task.report_progress()에서 발생시켜 작업 함수를 중단)"""
+
+
+class TaskSignals(QObject):
+    """
+    Task의 결과 전달용 시그널 (QRunnable은 QObject가 아니므로 분리)
+
+    메인 스레드에서 생성되므로 작업 스레드에서 emit하면 메인 스레드 이벤트 루프로 전달된다.
+    """
+    result = pyqtSignal(object)            # 작업 함수 반환값
+    error = pyqtSignal(object)             # 작업 함수에서 발생한 예외
+    progress = pyqtSignal(object, object)  # (처리한 수, 전체 수 또는 None)
+    done = pyqtSignal()                    # 성공/실패/취소와 관계없이 실행 종료
+
+
+class Task(QRunnable):
+    """
+    작업 스레드에서 실행할 함수 호출 하나
+
+    취소는 협조적이다: 시작 전이면 실행하지 않고, 실행 중이면 다음 report_progress() 호출에서
+    TaskCancelled로 중단하며, 이미 끝났어도 결과를 전달하지 않는다.
+    """
+
+    def __init__(self, fn, args=(), kwargs=None, key=None):
+        super().__init__()
+        self.setAutoDelete(False)  # TaskRunner가 참조를 관리
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.key = key
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """취소 요청"""
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        """취소 요청 여부"""
+        return self._cancelled.is_set()
+
+    def report_progress(self, done, total=None):
+        """
+        진행 상황 보고 (작업 함수의 progress_callback으로 전달됨)
+
+        Args:
+            done (int): 처리한 수
+            total (int, optional): 전체 수
+
+        Raises:
+            TaskCancelled: 취소 요청된 경우
+        """
+        if self.is_cancelled():
+            raise TaskCancelled()
+        self.signals.progress.emit(done, total)
+
+    def run(self):
+        name = getattr(self.fn, '__qualname__', repr(self.fn))
+        try:
+            if self.is_cancelled():
+                return
+            result = self.fn(*self.args, **self.kwargs)
+            if not self.is_cancelled():
+                self.signals.result.emit(result)
+        except TaskCancelled:
+            logger.info(f"작업 취소됨: {name}")
+        except Exception as e:
+            logger.error(f"작업 실패: {name}, 오류: {e}")
+            if not self.is_cancelled():
+                self.signals.error.emit(e)
+        finally:
+            self.signals.done.emit()
+
+
+class TaskRunner(QObject):
+    """
+    Controller 호출을 QThreadPool 작업 스레드에서 실행하고 결과를 메인 스레드 콜백으로 전달
+
+    - key를 지정하면 같은 key의 이전 작업을 취소하고 마지막 요청만 결과를 전달 (검색어 입력 등)
+    - on_progress를 지정하면 작업 함수에 progress_callback=Task.report_progress를 넘김
+    - 작업 스레드는 만료시키지 않으므로 스레드별 DB 연결(ConnectionPool)을 계속 재사용하고,
+      종료 시 DBConnection.close()가 한꺼번에 닫는다.
+
+    사용 예:
+        runner.submit(controller.search_words, keyword, key='search',
+                      on_result=self.show_results)
+    """
+
+    def __init__(self, max_threads=TASK_MAX_THREADS, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.pool.setExpiryTimeout(-1)
+        self._tasks = set()  # 대기/실행 중 작업 (완료 시그널까지 참조 유지)
+        self._latest = {}  # key -> 마지막으로 제출된 작업
+
+    def submit(self, fn, *args, key=None, on_result=None, on_error=None, on_progress=None,
+               **kwargs):
+        """
+        작업 제출
+
+        Args:
+            fn (callable): 작업 스레드에서 호출할 함수
+            *args, **kwargs: fn 인자
+            key (str, optional): 병합 키 (같은 키의 이전 작업은 취소)
+            on_result (callable, optional): 결과 콜백 (메인 스레드)
+            on_error (callable, optional): 예외 콜백 (메인 스레드)
+            on_progress (callable, optional): (처리한 수, 전체 수) 콜백 (메인 스레드)
+
+        Returns:
+            Task: 제출된 작업 (cancel() 가능)
+        """
+        task = Task(fn, args, kwargs, key)
+        if on_progress is not None:
+            task.kwargs['progress_callback'] = task.report_progress
+            task.signals.progress.connect(
+                lambda done, total: None if task.is_cancelled() else on_progress(done, total))
+        # 시그널이 큐에 있는 동안 취소될 수 있으므로 전달 시점에 한 번 더 확인
+        task.signals.result.connect(lambda result: self._deliver(task, on_result, result))
+        task.signals.error.connect(lambda error: self._deliver(task, on_error, error))
+        task.signals.done.connect(lambda: self._forget(task))
+
+        if key is not None:
+            previous = self._latest.get(key)
+            if previous is not None:
+                self._cancel(previous)
+            self._latest[key] = task
+
+        self._tasks.add(task)
+        self.pool.start(task)
+        return task
+
+    def cancel(self, key):
+        """
+        key의 마지막 작업 취소
+
+        Args:
+            key (str): 병합 키
+        """
+        task = self._latest.get(key)
+        if task is not None:
+            self._cancel(task)
+
+    def is_running(self, key):
+        """key의 작업이 대기/실행 중인지 여부"""
+        return key in self._latest
+
+    def shutdown(self, timeout_ms=5000):
+        """
+        모든 작업 취소 후 실행 중인 작업 종료 대기 (DB 연결을 닫기 전에 호출)
+
+        Args:
+            timeout_ms (int): 최대 대기 시간
+
+        Returns:
+            bool: 제한 시간 안에 모두 종료되었는지 여부
+        """
+        for task in list(self._tasks):
+            self._cancel(task)
+        finished = self.pool.waitForDone(timeout_ms)
+        if not finished:
+            logger.warning(f"작업 스레드 종료 대기 시간 초과 ({timeout_ms}ms)")
+        return finished
+
+    def _cancel(self, task):
+        """작업 취소 (아직 시작 전이면 큐에서 제거)"""
+        task.cancel()
+        if self.pool.tryTake(task):
+            self._forget(task)
+
+    def _deliver(self, task, callback, value):
+        """취소되지 않은 작업의 결과/예외 전달"""
+        if callback is not None and not task.is_cancelled():
+            callback(value)
+
+    def _forget(self, task):
+        """종료된 작업 참조 정리"""
+        self._tasks.discard(task)
+        if task.key is not None and self._latest.get(task.key) is task:
+            del self._latest[task.key]
@@ -3,17 +3,64 @@
 # 파일 위치: views/main_window.py
 
 import os
+import time
+import logging
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTabWidget,
-                             QLabel, QMessageBox, QMenuBar, QMenu, QAction, QStatusBar)
-from PyQt5.QtCore import Qt
+                             QLabel, QMessageBox, QMenuBar, QMenu, QAction, QStatusBar,
+                             QFileDialog, QProgressDialog)
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from config import APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT, APP_VERSION
+from database.db_connection import DBConnection
+from controllers.word_controller import WordController
+from models.learning_buffer import LearningResultBuffer
+from utils.task_runner import TaskRunner
+from views.word_management.word_list_view import WordListView
+
+logger = logging.getLogger(__name__)
+
+
+class LazyTab(QWidget):
+    """
+    처음 활성화될 때 factory로 실제 화면을 만들어 채우는 탭 자리
+
+    화면 모듈 import(matplotlib 등)와 위젯 생성 비용을 시작 시점이 아니라
+    사용자가 그 탭을 처음 열 때 치른다.
+    """
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.widget = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure_built(self):
+        """
+        실제 화면 생성 (이미 만들었으면 그대로 반환)
+
+        Returns:
+            QWidget: 탭 화면
+        """
+        if self.widget is None:
+            started = time.perf_counter()
+            self.widget = self.factory()
+            self.layout().addWidget(self.widget)
+            logger.info(f"탭 화면 생성: {type(self.widget).__name__} "
+                        f"{(time.perf_counter() - started) * 1000:.0f}ms")
+        return self.widget
 
 
 class MainWindow(QMainWindow):
+    first_painted = pyqtSignal()  # 창이 처음 그려졌을 때 (시작 시간 측정용)
+
     def __init__(self):
         super().__init__()
         self.current_theme = 'light'
+        self.task_runner = TaskRunner(parent=self)  # DB/파일 작업은 작업 스레드에서 실행
+        self.word_controller = WordController()
+        self.import_progress = None
+        self._painted = False
         self.init_ui()
         self.load_theme()
 
@@ -45,28 +92,38 @@ class MainWindow(QMainWindow):
         self.create_status_bar()
 
     def add_tabs(self):
-        """탭 추가"""
-        # 단어 관리 탭 (임시 플레이스홀더)
-        word_tab = QWidget()
-        word_layout = QVBoxLayout(word_tab)
-        word_layout.addWidget(QLabel("단어 관리 화면"))
-        self.tabs.addTab(word_tab, "단어 관리")
+        """탭 추가 (각 화면은 탭을 처음 열 때 생성)"""
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+        # 단어 관리 탭
+        self.word_tab = LazyTab(lambda: WordListView(self.word_controller, self.task_runner))
+        self.tabs.addTab(self.word_tab, "단어 관리")
 
         # 플래시카드 탭
-        flashcard_tab = self.create_placeholder_tab("플래시카드 학습 화면")
-        self.tabs.addTab(flashcard_tab, "플래시카드")
+        self.tabs.addTab(LazyTab(lambda: self.create_placeholder_tab("플래시카드 학습 화면")),
+                         "플래시카드")
 
         # 시험 탭
-        exam_tab = self.create_placeholder_tab("시험 화면")
-        self.tabs.addTab(exam_tab, "시험")
+        self.tabs.addTab(LazyTab(lambda: self.create_placeholder_tab("시험 화면")), "시험")
 
-        # 통계 탭
-        stats_tab = self.create_placeholder_tab("학습 통계 화면")
-        self.tabs.addTab(stats_tab, "통계")
+        # 통계 탭 (matplotlib은 이 탭을 처음 열 때 import)
+        self.tabs.addTab(LazyTab(self.create_statistics_tab), "통계")
 
         # 설정 탭
-        settings_tab = self.create_placeholder_tab("설정 화면")
-        self.tabs.addTab(settings_tab, "설정")
+        self.tabs.addTab(LazyTab(lambda: self.create_placeholder_tab("설정 화면")), "설정")
+
+        self.on_tab_changed(self.tabs.currentIndex())
+
+    def on_tab_changed(self, index):
+        """탭 활성화 시 화면 생성"""
+        tab = self.tabs.widget(index)
+        if isinstance(tab, LazyTab):
+            tab.ensure_built()
+
+    def create_statistics_tab(self):
+        """통계 탭 화면 생성"""
+        from views.statistics.statistics_view import StatisticsView
+        return StatisticsView(self.task_runner)
 
     def create_placeholder_tab(self, text):
         """플레이스홀더 탭 생성"""
@@ -92,6 +149,11 @@ class MainWindow(QMainWindow):
         # 파일 메뉴
         file_menu = menubar.addMenu("파일(&F)")
 
+        import_action = QAction("단어 가져오기(CSV)(&I)...", self)
+        import_action.triggered.connect(self.import_csv)
+        file_menu.addAction(import_action)
+        file_menu.addSeparator()
+
         exit_action = QAction("종료(&X)", self)
         exit_action.setShortcut("Alt+F4")
         exit_action.triggered.connect(self.close)
@@ -152,6 +214,79 @@ class MainWindow(QMainWindow):
             f"<p>© 2025 All Rights Reserved</p>"
         )
 
+    def import_csv(self):
+        """CSV 단어 가져오기 (작업 스레드에서 실행, 진행률 표시 및 취소 가능)"""
+        if self.task_runner.is_running('import'):
+            return
+        file_path, _ = QFileDialog.getOpenFileName(self, "단어 가져오기", "", "CSV 파일 (*.csv)")
+        if not file_path:
+            return
+
+        self.import_progress = QProgressDialog("단어를 가져오는 중...", "취소", 0, 0, self)
+        self.import_progress.setWindowTitle("단어 가져오기")
+        self.import_progress.setWindowModality(Qt.WindowModal)
+        self.import_progress.setMinimumDuration(500)
+        self.import_progress.canceled.connect(self.cancel_import)
+
+        self.task_runner.submit(self.word_controller.import_words_from_csv, file_path,
+                                key='import',
+                                on_progress=self.on_import_progress,
+                                on_result=self.on_import_finished,
+                                on_error=self.on_import_failed)
+
+    def on_import_progress(self, done, total):
+        """가져오기 진행률 갱신"""
+        if self.import_progress is None:
+            return
+        if total:
+            self.import_progress.setMaximum(total)
+            self.import_progress.setValue(done)
+        self.update_status(f"단어 가져오는 중... {done}" + (f"/{total}" if total else ""))
+
+    def cancel_import(self):
+        """가져오기 취소 (이미 커밋된 청크는 유지)"""
+        self.task_runner.cancel('import')
+        self._close_import_progress()
+        self.refresh_word_list()
+        self.update_status("단어 가져오기 취소됨")
+
+    def on_import_finished(self, result):
+        """가져오기 완료"""
+        inserted_ids, errors = result
+        self._close_import_progress()
+        self.refresh_word_list()
+        self.update_status(f"단어 가져오기 완료: {len(inserted_ids)}건 추가, {len(errors)}건 실패")
+
+    def on_import_failed(self, error):
+        """가져오기 실패"""
+        self._close_import_progress()
+        QMessageBox.warning(self, "단어 가져오기", f"가져오기 실패: {error}")
+
+    def refresh_word_list(self):
+        """단어 변경 후 단어 목록 갱신 (아직 만들지 않았으면 생략)"""
+        if self.word_tab.widget is not None:
+            self.word_tab.widget.refresh()
+
+    def _close_import_progress(self):
+        """진행률 창 닫기 (닫힐 때 발생하는 canceled 시그널은 무시)"""
+        if self.import_progress is not None:
+            self.import_progress.canceled.disconnect(self.cancel_import)
+            self.import_progress.close()
+            self.import_progress = None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self.first_painted.emit()
+
     def update_status(self, message):
         """상태바 메시지 업데이트"""
-        self.statusBar.showMessage(message)
\ No newline at end of file
+        self.statusBar.showMessage(message)
+
+    def closeEvent(self, event):
+        """종료 시 백그라운드 작업을 정리하고 버퍼에 남은 학습 기록을 반영한 뒤 DB 연결 종료"""
+        self.task_runner.shutdown()
+        LearningResultBuffer.get_instance().close()
+        DBConnection.get_instance().close()
+        super().closeEvent(event)
\ No newline at end of file
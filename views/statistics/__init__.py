@@ -0,0 +1,2 @@
+# 2026-10-18 - Smart Vocab Builder - Statistics Module
+# 파일 위치: views/statistics/__init__.py
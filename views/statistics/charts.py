@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 통계 차트 위젯 (matplotlib 연동)
+# 파일 위치: views/statistics/charts.py
+
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+
+
+class ChartCanvas(FigureCanvasQTAgg):
+    """
+    matplotlib Figure를 담는 Qt 위젯 (축 하나)
+
+    StatisticsController가 만든 NumPy 배열을 변환 없이 그대로 그린다.
+    """
+
+    def __init__(self, parent=None, width=5, height=3, dpi=100):
+        self.figure = Figure(figsize=(width, height), dpi=dpi, tight_layout=True)
+        self.axes = self.figure.add_subplot(111)
+        super().__init__(self.figure)
+        self.setParent(parent)
+
+    def _redraw(self, title):
+        """공통 마무리 (제목 설정 후 다시 그리기)"""
+        self.axes.set_title(title)
+        self.draw_idle()
+
+
+class DailyTrendChart(ChartCanvas):
+    """일별 응답 수 막대 + 이동 평균 선"""
+
+    def update_chart(self, trend):
+        """
+        Args:
+            trend (dict): StatisticsController.get_daily_trend() 결과
+        """
+        self.axes.clear()
+        x = range(len(trend['dates']))
+        self.axes.bar(x, trend['answers'], color='#90caf9', label='응답 수')
+        self.axes.plot(x, trend['moving_average'], color='#1565c0', label='이동 평균')
+        step = max(1, len(trend['dates']) // 7)
+        self.axes.set_xticks(list(x)[::step])
+        self.axes.set_xticklabels([d[5:] for d in trend['dates'][::step]])
+        self.axes.legend(loc='upper left')
+        self._redraw('일별 학습량')
+
+
+class TopErrorWordsChart(ChartCanvas):
+    """오답률 상위 단어 가로 막대"""
+
+    def update_chart(self, top_words):
+        """
+        Args:
+            top_words (dict): StatisticsController.get_top_error_words() 결과
+        """
+        self.axes.clear()
+        # 위에서부터 오답률 높은 순으로 보이도록 뒤집어서 그림
+        self.axes.barh(top_words['english'][::-1], top_words['error_rate'][::-1] * 100,
+                       color='#ef9a9a')
+        self.axes.set_xlim(0, 100)
+        self.axes.set_xlabel('오답률 (%)')
+        self._redraw('오답률 높은 단어')
+
+
+class RetentionChart(ChartCanvas):
+    """복습 간격별 정답률 (망각 곡선)"""
+
+    def update_chart(self, retention):
+        """
+        Args:
+            retention (dict): StatisticsController.get_retention_curve() 결과
+        """
+        self.axes.clear()
+        self.axes.plot(retention['gap_days'], retention['retention'] * 100,
+                       marker='o', color='#2e7d32')
+        self.axes.set_ylim(0, 100)
+        self.axes.set_xlabel('직전 학습 후 경과 일수')
+        self.axes.set_ylabel('정답률 (%)')
+        self._redraw('기억 유지율')
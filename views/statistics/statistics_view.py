@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 통계 탭 화면
+# 파일 위치: views/statistics/statistics_view.py
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton
+from controllers.statistics_controller import StatisticsController
+from views.statistics.charts import DailyTrendChart, TopErrorWordsChart, RetentionChart
+
+
+class StatisticsView(QWidget):
+    """
+    통계 탭: 연속 학습일 + 일별 학습량/오답률 상위 단어/망각 곡선 차트
+
+    matplotlib을 불러오므로 MainWindow는 통계 탭을 처음 열 때 이 모듈을 import한다.
+    대시보드 계산(NumPy)은 작업 스레드에서 실행하고, 탭이 보일 때마다 다시 계산한다.
+    """
+
+    TASK_KEY = 'dashboard'
+
+    def __init__(self, task_runner, parent=None):
+        super().__init__(parent)
+        self.task_runner = task_runner
+        self.controller = StatisticsController()
+        self.init_ui()
+
+    def init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout(self)
+
+        header_layout = QHBoxLayout()
+        self.streak_label = QLabel()
+        header_layout.addWidget(self.streak_label)
+        header_layout.addStretch()
+        refresh_button = QPushButton("새로고침")
+        refresh_button.clicked.connect(self.refresh)
+        header_layout.addWidget(refresh_button)
+        layout.addLayout(header_layout)
+
+        grid = QGridLayout()
+        self.trend_chart = DailyTrendChart(self)
+        self.top_error_chart = TopErrorWordsChart(self)
+        self.retention_chart = RetentionChart(self)
+        grid.addWidget(self.trend_chart, 0, 0, 1, 2)
+        grid.addWidget(self.top_error_chart, 1, 0)
+        grid.addWidget(self.retention_chart, 1, 1)
+        layout.addLayout(grid)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self):
+        """대시보드 다시 계산 (진행 중인 계산은 취소)"""
+        self.task_runner.submit(self.controller.get_dashboard, key=self.TASK_KEY,
+                                on_result=self.show_dashboard,
+                                on_error=lambda error: self.streak_label.setText("통계 계산 실패"))
+
+    def show_dashboard(self, dashboard):
+        """
+        계산 결과 표시
+
+        Args:
+            dashboard (dict): StatisticsController.get_dashboard() 결과
+        """
+        trend = dashboard['trend']
+        self.streak_label.setText(f"연속 학습 {trend['current_streak']}일 "
+                                  f"(최장 {trend['longest_streak']}일)")
+        self.trend_chart.update_chart(trend)
+        self.top_error_chart.update_chart(dashboard['top_error_words'])
+        self.retention_chart.update_chart(dashboard['retention'])
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 단어 목록 화면
+# 파일 위치: views/word_management/word_list_view.py
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QCheckBox,
+                             QLabel, QTableView, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt
+from views.word_management.word_search import WordSearchService
+from views.word_management.word_table_model import WordTableModel
+
+ROW_HEIGHT = 28  # 고정 행 높이 (행별 크기 계산 없이 스크롤)
+
+
+class WordListView(QWidget):
+    """
+    단어 관리 탭: 입력 중 검색/즐겨찾기 필터 + 지연 로딩 단어 테이블
+
+    행 높이와 컬럼 폭을 내용으로 계산하지 않으므로 뷰는 화면에 보이는 행만 그린다.
+    검색은 WordSearchService가 작업 스레드에서 실행하고 결과를 배치로 넘겨준다.
+    """
+
+    def __init__(self, controller, task_runner, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.task_runner = task_runner
+        self.search_service = WordSearchService(task_runner, parent=self)
+        self.init_ui()
+
+    def init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout(self)
+
+        # 검색 바
+        search_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("영어/한국어/초성 검색")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.search_service.set_keyword)
+        self.search_edit.returnPressed.connect(self.search_service.search_now)
+        search_layout.addWidget(self.search_edit)
+
+        self.favorite_check = QCheckBox("즐겨찾기만")
+        self.favorite_check.toggled.connect(self.apply_filter)
+        search_layout.addWidget(self.favorite_check)
+
+        self.result_label = QLabel()
+        search_layout.addWidget(self.result_label)
+        layout.addLayout(search_layout)
+
+        # 단어 테이블
+        self.model = WordTableModel(self.controller, self.task_runner, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
+
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(ROW_HEIGHT)
+        vertical_header.hide()
+
+        horizontal_header = self.table.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal_header.setSectionResizeMode(1, QHeaderView.Stretch)
+        # 정렬 불가 컬럼 클릭/검색 해제 시 헤더 표시를 실제 정렬로 맞춤
+        self.model.sort_indicator_changed.connect(horizontal_header.setSortIndicator)
+        self.model.page_failed.connect(lambda error: self.result_label.setText("목록 조회 실패"))
+        layout.addWidget(self.table)
+
+        # 검색 결과 배치 -> 테이블
+        self.search_service.search_started.connect(
+            lambda keyword: self.model.begin_search(self.favorite_check.isChecked()))
+        self.search_service.results_ready.connect(self.model.append_search_results)
+        self.search_service.search_finished.connect(
+            lambda keyword, total: self.result_label.setText(f"검색 결과 {self.model.rowCount()}개"))
+        self.search_service.search_cleared.connect(self.on_search_cleared)
+        self.search_service.search_failed.connect(
+            lambda message: self.result_label.setText("검색 실패"))
+
+    def apply_filter(self):
+        """즐겨찾기 조건 적용 (검색 중이면 같은 키워드로 다시 검색)"""
+        if self.search_edit.text().strip():
+            self.search_service.search_now()
+        else:
+            self.model.set_filter('', self.favorite_check.isChecked())
+
+    def on_search_cleared(self):
+        """검색어를 지우면 전체 목록 페이지 조회로 복귀"""
+        self.result_label.clear()
+        self.model.end_search(self.favorite_check.isChecked())
+
+    def refresh(self):
+        """단어 추가/수정/삭제 후 목록 다시 조회"""
+        if self.search_edit.text().strip():
+            self.search_service.reset()
+        else:
+            self.model.reload()
+
+    def selected_word_id(self):
+        """
+        선택된 단어 ID
+
+        Returns:
+            int: 단어 ID (선택 없으면 None)
+        """
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.model.data(rows[0], Qt.UserRole)
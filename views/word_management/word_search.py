@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 입력 중 검색 (디바운스 + 취소 + 배치 전달)
+# 파일 위치: views/word_management/word_search.py
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from config import SEARCH_DEBOUNCE_MS, SEARCH_BATCH_SIZE
+from controllers.search_controller import SearchController
+
+
+class WordSearchService(QObject):
+    """
+    검색창 입력을 받아 SearchController 검색을 작업 스레드에서 실행하는 서비스
+
+    - 디바운스: 마지막 입력 후 delay_ms 동안 입력이 없을 때만 검색
+    - 취소: 키워드가 바뀌면 진행 중인 검색과 전달 중인 결과를 즉시 버림 (TaskRunner key='search')
+    - 배치 전달: 관련도 순 결과를 batch_size개씩 이벤트 루프 차례마다 results_ready로 보냄
+    """
+    search_started = pyqtSignal(str)        # 키워드 (결과 전달 시작 직전)
+    results_ready = pyqtSignal(list)        # 결과 배치 (관련도 순)
+    search_finished = pyqtSignal(str, int)  # 키워드, 전체 결과 수
+    search_cleared = pyqtSignal()           # 키워드가 비어 검색 해제
+    search_failed = pyqtSignal(str)         # 오류 메시지
+
+    TASK_KEY = 'search'
+
+    def __init__(self, task_runner, controller=None, delay_ms=SEARCH_DEBOUNCE_MS,
+                 batch_size=SEARCH_BATCH_SIZE, parent=None):
+        super().__init__(parent)
+        self.task_runner = task_runner
+        self.controller = controller or SearchController()
+        self.batch_size = batch_size
+        self.search_type = 'all'
+        self._keyword = ''
+        self._stream_id = 0  # 증가시키면 전달 중인 이전 결과 배치가 중단됨
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.search_now)
+
+    def set_keyword(self, keyword):
+        """
+        검색어 입력 (textChanged에 연결)
+
+        Args:
+            keyword (str): 현재 입력값
+        """
+        keyword = (keyword or '').strip()
+        if keyword == self._keyword:
+            return
+        self._keyword = keyword
+        self._cancel()
+        if keyword:
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.search_cleared.emit()
+
+    def set_search_type(self, search_type):
+        """검색 대상 변경 ('english', 'korean', 'all') 후 즉시 다시 검색"""
+        self.search_type = search_type
+        self.search_now()
+
+    def search_now(self):
+        """디바운스 없이 현재 키워드로 검색"""
+        self._timer.stop()
+        self._cancel()
+        if not self._keyword:
+            return
+        keyword = self._keyword
+        self.task_runner.submit(
+            self.controller.search, keyword, self.search_type, key=self.TASK_KEY,
+            on_result=lambda results: self._start_stream(keyword, results),
+            on_error=lambda error: self.search_failed.emit(str(error)))
+
+    def reset(self):
+        """단어 변경 후 호출 (재사용 결과를 버리고 현재 키워드로 다시 검색)"""
+        self.controller.reset()
+        self.search_now()
+
+    def _cancel(self):
+        """진행 중인 검색 취소 및 결과 전달 중단"""
+        self.task_runner.cancel(self.TASK_KEY)
+        self._stream_id += 1
+
+    def _start_stream(self, keyword, results):
+        """검색 결과를 배치로 나누어 전달 시작"""
+        self._stream_id += 1
+        self.search_started.emit(keyword)
+        self._emit_batch(self._stream_id, keyword, results, 0)
+
+    def _emit_batch(self, stream_id, keyword, results, start):
+        """배치 하나 전달 후 나머지는 다음 이벤트 루프 차례로 미룸 (입력/그리기가 끼어들 수 있음)"""
+        if stream_id != self._stream_id:
+            return
+        end = start + self.batch_size
+        if results[start:end]:
+            self.results_ready.emit(results[start:end])
+        if end < len(results):
+            QTimer.singleShot(0, lambda: self._emit_batch(stream_id, keyword, results, end))
+        else:
+            self.search_finished.emit(keyword, len(results))
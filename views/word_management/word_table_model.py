@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# 2026-10-18 - Smart Vocab Builder - 단어 목록 테이블 모델 (지연 로딩)
+# 파일 위치: views/word_management/word_table_model.py
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from config import WORD_PAGE_SIZE
+from models.word_model import WordModel
+
+
+class WordTableModel(QAbstractTableModel):
+    """
+    단어 목록용 QAbstractTableModel
+
+    QTableView가 스크롤 끝에 닿을 때마다 canFetchMore/fetchMore로
+    WordController에서 키셋 페이지를 하나씩 가져온다. 페이지 조회는 TaskRunner 작업
+    스레드에서 실행하고 결과가 오면 행을 붙이며, 조회 중에는 다음 페이지를 요청하지 않는다.
+    정렬과 필터는 SQL에서 처리하고, 조건이 바뀌면 진행 중인 조회를 취소하고 처음부터 다시 불러온다.
+    따라서 탭을 여는 비용은 단어 수와 관계없이 한 페이지 조회이고,
+    메모리는 사용자가 스크롤한 만큼의 행(Word 레코드)만 차지한다.
+
+    입력 중 검색(WordSearchService) 동안에는 페이지 조회를 멈추고
+    관련도 순 검색 결과 배치를 append_search_results()로 받아 뒤에 붙인다.
+    """
+
+    sort_indicator_changed = pyqtSignal(int, object)  # 실제 적용된 정렬 (컬럼 번호, Qt.SortOrder)
+    page_failed = pyqtSignal(object)  # 페이지 조회 예외
+
+    TASK_KEY = 'word_page'
+
+    # (컬럼, 헤더)
+    COLUMNS = (
+        ('english', '영어'),
+        ('korean', '한국어'),
+        ('is_favorite', '★'),
+        ('correct_count', '정답'),
+        ('wrong_count', '오답'),
+        ('error_rate', '오답률'),
+        ('last_learned_at', '최근 학습'),
+    )
+
+    def __init__(self, controller, task_runner, page_size=WORD_PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.task_runner = task_runner
+        self.page_size = page_size
+        self._rows = []
+        self._has_more = True
+        self._fetching = False
+        self._sort_column = 'english'
+        self._descending = False
+        self._keyword = ''
+        self._favorites_only = False
+        self._searching = False
+
+    # ---------- QAbstractTableModel ----------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        word = self._rows[index.row()]
+        column = self.COLUMNS[index.column()][0]
+
+        if role == Qt.DisplayRole:
+            value = word[column]
+            if column == 'is_favorite':
+                return '★' if value else ''
+            if column == 'error_rate':
+                return f"{value * 100:.0f}%" if word['correct_count'] + word['wrong_count'] else '-'
+            if column == 'last_learned_at':
+                return value[:16].replace('T', ' ') if value else ''
+            return value
+        if role == Qt.TextAlignmentRole and column not in ('english', 'korean'):
+            return Qt.AlignCenter
+        if role == Qt.UserRole:
+            return word['word_id']
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more or self._fetching:
+            return
+
+        self._fetching = True
+        after = WordModel.page_cursor(self._rows[-1], self._sort_column) if self._rows else None
+        self.task_runner.submit(
+            self.controller.get_word_page, key=self.TASK_KEY,
+            on_result=self._append_page, on_error=self._page_error,
+            after=after, limit=self.page_size, sort_column=self._sort_column,
+            descending=self._descending, keyword=self._keyword,
+            favorites_only=self._favorites_only)
+
+    def _append_page(self, page):
+        """조회된 페이지를 뒤에 붙이기 (메인 스레드)"""
+        self._fetching = False
+        self._has_more = len(page) == self.page_size
+        if not page:
+            return
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def _page_error(self, error):
+        """페이지 조회 실패 (같은 조회를 반복하지 않도록 다음 reload()까지 멈춤)"""
+        self._fetching = False
+        self._has_more = False
+        self.page_failed.emit(error)
+
+    def _cancel_fetch(self):
+        """진행 중인 페이지 조회 취소 (결과는 전달되지 않음)"""
+        self.task_runner.cancel(self.TASK_KEY)
+        self._fetching = False
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        헤더 클릭 정렬
+
+        페이지 조회 중에는 SQL 정렬로 처음부터 다시 조회하고, 정렬 불가 컬럼이면
+        헤더 표시를 현재 정렬로 되돌린다(sort_indicator_changed).
+        검색 결과 표시 중에는 불러온 결과를 메모리에서 정렬한다.
+        """
+        name = self.COLUMNS[column][0]
+        if self._searching:
+            self.layoutAboutToBeChanged.emit()
+            self._rows.sort(key=lambda word: (word[name] is None, word[name] or 0),
+                            reverse=order == Qt.DescendingOrder)
+            self.layoutChanged.emit()
+            return
+        descending = order == Qt.DescendingOrder
+        if name not in WordModel.SORTABLE_COLUMNS:
+            self._emit_sort_indicator()
+            return
+        if name == self._sort_column and descending == self._descending:
+            return
+        self._sort_column = name
+        self._descending = descending
+        self.reload()
+
+    def _emit_sort_indicator(self):
+        """현재 SQL 정렬을 헤더에 알림"""
+        section = next(index for index, (name, _) in enumerate(self.COLUMNS)
+                       if name == self._sort_column)
+        self.sort_indicator_changed.emit(
+            section, Qt.DescendingOrder if self._descending else Qt.AscendingOrder)
+
+    # ---------- 조회 조건 ----------
+
+    def set_filter(self, keyword='', favorites_only=False):
+        """
+        필터 변경 (SQL 조건으로 처음부터 다시 조회)
+
+        Args:
+            keyword (str): 영어/한국어 부분 문자열 또는 초성
+            favorites_only (bool): 즐겨찾기만
+        """
+        keyword = (keyword or '').strip()
+        if keyword == self._keyword and favorites_only == self._favorites_only:
+            return
+        self._keyword = keyword
+        self._favorites_only = favorites_only
+        self.reload()
+
+    def reload(self):
+        """불러온 행을 버리고 첫 페이지부터 다시 조회 (단어 추가/수정/삭제 후 호출)"""
+        self._cancel_fetch()
+        self.beginResetModel()
+        self._rows = []
+        self._has_more = True
+        self.endResetModel()
+        self.fetchMore()
+
+    # ---------- 입력 중 검색 결과 ----------
+
+    @property
+    def searching(self):
+        """검색 결과 표시 중 여부"""
+        return self._searching
+
+    def begin_search(self, favorites_only=False):
+        """
+        검색 결과 표시 시작 (페이지 조회를 멈추고 빈 목록에서 시작)
+
+        Args:
+            favorites_only (bool): 즐겨찾기만 표시
+        """
+        self._cancel_fetch()
+        self.beginResetModel()
+        self._rows = []
+        self._has_more = False
+        self._searching = True
+        self._favorites_only = favorites_only
+        self.endResetModel()
+
+    def append_search_results(self, words):
+        """
+        검색 결과 배치 추가 (WordSearchService.results_ready에 연결)
+
+        Args:
+            words (list): 관련도 순 단어 레코드
+        """
+        if self._favorites_only:
+            words = [word for word in words if word['is_favorite']]
+        if not words:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(words) - 1)
+        self._rows.extend(words)
+        self.endInsertRows()
+
+    def end_search(self, favorites_only=False):
+        """
+        검색 해제 (페이지 조회 재개)
+
+        Args:
+            favorites_only (bool): 즐겨찾기만
+        """
+        self._searching = False
+        self._keyword = ''
+        self._favorites_only = favorites_only
+        self._emit_sort_indicator()  # 검색 중 메모리 정렬한 컬럼 대신 SQL 정렬 표시
+        self.reload()
+
+    def word_at(self, row):
+        """행 번호의 단어 레코드"""
+        return self._rows[row]